@@ -0,0 +1,71 @@
+"""Runs the benchmark suite without asv and reports normalized timings.
+
+    python -m benchmarks [--rows N ...] [--cols N ...] [--filter TEXT]
+                         [--repeat N] [--csv PATH]
+"""
+import argparse
+import csv
+import inspect
+import sys
+import timeit
+
+from . import bench_suite
+from .common import COLUMNS, ROWS
+
+
+def _benchmarks(name_filter):
+    for class_name, cls in inspect.getmembers(bench_suite, inspect.isclass):
+        if class_name.startswith("_") or cls.__module__ != bench_suite.__name__:
+            continue
+        for method_name in sorted(vars(cls)):
+            full_name = f"{class_name}.{method_name}"
+            if method_name.startswith("time_") and name_filter in full_name:
+                yield cls, method_name, full_name
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=ROWS)
+    parser.add_argument("--cols", type=int, nargs="+", default=COLUMNS)
+    parser.add_argument("--filter", default="", help="only run matching benchmarks")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--csv", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    header = ["benchmark", "rows", "cols", "seconds", "us_per_row", "us_per_col"]
+    results = []
+    print(f"{header[0]:<62}{header[1]:>9}{header[2]:>7}"
+          f"{'time (ms)':>12}{'us/row':>12}{'us/col':>14}")
+    for rows in args.rows:
+        for cols in args.cols:
+            instances = {}
+            for cls, method_name, full_name in _benchmarks(args.filter):
+                if cls not in instances:
+                    instance = cls()
+                    try:
+                        instance.setup(rows, cols)
+                    except NotImplementedError:
+                        instance = None
+                    instances[cls] = instance
+                instance = instances[cls]
+                if instance is None:
+                    continue
+                method = getattr(instance, method_name)
+                seconds = min(timeit.repeat(lambda: method(rows, cols),
+                                            number=1, repeat=args.repeat))
+                row = [full_name, rows, cols, seconds,
+                       seconds / rows * 1e6, seconds / cols * 1e6]
+                results.append(row)
+                print(f"{full_name:<62}{rows:>9}{cols:>7}{seconds * 1e3:>12.2f}"
+                      f"{row[4]:>12.3f}{row[5]:>14.1f}")
+                sys.stdout.flush()
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf8") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(results)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,54 @@
+"""Construction cost of the Cumulative Wealth Index.
+
+Compares the explicit construction path against the former caller
+detection, which ran ``inspect.stack()`` on every construction and got
+slower the deeper the call stack was (Dash callbacks, thread pools ...).
+
+Run with asv (``asv run``) or directly::
+
+    python -m benchmarks.bench_cwi
+"""
+import inspect
+import timeit
+
+from pyinvestingsnippets import CumulativeWealthIndex
+
+from .common import gbm
+
+
+def _nested(depth, func, *args):
+    if depth <= 0:
+        return func(*args)
+    return _nested(depth - 1, func, *args)
+
+
+def _legacy_construct(returns):
+    # the removed caller detection: walk the whole stack, then build
+    inspect.stack()
+    return CumulativeWealthIndex.from_returns(returns)
+
+
+class CwiConstruction:
+    params = ([1_000, 100_000], [0, 50])
+    param_names = ["rows", "stack_depth"]
+
+    def setup(self, rows, stack_depth):
+        self.returns = gbm(rows).returns.data
+
+    def time_explicit(self, rows, stack_depth):
+        _nested(stack_depth, CumulativeWealthIndex.from_returns, self.returns)
+
+    def time_inspect_stack(self, rows, stack_depth):
+        _nested(stack_depth, _legacy_construct, self.returns)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    bench = CwiConstruction()
+    for rows in CwiConstruction.params[0]:
+        for depth in CwiConstruction.params[1]:
+            bench.setup(rows, depth)
+            for name in ("time_explicit", "time_inspect_stack"):
+                func = getattr(bench, name)
+                best = min(timeit.repeat(lambda: func(rows, depth), number=20, repeat=3))
+                print(f"rows={rows:<8} depth={depth:<4} {name:<20}"
+                      f" {best / 20 * 1000:8.3f} ms")
@@ -0,0 +1,54 @@
+"""Import time of the package.
+
+The plotting (matplotlib, seaborn, plotly) and regression (scikit-learn)
+backends are only imported on first use, so a bare
+``import pyinvestingsnippets`` costs little more than importing pandas.
+
+Run with asv (``asv run``) or directly::
+
+    python -m benchmarks.bench_import
+"""
+import subprocess
+import sys
+
+EAGER_BACKENDS = (
+    "import matplotlib.pyplot, matplotlib.ticker, seaborn, plotly.express\n"
+    "import sklearn.linear_model\n"
+)
+
+
+class ImportTime:
+    """Cold interpreter import timings (``timeraw_`` runs in a fresh process)"""
+
+    def timeraw_import_pandas(self):
+        return "import pandas"
+
+    def timeraw_import_pyinvestingsnippets(self):
+        return "import pyinvestingsnippets"
+
+    def timeraw_import_pyinvestingsnippets_with_backends(self):
+        # what every worker paid before the backends were loaded lazily
+        return "import pyinvestingsnippets\n" + EAGER_BACKENDS
+
+
+def _best_of(code, repeat=5):
+    timer = (
+        "import time; _t = time.perf_counter()\n"
+        + code
+        + "\nprint(time.perf_counter() - _t)"
+    )
+    timings = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", timer], check=True, capture_output=True, text=True
+        )
+        timings.append(float(out.stdout.strip().splitlines()[-1]))
+    return min(timings)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    bench = ImportTime()
+    for name in sorted(dir(bench)):
+        if name.startswith("timeraw_"):
+            seconds = _best_of(getattr(bench, name)())
+            print(f"{name[len('timeraw_'):]:<45} {seconds * 1000:8.1f} ms")
@@ -0,0 +1,164 @@
+"""Benchmarks of every extension and utility over a grid of sizes.
+
+The inputs are seeded GBM prices of ``rows`` observations and ``cols``
+assets (see :mod:`benchmarks.common`). Utilities that only accept a
+Series are run once per column, which is what a caller has to do today.
+
+Run with asv (``asv run``) or with the bundled runner, which reports the
+time per row and per column as well::
+
+    python -m benchmarks --rows 1000 10000 --cols 1 100
+"""
+import pandas as pd
+
+import pyinvestingsnippets as pyinv
+from pyinvestingsnippets.utilities.rolling_realized_volatility import (
+    RollingRealizedVolatility,
+)
+
+from .common import COLUMNS, ROWS, gbm, skip_if_too_large
+
+WINDOW = 252
+
+
+def _columns(obj):
+    """Iterates over the columns of a DataFrame, or yields the Series"""
+    if hasattr(obj, "columns"):
+        for name in obj.columns:
+            yield obj[name]
+    else:
+        yield obj
+
+
+class _Grid:
+    params = (ROWS, COLUMNS)
+    param_names = ["rows", "cols"]
+
+    def setup(self, rows, cols):
+        skip_if_too_large(rows, cols)
+        self.prices = gbm(rows, cols)
+        self.returns = self.prices.returns.data
+        self.log_returns = self.prices.log_returns.data
+        self.cwi = self.prices.returns.cwi.data
+        self.drawdown = self.cwi.drawdown.data
+
+
+class Extensions(_Grid):
+    # the extensions are built explicitly: pandas caches ``obj.returns``
+
+    def time_returns(self, rows, cols):
+        pyinv.Returns(self.prices).data
+
+    def time_log_returns(self, rows, cols):
+        pyinv.LogReturns(self.prices).data
+
+    def time_returns_metrics(self, rows, cols):
+        rets = pyinv.Returns(self.prices)
+        rets.total
+        rets.annualized(252)
+        rets.volatility_annualized(252)
+        rets.sharpe(0.02)
+        rets.var()
+        rets.cvar()
+
+    def time_returns_summary(self, rows, cols):
+        pyinv.Returns(self.prices).summary()
+
+    def time_cwi(self, rows, cols):
+        pyinv.CumulativeWealthIndex.from_returns(self.returns)
+
+    def time_cwi_from_log_returns(self, rows, cols):
+        pyinv.CumulativeWealthIndex.from_log_returns(self.log_returns)
+
+    def time_cwi_period_returns(self, rows, cols):
+        cwi = pyinv.CumulativeWealthIndex.from_returns(self.returns)
+        cwi.monthly_returns
+        cwi.weekly_returns
+        cwi.annual_returns
+
+    def time_drawdown(self, rows, cols):
+        pyinv.Drawdown(self.cwi).max_drawdown
+
+    def time_drawdown_durations(self, rows, cols):
+        pyinv.DrawdownDurations(self.drawdown).episodes
+
+    def time_srri(self, rows, cols):
+        pyinv.SRRI(self.returns.iloc[-260:]).risk_class
+
+
+class RollingUtilities(_Grid):
+    def time_rolling_returns(self, rows, cols):
+        pyinv.RollingReturns(self.returns, rolling_window=WINDOW)
+
+    def time_rolling_volatility(self, rows, cols):
+        pyinv.RollingVolatility(self.returns, rolling_window=WINDOW)
+
+    def time_rolling_srri(self, rows, cols):
+        pyinv.RollingSRRI(self.prices, frequency="W")
+
+    def time_srri_migration(self, rows, cols):
+        pyinv.SRRIMigration(pyinv.RollingSRRI(self.prices, frequency="W").data).changes
+
+    def time_rolling_sharpe(self, rows, cols):
+        pyinv.RollingSharpe(self.returns, rolling_window=WINDOW)
+
+    def time_rolling_sortino(self, rows, cols):
+        pyinv.RollingSortino(self.returns, rolling_window=WINDOW)
+
+    def time_rolling_var(self, rows, cols):
+        rolling_var = pyinv.RollingVaR(self.returns, rolling_window=WINDOW)
+        rolling_var.cvar
+
+    def time_rolling_max_drawdown(self, rows, cols):
+        pyinv.RollingMaxDrawdown(self.cwi, rolling_window=WINDOW)
+
+    def time_rolling_realized_volatility(self, rows, cols):
+        RollingRealizedVolatility(self.log_returns, rolling_window=WINDOW)
+
+    def time_exponentially_weighted_downside_risk(self, rows, cols):
+        pyinv.ExponantiallyWeightedDownsideRisk(self.returns)
+
+    def time_rolling_beta_regression(self, rows, cols):
+        market = self.returns.iloc[:, 0] if cols > 1 else self.returns
+        pyinv.RollingBetaRegression(market, self.returns, WINDOW)
+
+    def time_rolling_beta_covariance(self, rows, cols):
+        market = self.returns.iloc[:, 0] if cols > 1 else self.returns
+        for column in _columns(self.returns):
+            pyinv.RollingBetaCovariance(market, column, WINDOW)
+
+
+class Betas(_Grid):
+    def time_beta_covariance(self, rows, cols):
+        market = self.returns.iloc[:, 0] if cols > 1 else self.returns
+        for column in _columns(self.returns):
+            pyinv.BetaCovariance(market, column).beta
+
+    def time_beta_regression(self, rows, cols):
+        market = self.returns.iloc[:, 0] if cols > 1 else self.returns
+        for column in _columns(self.returns):
+            pyinv.BetaRegression(market, column).beta
+
+    def time_batch_beta(self, rows, cols):
+        market = self.returns.iloc[:, 0] if cols > 1 else self.returns
+        pyinv.BatchBeta(market, self.returns).beta
+
+
+class Covariances(_Grid):
+    def setup(self, rows, cols):
+        # the matrices hold cols x cols values
+        skip_if_too_large(cols, cols)
+        super().setup(rows, cols)
+        self.returns = pd.DataFrame(self.returns)
+
+    def time_covariance(self, rows, cols):
+        pyinv.Covariance(self.returns).correlation
+
+    def time_covariance_ledoit_wolf(self, rows, cols):
+        pyinv.Covariance(self.returns, shrinkage="ledoit-wolf")
+
+    def time_rolling_covariance(self, rows, cols):
+        pyinv.RollingCovariance(self.returns, WINDOW).latest
+
+    def time_ewm_covariance(self, rows, cols):
+        pyinv.EWMCovariance(self.returns).latest
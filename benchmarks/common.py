@@ -0,0 +1,37 @@
+"""Shared, seeded input data and parameter grid for the benchmarks"""
+import os
+
+import numpy as np
+import pandas as pd
+
+SEED = 42
+
+ROWS = [1_000, 10_000, 100_000, 1_000_000]
+COLUMNS = [1, 100, 1_000, 10_000]
+# grid points above this many cells are skipped (8 bytes each, several
+# intermediates per benchmark); raise it on machines with more memory
+MAX_CELLS = int(os.environ.get("PYINV_BENCH_MAX_CELLS", 20_000_000))
+
+
+def skip_if_too_large(rows, cols):
+    """asv skips a parameter combination when setup raises NotImplementedError"""
+    if rows * cols > MAX_CELLS:
+        raise NotImplementedError(f"{rows} x {cols} is above {MAX_CELLS} cells")
+
+
+def gbm(n_rows, n_cols=1, mu=0.07, sigma=0.15, steps_per_year=252, s_0=100.0):
+    """Reproducible Geometric Brownian Motion prices (see ``examples/utils.gbm``)
+
+    Returns a Series when ``n_cols == 1`` and a DataFrame otherwise.
+    """
+    rng = np.random.default_rng(SEED)
+    dt = 1 / steps_per_year
+    rets_plus_1 = rng.normal(
+        loc=(1 + mu) ** dt, scale=(sigma * np.sqrt(dt)), size=(n_rows, n_cols)
+    )
+    rets_plus_1[0] = 1
+    # business days stop fitting into datetime64[ns] after ~150k rows
+    freq = "B" if n_rows <= 50_000 else "H"
+    index = pd.date_range(start="1990-01-01", periods=n_rows, freq=freq)
+    prices = pd.DataFrame(s_0 * rets_plus_1.cumprod(axis=0), index=index)
+    return prices.iloc[:, 0] if n_cols == 1 else prices
@@ -275,14 +275,10 @@ def update_graph_risk_reward(data):
 
     prices = pd.read_json(data["prices"], orient='split')
 
-    all_values = pd.DataFrame()
-    for asset_name in prices.columns:
-        ann_vol = prices[asset_name].returns.volatility_annualized(252)
-        ann_ret = prices[asset_name].returns.annualized(ppy=252)
-        all_values = pd.concat([all_values, pd.DataFrame({
-            'Name': asset_name, 'Risk': ann_vol, 'Return': ann_ret,
-        },
-            index=[asset_name])], axis=0)
+    summary = prices.returns.summary(ppy=252)
+    all_values = pd.DataFrame({
+        'Name': summary.index, 'Risk': summary['volatility'], 'Return': summary['cagr'],
+    }, index=summary.index)
 
     try:
         fig = px.scatter(all_values, x='Risk', y='Return', hover_data=['Name'], color="Name")
@@ -320,20 +316,22 @@ def update_graph_stats(data):
                   'vals': ['Total Ret', 'Expected Ret (daily)', 'CAGR', 'Volatility', 'Max DrawDown',
                            'Min DrawDown Duration (days)', 'Max DrawDown Duration (days)', 'Beta', 'Tracking Error',
                            'Sharpe Ratio', 'M2 Ratio', 'Information Ratio', 'SRRI']}]
+    summary = prices.returns.summary(ppy=252, rf=data['risk_free_rate'])
     for asset_name in prices.columns:
         monthly_returns = prices[asset_name].fillna(method="pad").resample("M").last().pct_change()
+        stats = summary.loc[asset_name]
         asset_values = []
-        asset_values.append(f"{prices[asset_name].returns.total * 100:.2f}%")
-        asset_values.append(f"{prices[asset_name].returns.average * 100:.2f}%")
-        asset_values.append(f"{prices[asset_name].returns.annualized(252) * 100:.2f}%")
-        asset_values.append(f"{prices[asset_name].returns.volatility_annualized(252) * 100:.2f}%")
-        asset_values.append(f"{prices[asset_name].returns.cwi.drawdown.max_drawdown * 100:.2f}%")
+        asset_values.append(f"{stats['total_return'] * 100:.2f}%")
+        asset_values.append(f"{stats['average'] * 100:.2f}%")
+        asset_values.append(f"{stats['cagr'] * 100:.2f}%")
+        asset_values.append(f"{stats['volatility'] * 100:.2f}%")
+        asset_values.append(f"{stats['max_drawdown'] * 100:.2f}%")
         asset_values.append(f"{prices[asset_name].returns.cwi.drawdown.durations.mean.days}")
         asset_values.append(f"{prices[asset_name].returns.cwi.drawdown.durations.max.days}")
         asset_values.append(
             f"{pyinvestingsnippets.BetaCovariance(prices.iloc[:, -1].returns.data, prices[asset_name].returns.data).beta:.2}")
         asset_values.append(f"{tracking_error(prices[asset_name].returns.data, prices.iloc[:, -1].returns.data):.4f}")
-        asset_values.append(f"{prices[asset_name].returns.sharpe(data['risk_free_rate'], 252):.2f}")
+        asset_values.append(f"{stats['sharpe']:.2f}")
         asset_values.append(
             f"{modigliani_ratio(prices[asset_name].returns, prices.iloc[:, -1].returns, data['risk_free_rate'], 252):.2f}")
         asset_values.append(f"{information_ratio(prices[asset_name].returns, prices.iloc[:, -1].returns, 252):.2f}")
@@ -48,8 +48,9 @@ dd.plot(ax=ax_drawdown, color='blue')
 rets.plot(ax=ax_histogram_arithm)
 log_rets.plot(ax=ax_histogram_log)
 
-ax_histogram_arithm.axvline(-rets.var(), color ='red', lw = 2, alpha = 0.75,label='VaR: {:.3f}'.format(-rets.var()))
-ax_histogram_arithm.axvline(-rets.cvar(), color ='green', lw = 2, alpha = 0.75,label='CVaR: {:.3f}'.format(-rets.cvar()))
+stats = rets.summary(ppy=252).iloc[0]
+ax_histogram_arithm.axvline(-stats['var'], color ='red', lw = 2, alpha = 0.75,label='VaR: {:.3f}'.format(-stats['var']))
+ax_histogram_arithm.axvline(-stats['cvar'], color ='green', lw = 2, alpha = 0.75,label='CVaR: {:.3f}'.format(-stats['cvar']))
 
 plt.legend(loc=0)
 plt.show()
\ No newline at end of file
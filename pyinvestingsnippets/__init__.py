@@ -1,6 +1,7 @@
 # pylint: disable=E501
 # flake8: noqa
 """Python tools for stock analysis"""
+from .config import set_precision, get_precision, precision
 from .extensions.drawdown import Drawdown
 from .extensions.drawdown_durations import DrawdownDurations
 from .extensions.cwi import CumulativeWealthIndex
@@ -11,6 +12,12 @@ from .extensions.srri import SRRI
 
 from .utilities.rolling_returns import RollingReturns
 from .utilities.rolling_volatility import RollingVolatility
+from .utilities.rolling_var import RollingVaR
+from .utilities.rolling_max_drawdown import RollingMaxDrawdown
+from .utilities.rolling_sharpe import RollingSharpe
+from .utilities.rolling_sortino import RollingSortino
+from .utilities.rolling_srri import RollingSRRI
+from .utilities.srri_migration import SRRIMigration
 from .utilities.rolling_beta_regression import RollingBetaRegression
 from .utilities.rolling_beta_covariance import RollingBetaCovariance
 from .utilities.exponentially_weighted_downside_risk import (
@@ -18,10 +25,27 @@ from .utilities.exponentially_weighted_downside_risk import (
 )
 from .utilities.beta_covariance import BetaCovariance
 from .utilities.beta_regression import BetaRegression
+from .utilities.batch_beta import BatchBeta
+from .utilities.value_at_risk import ValueAtRisk
+from .utilities.covariance import Covariance, RollingCovariance, EWMCovariance
+
+from .streaming.streaming_returns import StreamingReturns
+from .streaming.streaming_cwi import StreamingCumulativeWealthIndex
+from .streaming.streaming_drawdown import StreamingDrawdown
+
+from .io.chunked_panel import ChunkedPanel
+from .io.price_store import PriceStore
+from .io.aligned_panel import AlignedPanel
+
+from .executors.parallel import parallel_map
+from .executors.async_analytics import AsyncAnalytics
 
 
 __version__ = "4.0.1"
 __all__ = [
+    "set_precision",
+    "get_precision",
+    "precision",
     "Drawdown",
     "DrawdownDurations",
     "CumulativeWealthIndex",
@@ -31,8 +55,27 @@ __all__ = [
     "LogReturns",
     "RollingReturns",
     "RollingVolatility",
+    "RollingVaR",
+    "RollingMaxDrawdown",
+    "RollingSharpe",
+    "RollingSortino",
+    "RollingSRRI",
+    "SRRIMigration",
     "BetaCovariance",
     "BetaRegression",
+    "BatchBeta",
+    "ValueAtRisk",
+    "Covariance",
+    "RollingCovariance",
+    "EWMCovariance",
+    "StreamingReturns",
+    "StreamingCumulativeWealthIndex",
+    "StreamingDrawdown",
+    "ChunkedPanel",
+    "PriceStore",
+    "AlignedPanel",
+    "parallel_map",
+    "AsyncAnalytics",
     "ExponantiallyWeightedDownsideRisk",
     "RollingBetaRegression",
     "RollingBetaCovariance",
@@ -0,0 +1,110 @@
+"""Working precision of the extensions and utilities.
+
+By default the computations follow the input: float32 data stays in
+float32 and anything else runs in float64. The precision can be forced
+for everything with :func:`set_precision` (or temporarily with the
+:func:`precision` context manager), and the rolling utilities also take
+a per call ``dtype``. Sums and products over many rows always
+accumulate in float64, whatever the working precision.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import numpy as np
+import pandas as pd
+
+
+PRECISIONS = (np.dtype(np.float32), np.dtype(np.float64))
+
+# float64 cells of the temporary buffers of the float64 scans
+_SCAN_CELLS = 1 << 23
+
+# a context variable, so threads and asyncio tasks keep their own precision
+_precision = ContextVar("precision", default=None)
+
+
+def _as_precision_dtype(dtype):
+    if dtype is None:
+        return None
+    dtype = np.dtype(dtype)
+    assert dtype in PRECISIONS, "precision must be float32 or float64"
+    return dtype
+
+
+def set_precision(dtype):
+    """Sets the working precision of the current context: "float32",
+    "float64", or None to follow the input data. New threads start
+    following the input data"""
+    _precision.set(_as_precision_dtype(dtype))
+
+
+def get_precision():
+    """Returns the working precision (None when following the input)"""
+    return _precision.get()
+
+
+@contextmanager
+def precision(dtype):
+    """Sets the working precision within a ``with`` block, only for the
+    current thread or task"""
+    token = _precision.set(_as_precision_dtype(dtype))
+    try:
+        yield
+    finally:
+        _precision.reset(token)
+
+
+def resolve_dtype(pandas_obj, dtype=None):
+    """The precision to compute in: the requested dtype, else the global
+    precision, else float32 when all the data is float32 and float64 otherwise
+    """
+    dtype = _as_precision_dtype(dtype)
+    if dtype is None:
+        dtype = get_precision()
+    if dtype is None:
+        single = (pd.DataFrame(pandas_obj).dtypes == np.float32).all()
+        dtype = np.dtype(np.float32 if single else np.float64)
+    return dtype
+
+
+def as_precision(pandas_obj, dtype=None):
+    """Casts a pandas object to the working precision, without copying
+    when it already is"""
+    return pandas_obj.astype(resolve_dtype(pandas_obj, dtype), copy=False)
+
+
+def wrap(pandas_obj, values):
+    """A 2D (rows x columns) array as a pandas object shaped like
+    ``pandas_obj``: a DataFrame with its columns, or a Series with its name"""
+    if isinstance(pandas_obj, pd.DataFrame):
+        return pd.DataFrame(values, index=pandas_obj.index, columns=pandas_obj.columns)
+    return pd.Series(values[:, 0], index=pandas_obj.index, name=pandas_obj.name)
+
+
+def cumulative(pandas_obj, how):
+    """Cumulative sum (how="sum") or product (how="prod") down the rows,
+    accumulated in float64 and stored in the precision of the input.
+
+    Missing values are skipped and kept missing, like pandas cumsum/cumprod.
+    The columns are scanned in chunks to bound the float64 buffers.
+    """
+    values = pandas_obj.to_numpy()
+    values = values.reshape(values.shape[0], -1)
+    scan = np.nancumprod if how == "prod" else np.nancumsum
+    result = np.empty(values.shape, dtype=values.dtype)
+    step = max(1, _SCAN_CELLS // max(values.shape[0], 1))
+    for start in range(0, values.shape[1], step):
+        columns = slice(start, start + step)
+        result[:, columns] = scan(values[:, columns], axis=0, dtype=np.float64)
+    result[np.isnan(values)] = np.nan
+    return wrap(pandas_obj, result)
+
+
+def product(pandas_obj):
+    """Product of every column accumulated in float64, skipping missing
+    values like pandas prod"""
+    values = pandas_obj.to_numpy()
+    prod = np.nanprod(values, axis=0, dtype=np.float64)
+    if isinstance(pandas_obj, pd.DataFrame):
+        return pd.Series(prod, index=pandas_obj.columns)
+    return prod
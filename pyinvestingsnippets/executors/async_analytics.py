@@ -0,0 +1,113 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pandas as pd
+
+
+def _returns(prices):
+    return prices.returns.data
+
+
+def _cwi(prices):
+    return prices.returns.cwi.data
+
+
+def _drawdown(prices):
+    return prices.returns.cwi.drawdown.data
+
+
+def _summary(prices, **kwargs):
+    return prices.returns.summary(**kwargs)
+
+
+def data_key(pandas_obj):
+    """A key identifying the content of a pandas object (values, dates and
+    columns), so equal data parsed twice gives the same key"""
+    hashes = pd.util.hash_pandas_object(pandas_obj, index=True).to_numpy()
+    columns = tuple(pandas_obj.columns) if isinstance(pandas_obj, pd.DataFrame) \
+        else (pandas_obj.name,)
+    return hash((hashes.tobytes(), columns))
+
+
+class AsyncAnalytics:
+    """Awaitable computations for asyncio servers (dashboards).
+
+    The computations run in an executor (threads by default, or a
+    ``ProcessPoolExecutor``), so the event loop keeps serving while several
+    figures compute their metrics concurrently. Requests for the same
+    computation on the same data that are already running are coalesced:
+    they all await the one computation in flight. The metrics identify
+    the data by a content hash (:func:`data_key`), or by the ``key`` given
+    by the caller (a ticker and a version, a file name ...).
+
+    Example::
+
+        analytics = AsyncAnalytics()
+        cwi, drawdown = await asyncio.gather(
+            analytics.cwi(prices), analytics.drawdown(prices)
+        )
+    """
+
+    def __init__(self, executor=None):
+        """
+        Parameters
+        ----------
+        executor : a concurrent.futures executor, defaults to a thread pool.
+                   With a process pool the functions must be picklable.
+        """
+        self.executor = executor if executor is not None else ThreadPoolExecutor()
+        self._in_flight = {}
+
+    @property
+    def in_flight(self):
+        """Number of computations running"""
+        return len(self._in_flight)
+
+    async def submit(self, func, *args, key=None, **kwargs):
+        """Runs ``func(*args, **kwargs)`` in the executor and returns its result.
+
+        Parameters
+        ----------
+        func : the computation
+        key : identifies the computation to coalesce the duplicate requests.
+              None never coalesces.
+        """
+        if key is not None and key in self._in_flight:
+            return await asyncio.shield(self._in_flight[key])
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+        if key is not None:
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _metric(self, func, prices, key, **kwargs):
+        """Runs a metric of the prices, coalesced on ``key`` (identifying the
+        prices) or else on their :func:`data_key`, hashed in the executor so
+        the event loop is not blocked by large frames"""
+        if key is None:
+            loop = asyncio.get_running_loop()
+            key = await loop.run_in_executor(self.executor, data_key, prices)
+        key = (func.__name__, tuple(sorted(kwargs.items())), key)
+        return await self.submit(func, prices, key=key, **kwargs)
+
+    async def returns(self, prices, key=None):
+        """The arithmetic returns of the prices"""
+        return await self._metric(_returns, prices, key)
+
+    async def cwi(self, prices, key=None):
+        """The cumulative wealth index of the prices"""
+        return await self._metric(_cwi, prices, key)
+
+    async def drawdown(self, prices, key=None):
+        """The drawdown of the wealth index of the prices"""
+        return await self._metric(_drawdown, prices, key)
+
+    async def summary(self, prices, key=None, **kwargs):
+        """The ``returns.summary`` table of the prices"""
+        return await self._metric(_summary, prices, key, **kwargs)
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
@@ -0,0 +1,114 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+def _unwrap(result, attribute):
+    if attribute is None or isinstance(result, (pd.Series, pd.DataFrame)):
+        return result
+    return getattr(result, attribute)
+
+
+def _run_block(func, block, args, kwargs, attribute, per_column):
+    """Runs in the workers: func over a block, or over each of its columns"""
+    if not per_column:
+        return _unwrap(func(block, *args, **kwargs), attribute)
+    results = [
+        _unwrap(func(block[name], *args, **kwargs), attribute) for name in block.columns
+    ]
+    if all(isinstance(result, pd.Series) for result in results):
+        return pd.concat(results, axis=1, keys=block.columns)
+    return pd.Series(results, index=block.columns)
+
+
+def _reassemble(results, blocks_columns, frame):
+    """Concatenates the block results, keeping the original order"""
+    if all(
+        isinstance(result, pd.DataFrame) and result.columns.equals(columns)
+        for result, columns in zip(results, blocks_columns)
+    ):
+        # one column per asset: time series like rolling metrics
+        combined = pd.concat(results, axis=1)
+        positions = frame.index.get_indexer(combined.index)
+        if (positions >= 0).all():
+            combined = combined.iloc[np.argsort(positions, kind="stable")]
+        return combined
+    # one row per asset (per column values, summaries) or anything else
+    return pd.concat(results, axis=0)
+
+
+def parallel_map(
+    func,
+    frame,
+    *args,
+    n_workers=None,
+    columns_per_block=None,
+    per_column=False,
+    attribute="data",
+    executor=None,
+    **kwargs,
+):
+    """Runs a utility (or any function) over blocks of columns of a
+    DataFrame in a pool of processes, and puts the results back together
+    with the original index and column order.
+
+    Every block is sent to a worker as ``func(block, *args, **kwargs)``, so
+    func must be picklable: a class like ``RollingReturns``, a module level
+    function, or a ``functools.partial`` to fix the leading arguments, like
+    ``partial(RollingBetaRegression, market_returns)``. When func returns
+    an object that is not a pandas object, its ``attribute`` (``.data`` by
+    default) is used.
+
+    Parameters
+    ----------
+    func : the utility or function to run on every block
+    frame : DataFrame to split by columns
+    n_workers : number of processes, defaults to the number of CPUs.
+                With 1 the blocks run in the calling process.
+    columns_per_block : number of columns of every block, defaults to
+                        splitting the columns in 4 blocks per worker
+    per_column : calls func on every column (Series) of the blocks,
+                 for the utilities that accept a Series only (like SRRI)
+    attribute : the attribute holding the result of the utility
+    executor : an existing concurrent.futures executor to use instead
+               of starting a new process pool
+
+    Returns
+    -------
+    pd.DataFrame (or pd.Series for per column values)
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    _validate(frame, n_workers, columns_per_block)
+    if columns_per_block is None:
+        columns_per_block = max(1, -(-frame.shape[1] // (4 * n_workers)))
+
+    blocks_columns = [
+        frame.columns[start:start + columns_per_block]
+        for start in range(0, frame.shape[1], columns_per_block)
+    ]
+    arguments = [
+        (func, frame[columns], args, kwargs, attribute, per_column)
+        for columns in blocks_columns
+    ]
+    if executor is not None:
+        results = list(executor.map(_run_block, *zip(*arguments)))
+    elif n_workers == 1:
+        results = [_run_block(*argument) for argument in arguments]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(_run_block, *zip(*arguments)))
+    return _reassemble(results, blocks_columns, frame)
+
+
+def _validate(frame, n_workers, columns_per_block):
+    assert isinstance(frame, pd.DataFrame)
+    assert frame.shape[1] > 0, "the DataFrame has no columns"
+    assert n_workers > 0 and isinstance(
+        n_workers, int
+    ), "n_workers must be possitive integer"
+    assert columns_per_block is None or (
+        columns_per_block > 0 and isinstance(columns_per_block, int)
+    ), "columns_per_block must be possitive integer"
@@ -1,13 +1,52 @@
+import calendar
+
 import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.express as px
 import numpy as np
-import inspect
 from pandas.api.extensions import register_series_accessor, register_dataframe_accessor
+from pyinvestingsnippets.config import as_precision, cumulative
 from pyinvestingsnippets.exceptions \
     .cwi_not_properly_called_exception import CwiNotProperlyCalledException
 
 
+# for every resample rule: the consecutive integer code of the period of
+# every date of an index, and the end date of the period of a code
+NS_PER_DAY = 86_400_000_000_000
+PERIODS = {
+    # weeks end on Sunday; the epoch (day 0) is a Thursday
+    "W": (lambda index: (index.asi8 // NS_PER_DAY + 3) // 7,
+          lambda code: pd.Timestamp(code * 7 + 3, unit="D")),
+    "M": (lambda index: index.year * 12 + index.month - 1,
+          lambda code: pd.Timestamp(code // 12, code % 12 + 1, 1) + pd.offsets.MonthEnd()),
+    "Y": (lambda index: index.year,
+          lambda code: pd.Timestamp(code, 12, 31)),
+}
+
+
+def _period_end_samples(pandas_obj):
+    """The last value of every week, month and year of a pandas object,
+    like ``fillna(method="pad").resample(rule).last()`` for every rule.
+
+    The object is padded once and the period ends of all the frequencies
+    are found in one walk over its sorted index, so only the samples are
+    copied. Periods without dates are NaN, as with resample.
+    """
+    if not pandas_obj.index.is_monotonic_increasing:
+        pandas_obj = pandas_obj.sort_index()
+    padded = pandas_obj.fillna(method="pad")
+    if padded.shape[0] == 0 or padded.index.tz is not None:
+        return {rule: padded.resample(rule).last() for rule in PERIODS}
+    samples = {}
+    for rule, (period_code, period_end) in PERIODS.items():
+        codes = np.asarray(period_code(padded.index))
+        last_rows = np.flatnonzero(np.r_[codes[1:] != codes[:-1], True])
+        sample = padded.iloc[last_rows]
+        # consecutive periods have consecutive codes
+        index = pd.date_range(period_end(codes[0]), period_end(codes[-1]), freq=rule)
+        sample.index = index[codes[last_rows] - codes[0]]
+        samples[rule] = sample.reindex(index)
+    return samples
+
+
 @register_series_accessor("cwi")
 @register_dataframe_accessor("cwi")
 class CumulativeWealthIndex:
@@ -15,31 +54,50 @@ class CumulativeWealthIndex:
     will produce the Cumulative Wealth Index on 1 unit
     over periods of time.
 
-    This class cannot be called directly but only through"
+    The type of the returns has to be stated explicitly, either through
     * :func:`.returns <pyinvestingsnippets.Returns>`
     * :func:`.log_returns <pyinvestingsnippets.LogReturns>`
-    extensions
+    extensions, or by building the index directly with
+    :func:`from_returns` / :func:`from_log_returns`
+    (or ``CumulativeWealthIndex(obj, returns_type="log")``).
+
+    The index is stored in the working precision (see
+    :mod:`pyinvestingsnippets.config`) but always compounded in float64.
     """
 
-    def __init__(self, pandas_obj):
+    ARITHMETIC = "arithmetic"
+    LOG = "log"
+
+    def __init__(self, pandas_obj, returns_type=None):
         self._validate(pandas_obj)
-        stack = inspect.stack()
-        try:
-            caller_deep_class = stack[2][0].f_locals["self"].__class__.__name__
-        except Exception:
-            raise CwiNotProperlyCalledException("Cannot be called directly."
-                                                "Please read the documentation!")
-
-        if caller_deep_class == 'Returns':
-            self._obj = ((pandas_obj + 1).cumprod()) * 1
-        elif caller_deep_class == 'LogReturns':
-            self._obj = np.exp(pandas_obj.cumsum()) * 1
+        if returns_type is None:
+            raise CwiNotProperlyCalledException(
+                "Cannot be called directly. Please use the returns or log_returns"
+                " extensions, or pass the returns_type explicitly!")
+
+        pandas_obj = as_precision(pandas_obj)
+        if returns_type == CumulativeWealthIndex.ARITHMETIC:
+            self._obj = cumulative(pandas_obj + 1, "prod")
+        elif returns_type == CumulativeWealthIndex.LOG:
+            self._obj = np.exp(cumulative(pandas_obj, "sum"))
         else:
             raise CwiNotProperlyCalledException(
-                "Please use the returns or log_returns"
-                " extensions to call this extension!")
+                f"Unknown returns_type '{returns_type}'. Expected"
+                f" '{CumulativeWealthIndex.ARITHMETIC}' or"
+                f" '{CumulativeWealthIndex.LOG}'")
 
         self._obj.iloc[0] = 1
+        self._period_ends = None
+
+    @classmethod
+    def from_returns(cls, pandas_obj):
+        """Builds the wealth index from arithmetic returns"""
+        return cls(pandas_obj, returns_type=cls.ARITHMETIC)
+
+    @classmethod
+    def from_log_returns(cls, pandas_obj):
+        """Builds the wealth index from logarithmic returns"""
+        return cls(pandas_obj, returns_type=cls.LOG)
 
     @staticmethod
     def _validate(obj):
@@ -68,19 +126,52 @@ class CumulativeWealthIndex:
         """Returns Compound Annual Growth Rate"""
         return (self._obj.iloc[-1] ** (ppy / self._obj.shape[0])) - 1
 
+    @property
+    def period_ends(self):
+        """The wealth index at the end of every week ("W"), month ("M") and
+        year ("Y"), computed together on first use and cached"""
+        if self._period_ends is None:
+            self._period_ends = _period_end_samples(self._obj)
+        return self._period_ends
+
     @property
     def monthly_returns(self):
-        return self._obj.fillna(method="pad").resample("M").last().pct_change()
+        return self.period_ends["M"].pct_change()
 
     @property
     def weekly_returns(self):
-        return self._obj.fillna(method="pad").resample("W").last().pct_change()
+        return self.period_ends["W"].pct_change()
 
     @property
     def annual_returns(self):
-        return self._obj.fillna(method="pad").resample("Y").last().pct_change()
+        return self.period_ends["Y"].pct_change()
+
+    @property
+    def monthly_returns_table(self):
+        """The monthly returns as a table of years by months, with the
+        return of every year in the last column.
+
+        For a DataFrame the rows are indexed by column and year.
+        """
+        monthly = pd.DataFrame(self.monthly_returns)
+        monthly.index = pd.MultiIndex.from_arrays(
+            [monthly.index.year, monthly.index.month], names=["year", "month"]
+        )
+        table = monthly.stack(dropna=False).unstack("month")
+        table = table.reindex(columns=range(1, 13))
+        table.columns = list(calendar.month_abbr[1:])
+
+        annual = pd.DataFrame(self.annual_returns)
+        annual.index = annual.index.year.rename("year")
+        table["Year"] = annual.stack(dropna=False)
+
+        table = table.reorder_levels([1, 0]).sort_index()
+        if isinstance(self._obj, pd.Series):
+            table = table.droplevel(0)
+        return table
 
     def plot(self, ax=None, **kwargs):  # pragma: no cover
+        import matplotlib.pyplot as plt
         if ax is None:
             ax = plt.gca()
 
@@ -98,6 +189,7 @@ class CumulativeWealthIndex:
         return ax
 
     def plotly(self, **kwargs):  # pragma: no cover
+        import plotly.express as px
         fig = px.line(self._obj, **kwargs)
         fig.update_layout(
             title="Performance on 1$",
@@ -1,8 +1,6 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mtick
-import plotly.express as px
 from pandas.api.extensions import register_series_accessor, register_dataframe_accessor
+from pyinvestingsnippets.config import as_precision
 
 
 @register_series_accessor("drawdown")
@@ -13,6 +11,7 @@ class Drawdown:
 
     def __init__(self, pandas_obj):
         self._validate(pandas_obj)
+        pandas_obj = as_precision(pandas_obj)
         peaks = pandas_obj.cummax()
         self._obj = (pandas_obj - peaks) / peaks
 
@@ -38,10 +37,7 @@ class Drawdown:
 
     @property
     def durations(self):
-        """Returns the drawdown_durations ONLY if Series"""
-        assert isinstance(
-            self._obj, pd.Series
-        ), "Drawdown must be a Series to use this property"
+        """Returns the drawdown_durations of every Series or DataFrame column"""
         return self._obj.drawdown_durations
 
     def plot(self, ax=None, **kwargs):  # pragma: no cover
@@ -57,6 +53,8 @@ class Drawdown:
         -------
         matlibplot axis
         """
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as mtick
         if ax is None:
             ax = plt.gca()
 
@@ -78,6 +76,7 @@ class Drawdown:
         return ax
 
     def plotly(self, **kwargs):  # pragma: no cover
+        import plotly.express as px
         fig = px.line(self._obj, **kwargs)
         fig.layout.yaxis.tickformat = '.1%'
         fig.update_layout(
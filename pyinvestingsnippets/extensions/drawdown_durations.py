@@ -1,39 +1,123 @@
 import pandas as pd
 import numpy as np
-from pandas.api.extensions import register_series_accessor
+from pandas.api.extensions import register_series_accessor, register_dataframe_accessor
+
+
+def _drawdown_episodes(values):
+    """Run-length encodes the drawdown episodes of every column at once.
+
+    An episode runs from a date where the drawdown is 0 (the peak) to the
+    next date where it is 0 again (the recovery). The last observation
+    closes any episode that has not recovered yet.
+
+    Parameters
+    ----------
+    values : 2D array of drawdowns (observations x columns)
+
+    Returns
+    -------
+    dict of 1D arrays, one item per episode ordered by column and start:
+    column, start, trough, end (int64 positions), depth (float64)
+    and recovered (bool)
+    """
+    n_obs = values.shape[0]
+    is_zero = values == 0
+    recovered_at = is_zero.copy()
+    is_zero[-1] = True
+
+    # column major positions of the zeros, sorted by column then position
+    cols, pos = np.nonzero(is_zero.T)
+    lagoon = (cols[1:] == cols[:-1]) & (pos[1:] - pos[:-1] > 1)
+    column = cols[1:][lagoon].astype(np.int64)
+    start = pos[:-1][lagoon].astype(np.int64)
+    end = pos[1:][lagoon].astype(np.int64)
+    n_episodes = column.shape[0]
+
+    trough = end.copy()
+    depth = np.full(n_episodes, np.nan)
+    if n_episodes > 0:
+        flat = values.T.ravel()
+        seg_start = column * n_obs + start + 1
+        seg_end = column * n_obs + end + 1
+        # label every flat position with its episode (-1 when outside)
+        marks = np.zeros(flat.shape[0] + 1, dtype=np.int64)
+        marks[seg_start] += 1
+        marks[seg_end] -= 1
+        inside = np.cumsum(marks[:-1]) > 0
+        starts = np.zeros(flat.shape[0], dtype=np.int64)
+        starts[seg_start] = 1
+        labels = np.where(inside, np.cumsum(starts) - 1, -1)
+
+        filled = np.where(inside & ~np.isnan(flat), flat, np.inf)
+        lowest = np.minimum.reduceat(filled, seg_start)
+        at_lowest = np.flatnonzero(inside & (filled == lowest[labels]))
+        found, first = np.unique(labels[at_lowest], return_index=True)
+        finite = np.isfinite(lowest)
+        trough[found] = at_lowest[first] - column[found] * n_obs
+        depth[finite] = lowest[finite]
+
+    recovered = recovered_at[end, column]
+    return {
+        "column": column,
+        "start": start,
+        "trough": trough,
+        "end": end,
+        "depth": depth,
+        "recovered": recovered,
+    }
 
 
 @register_series_accessor("drawdown_durations")
+@register_dataframe_accessor("drawdown_durations")
 class DrawdownDurations:
-    """Given a Drawdown pandas Series,
+    """Given a Drawdown pandas object,
     calculates the durations of the different drawdowns
-    and attaches properties"""
+    and attaches properties.
+
+    All the columns of a DataFrame are processed in one pass.
+    """
+
+    EPISODE_COLUMNS = [
+        "start",
+        "trough",
+        "recovery",
+        "depth",
+        "duration",
+        "periods",
+        "recovered",
+    ]
 
     def __init__(self, pandas_obj):
         self._validate(pandas_obj)
-        # find all the locations where the drawdown == 0
-        zero_locations = np.unique(
-            np.r_[(pandas_obj == 0).values.nonzero()[0], len(pandas_obj) - 1]
+        values = pandas_obj.to_numpy(dtype=float)
+        self._episodes = _drawdown_episodes(values.reshape(values.shape[0], -1))
+        self._index = pandas_obj.index
+        self._columns = (
+            pandas_obj.columns if isinstance(pandas_obj, pd.DataFrame) else None
         )
-        # also assign the dates so we know when things were not sinking
-        zero_loc_s = pd.Series(zero_locations, index=pandas_obj.index[zero_locations])
-        # do a shift to show what is the last and previous non zero dates
-        df = zero_loc_s.to_frame("zero_loc")
-        df["prev_zloc"] = zero_loc_s.shift()
-        # keep only the dates where the difference is more than 1
-        # that denotes the lagoons
-        df = df[df["zero_loc"] - df["prev_zloc"] > 1].astype(int)
-        item = pandas_obj.index.__getitem__
-        df["Durations"] = df["zero_loc"].map(item) - df["prev_zloc"].map(item)
-        df = df.reindex(pandas_obj.index)
-        df = df.dropna()
-        self._obj = df["Durations"]
+        self._obj = self._durations()
 
     @staticmethod
     def _validate(obj):
-        assert isinstance(obj, pd.Series)
+        assert isinstance(obj, (pd.Series, pd.DataFrame))
         assert isinstance(obj.index, pd.DatetimeIndex)
 
+    def _durations(self):
+        index = self._index.to_numpy()
+        end = self._episodes["end"]
+        durations = index[end] - index[self._episodes["start"]]
+        if self._columns is None:
+            return pd.Series(durations, index=self._index[end], name="Durations")
+
+        table = np.full(
+            (index.shape[0], self._columns.shape[0]),
+            np.timedelta64("NaT"),
+            dtype="timedelta64[ns]",
+        )
+        table[end, self._episodes["column"]] = durations
+        frame = pd.DataFrame(table, index=self._index, columns=self._columns)
+        return frame.dropna(how="all")
+
     @property
     def data(self):
         return self._obj
@@ -42,9 +126,46 @@ class DrawdownDurations:
         return self._obj.loc[idx]
 
     @property
-    def mean(self) -> pd.Timedelta:
+    def episodes(self) -> pd.DataFrame:
+        """Returns one row per drawdown episode: the peak date it
+        starts from, the trough, the recovery date (or the last date
+        if still under water), the depth, the duration and number of
+        periods, and whether it recovered.
+
+        For a DataFrame the rows are indexed by (column, episode number).
+        """
+        index = self._index.to_numpy()
+        start = self._episodes["start"]
+        end = self._episodes["end"]
+        table = pd.DataFrame(
+            {
+                "start": index[start],
+                "trough": index[self._episodes["trough"]],
+                "recovery": index[end],
+                "depth": self._episodes["depth"],
+                "duration": index[end] - index[start],
+                "periods": end - start,
+                "recovered": self._episodes["recovered"],
+            },
+            columns=DrawdownDurations.EPISODE_COLUMNS,
+        )
+        if self._columns is not None:
+            column = self._episodes["column"]
+            first_of_column = np.searchsorted(column, column)
+            table.index = pd.MultiIndex.from_arrays(
+                [self._columns[column], np.arange(column.shape[0]) - first_of_column],
+                names=["column", "episode"],
+            )
+        return table
+
+    @property
+    def mean(self):
+        if self._columns is not None:
+            return self._obj.mean().fillna(pd.Timedelta("0 days"))
         return self._obj.mean() if self._obj.shape[0] > 0 else pd.Timedelta("0 days")
 
     @property
-    def max(self) -> pd.Timedelta:
+    def max(self):
+        if self._columns is not None:
+            return self._obj.max().fillna(pd.Timedelta("0 days"))
         return self._obj.max() if self._obj.shape[0] > 0 else pd.Timedelta("0 days")
@@ -1,8 +1,8 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pandas.api.extensions import register_series_accessor, register_dataframe_accessor
+from pyinvestingsnippets.config import as_precision
+from pyinvestingsnippets.extensions.cwi import CumulativeWealthIndex
 
 
 @register_series_accessor("log_returns")
@@ -14,7 +14,9 @@ class LogReturns:
 
     def __init__(self, pandas_obj):
         self._validate(pandas_obj)
-        self._obj = np.log(pandas_obj.fillna(method="pad")).diff()
+        prices = as_precision(pandas_obj).fillna(method="pad")
+        # the log of the price ratio keeps the precision of small returns
+        self._obj = np.log(prices / prices.shift(1))
 
     @staticmethod
     def _validate(obj):
@@ -39,9 +41,11 @@ class LogReturns:
 
     @property
     def cwi(self):
-        return self._obj.cwi
+        return CumulativeWealthIndex.from_log_returns(self._obj)
 
     def plot(self, ax=None):  # pragma: no cover
+        import matplotlib.pyplot as plt
+        import seaborn as sns
         if ax is None:
             fig, (ax1, ax2) = plt.subplots(2, 1, gridspec_kw=dict(height_ratios=[5, 1]))
             fig.suptitle("Log Returns", weight="bold")
@@ -1,6 +1,4 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.express as px
 from pandas.api.extensions import register_series_accessor, register_dataframe_accessor
 
 
@@ -35,6 +33,7 @@ class Prices:
         return (self._obj.iloc[-1] - self._obj.iloc[0]) / self._obj.iloc[0]
 
     def plot(self, ax=None, **kwargs):  # pragma: no cover
+        import matplotlib.pyplot as plt
         if ax is None:
             ax = plt.gca()
 
@@ -54,6 +53,7 @@ class Prices:
         return ax
 
     def plotly(self, **kwargs):  # pragma: no cover
+        import plotly.express as px
         fig = px.line(self._obj, **kwargs)
         fig.update_layout(
             title="Price",
@@ -1,8 +1,70 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pandas.api.extensions import register_series_accessor, register_dataframe_accessor
+from pyinvestingsnippets.config import as_precision, product
+from pyinvestingsnippets.extensions.cwi import CumulativeWealthIndex
+from pyinvestingsnippets.utilities.value_at_risk import historical_var_cvar, ValueAtRisk
+
+
+SUMMARY_METRICS = [
+    "total_return",
+    "average",
+    "cagr",
+    "volatility",
+    "sharpe",
+    "var",
+    "cvar",
+    "max_drawdown",
+    "best",
+    "worst",
+]
+
+
+def _summary_statistics(values, ppy, rf, percentile):
+    """Computes every summary metric of every column of a 2D returns array.
+
+    The array goes through a fixed number of vectorized passes
+    (moments, compounded growth, wealth/drawdown and one selection for
+    the VaR) whatever the number of metrics. Missing values are skipped,
+    and the average, CAGR and Sharpe ratio of every column are over the
+    periods since its first price (its first return is NaN, as in the
+    single metrics).
+    """
+    valid = ~np.isnan(values)
+    count = valid.sum(axis=0)
+    n_obs = values.shape[0] - np.argmax(valid, axis=0) + 1
+    filled = np.where(valid, values, 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth = np.prod(1 + filled, axis=0)
+        mean = filled.sum(axis=0) / count
+        deviations = np.where(valid, values - mean, 0.0)
+        std = np.sqrt((deviations * deviations).sum(axis=0) / (count - 1))
+        volatility = std * (ppy ** 0.5)
+
+        rf_per_period = (1 + rf) ** (1 / ppy) - 1
+        excess_growth = np.prod(np.where(valid, 1 + values - rf_per_period, 1.0), axis=0)
+        sharpe = (excess_growth ** (ppy / n_obs) - 1) / volatility
+
+        wealth = np.cumprod(1 + filled, axis=0)
+        drawdown = wealth / np.maximum.accumulate(wealth, axis=0) - 1
+
+    # the first return is always NaN, as in var
+    var, cvar = historical_var_cvar(values[1:], [percentile])
+
+    has_values = count > 0
+    return {
+        "total_return": np.where(has_values, growth - 1, np.nan),
+        "average": np.where(has_values, growth ** (1 / n_obs) - 1, np.nan),
+        "cagr": np.where(has_values, growth ** (ppy / n_obs) - 1, np.nan),
+        "volatility": volatility,
+        "sharpe": sharpe,
+        "var": var[:, 0],
+        "cvar": cvar[:, 0],
+        "max_drawdown": np.where(has_values, drawdown.min(axis=0), np.nan),
+        "best": np.where(has_values, np.where(valid, values, -np.inf).max(axis=0), np.nan),
+        "worst": np.where(has_values, np.where(valid, values, np.inf).min(axis=0), np.nan),
+    }
 
 
 @register_series_accessor("returns")
@@ -10,11 +72,20 @@ from pandas.api.extensions import register_series_accessor, register_dataframe_a
 class Returns:
     """Given a pandas object, will build the Arithmentic Returns and
     attach several properties
+
+    The reductions shared by the metrics (compounded growth, mean, std,
+    VaR ...) are computed once and cached on the extension,
+    so the returns must not be modified in place after the first metric.
+
+    The returns are kept in the working precision (see
+    :mod:`pyinvestingsnippets.config`), and the compounded growth is
+    accumulated in float64.
     """
 
     def __init__(self, pandas_obj):
         self._validate(pandas_obj)
-        self._obj = pandas_obj.fillna(method="pad").pct_change()
+        self._obj = as_precision(pandas_obj).fillna(method="pad").pct_change()
+        self._cache = {}
 
     @staticmethod
     def _validate(obj):
@@ -40,9 +111,24 @@ class Returns:
     def head(self, number):
         return self._obj.head(number)
 
+    def _cached(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _count(self):
+        return self._obj.shape[0]
+
+    def _growth(self):
+        """The compounded growth of 1 unit"""
+        return self._cached("growth", lambda: product(1 + self._obj))
+
+    def _std(self):
+        return self._cached("std", lambda: self._obj.std())
+
     @property
     def cwi(self):
-        return self._obj.cwi
+        return self._cached("cwi", lambda: CumulativeWealthIndex.from_returns(self._obj))
 
     @property
     def total(self):
@@ -50,38 +136,51 @@ class Returns:
         It is the aggregate amount that the investment has gained
         or lost over time, independent of the amount of time involved.
 
-        This is the same as self._obj.cwi.total_return
+        This is the same as self.cwi.total_return
         """
-        return (1 + self._obj).prod() - 1
+        return self._growth() - 1
 
     @property
     def average(self):
         """Returns the Average Return over a period. This is the
         Geometric Mean
         """
-        comp = (1 + self._obj).prod()
-        return comp ** (1 / self._obj.shape[0]) - 1
+        return self._growth() ** (1 / self._count()) - 1
 
     def cwi_since(self, since=None):
-        return self._obj[since:].cwi
+        return CumulativeWealthIndex.from_returns(self._obj[since:])
 
     def annualized(self, ppy=252):
         """Returns the annualized return (Compound Annual Growth Rate)
         based on the days provided. This is not a property
         because the incoming prices are of undefined periodicity.
         """
-        comp = (1 + self._obj).prod()
-        return comp ** (ppy / self._obj.shape[0]) - 1
+        return self._growth() ** (ppy / self._count()) - 1
 
     def volatility_annualized(self, ppy=252):
         """Returns the annualized volatility based on the days provided.
         This is not a property because the incoming prices are of
         undefined periodicity.
         """
-        return self._obj.std() * (ppy ** 0.5)
+        return self._std() * (ppy ** 0.5)
+
+    def _tail_risk(self, percentile):
+        """VaR and CVaR of every column, skipping the first return"""
+        key = ("tail_risk", tuple(np.atleast_1d(percentile)))
+        tail_risk = self._cached(key, lambda: ValueAtRisk(self._obj[1:], percentile))
+        var, cvar = tail_risk.var, tail_risk.cvar
+        if isinstance(self._obj, pd.Series):
+            var, cvar = var.to_numpy()[0], cvar.to_numpy()[0]
+            if np.ndim(percentile) == 0:
+                return var[0], cvar[0]
+            return var, cvar
+        if np.ndim(percentile) == 0:
+            return var.iloc[:, 0], cvar.iloc[:, 0]
+        return var, cvar
 
     def var(self, percentile=5):
-        """Returns the historic Value at Risk (VaR) at a specified level
+        """Returns the historic Value at Risk (VaR) at a specified level.
+        For a DataFrame every column is its own distribution.
 
         Parameters
         ----------
@@ -90,12 +189,14 @@ class Returns:
 
         Returns
         -------
-        float
+        float (pd.Series per column for a DataFrame,
+        assets x percentiles pd.DataFrame for a sequence of percentiles)
         """
-        return -np.percentile(self._obj[1:], percentile)
+        return self._tail_risk(percentile)[0]
 
     def cvar(self, percentile=5):
-        """Returns the Conditional VaR at a specified level
+        """Returns the Conditional VaR at a specified level.
+        For a DataFrame every column is its own distribution.
 
         Parameters
         ----------
@@ -104,10 +205,10 @@ class Returns:
 
         Returns
         -------
-        float
+        float (pd.Series per column for a DataFrame,
+        assets x percentiles pd.DataFrame for a sequence of percentiles)
         """
-        is_beyond = self._obj <= -self.var(percentile=percentile)
-        return -self._obj[is_beyond].mean()
+        return self._tail_risk(percentile)[1]
 
     def sharpe(self, risk_free_rate, periods=252):
         """The Sharpe ratio is the average return earned in excess
@@ -123,16 +224,48 @@ class Returns:
         """
         rf_per_period = (1 + risk_free_rate) ** (1 / periods) - 1
         excess_ret = self.data - rf_per_period
-        comp = (1 + excess_ret).prod()
+        comp = product(1 + excess_ret)
         ann_ex_ret = comp ** (periods / excess_ret.shape[0]) - 1
-        ann_vol = self.data.std() * (periods ** 0.5)
+        ann_vol = self._std() * (periods ** 0.5)
         return ann_ex_ret / ann_vol
 
+    def summary(self, ppy=252, rf=0.0, percentile=5):
+        """Returns the main statistics of every column in one go:
+        total return, average (geometric) return, CAGR, annualized
+        volatility, Sharpe ratio, VaR / CVaR, maximum drawdown and the
+        best and worst period.
+
+        The metrics follow the single ones of the extension, but missing
+        values are skipped and the data is scanned a fixed number of
+        times, so this is the way to go for wide DataFrames.
+
+        Parameters
+        ----------
+        ppy: periods per year
+        rf: the annual risk free rate for the Sharpe ratio
+        percentile: the VaR / CVaR percentile, between 0 and 100
+
+        Returns
+        -------
+        pd.DataFrame : one row per column (asset) and one column per metric
+        """
+        values = self._obj.to_numpy(dtype=float)
+        stats = _summary_statistics(
+            values.reshape(values.shape[0], -1), ppy, rf, percentile
+        )
+        if isinstance(self._obj, pd.DataFrame):
+            index = self._obj.columns
+        else:
+            index = pd.Index([self._obj.name])
+        return pd.DataFrame(stats, index=index, columns=SUMMARY_METRICS)
+
     @property
     def srri(self):
         return self._obj[1:].srri
 
     def plot(self, ax=None):  # pragma: no cover
+        import matplotlib.pyplot as plt
+        import seaborn as sns
         if ax is None:
             fig, (ax1, ax2) = plt.subplots(2, 1, gridspec_kw=dict(height_ratios=[5, 1]))
             fig.suptitle("Returns", weight="bold")
@@ -1,9 +1,10 @@
 import pandas as pd
 import numpy as np
-from pandas.api.extensions import register_series_accessor
+from pandas.api.extensions import register_series_accessor, register_dataframe_accessor
 
 
 @register_series_accessor("srri")
+@register_dataframe_accessor("srri")
 class SRRI:
     """
     Synthetic Risk and Reward Indicator (Standard Deviation over 5 Years)
@@ -20,8 +21,16 @@ class SRRI:
     the returns of the fund over the T periods.
 
     SRRI is calculated on a 5 year period.
+
+    On a DataFrame every column (fund) is computed at once and ``value`` and
+    ``risk_class`` are Series. Funds with missing returns in the 5 years
+    have no SRRI (NaN value and class 0). Daily prices can be resampled to
+    the weekly or monthly returns with :func:`from_prices`.
     """
 
+    PERIODS = {"W": 260, "M": 60}
+    PERIODS_PER_YEAR = {"W": 52, "M": 12}
+
     RISK_CLASSES = {
         1: {"low": 0, "high": 0.005},
         2: {"low": 0.005, "high": 0.02},
@@ -31,35 +40,66 @@ class SRRI:
         6: {"low": 0.15, "high": 0.25},
         7: {"low": 0.25, "high": 100},
     }
+    # the class of a volatility is the number of lower bucket edges it reaches
+    RISK_CLASS_EDGES = np.array(
+        [bucket["low"] for bucket in RISK_CLASSES.values()] + [RISK_CLASSES[7]["high"]]
+    )
 
-    def __init__(self, pandas_obj: pd.Series) -> None:
-        pandas_obj = pandas_obj.dropna()
+    def __init__(self, pandas_obj) -> None:
+        if isinstance(pandas_obj, pd.Series):
+            pandas_obj = pandas_obj.dropna()
         self._validate(pandas_obj)
-        deviations = pandas_obj - pandas_obj.mean()
-        squared_deviations = np.sum(deviations ** 2)
-        assert pandas_obj.shape[0] in [260, 60], \
-            "Need 5 years weekly or monthly returns." \
-            "Please consult the documentation."
+        values = pandas_obj.to_numpy(dtype=np.float64)
+        values = values.reshape(values.shape[0], -1)
+        deviations = values - values.mean(axis=0)
+        squared_deviations = np.sum(deviations ** 2, axis=0)
         factor = 52 / (260 - 1) if pandas_obj.shape[0] == 260 else 12 / (60 - 1)
         to_root = factor * squared_deviations
-        self.srri_value = np.sqrt(to_root)
+        if isinstance(pandas_obj, pd.DataFrame):
+            self.srri_value = pd.Series(np.sqrt(to_root), index=pandas_obj.columns)
+        else:
+            self.srri_value = np.sqrt(to_root[0])
+
+    @classmethod
+    def from_prices(cls, pandas_obj, frequency: str = "W"):
+        """Builds the SRRI of the last 5 years of daily (or any higher
+        frequency) prices or wealth index, resampled to weekly ("W")
+        or monthly ("M") returns"""
+        assert isinstance(pandas_obj.index, pd.DatetimeIndex)
+        assert frequency in cls.PERIODS, "frequency must be W or M"
+        returns = pandas_obj.fillna(method="pad").resample(frequency).last().pct_change()
+        return cls(returns.iloc[-cls.PERIODS[frequency]:])
 
     @staticmethod
-    def _validate(obj: pd.Series):
-        assert isinstance(obj, pd.Series)
+    def _validate(obj):
+        assert isinstance(obj, (pd.Series, pd.DataFrame))
         assert obj.shape[0] in [
             260,
             60,
         ], "Please provide 5 years of weekly \
 returns data (5 * 52) or 5 * 12 monthly returns"
 
+    @staticmethod
+    def classify(values):
+        """The risk classes of volatilities: a number, an array or a pandas
+        object, 0 where the volatility is missing or out of the buckets.
+
+        All the values are binned at once with a binary search of the
+        bucket edges."""
+        edges = SRRI.RISK_CLASS_EDGES
+        array = np.asarray(values, dtype=np.float64)
+        classes = np.searchsorted(edges, array, side="right")
+        classes = np.where(classes == edges.shape[0], 0, classes)
+        if isinstance(values, pd.DataFrame):
+            return pd.DataFrame(classes, index=values.index, columns=values.columns)
+        if isinstance(values, pd.Series):
+            return pd.Series(classes, index=values.index, name=values.name)
+        return int(classes) if classes.ndim == 0 else classes
+
     @property
-    def value(self) -> pd.Series:
+    def value(self):
         return self.srri_value
 
     @property
     def risk_class(self):
-        for i in SRRI.RISK_CLASSES:
-            if SRRI.RISK_CLASSES[i]["low"] <= self.srri_value \
-                    < SRRI.RISK_CLASSES[i]["high"]:
-                return i
+        return SRRI.classify(self.srri_value)
@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+
+
+FILLS = (None, "pad", "inside")
+
+
+def _merge_dates(dates):
+    """Union of the concatenated sorted runs of int64 dates, and the row of
+    every date in the union.
+
+    The stable sort merges the already sorted runs (a k-way merge), and
+    the union and the rows come out of the same pass.
+    """
+    order = np.argsort(dates, kind="stable")
+    merged = dates[order]
+    new = np.ones(merged.shape[0], dtype=bool)
+    new[1:] = merged[1:] != merged[:-1]
+    rows = np.empty(dates.shape[0], dtype=np.int64)
+    rows[order] = np.cumsum(new) - 1
+    return merged[new], rows
+
+
+class AlignedPanel:
+    """Aligns many price Series with their own dates (different start
+    dates, holidays) into one DataFrame of dates x assets, on the union
+    of the dates, ready for the ``prices`` accessor.
+
+    Instead of repeated ``pd.concat`` / ``join``, all the dates are merged
+    in one pass and the prices are scattered at once into a preallocated
+    array.
+
+    Parameters
+    ----------
+    series : a dict of Series by asset name, or an iterable of Series named
+             by asset (unnamed ones are named by position)
+    fill : None to leave the missing dates NaN, "pad" to forward fill them,
+           or "inside" to forward fill only up to the last price of every
+           asset (no prices after a delisting)
+    limit : maximum number of consecutive dates forward filled
+    dtype : dtype of the panel
+    """
+
+    def __init__(self, series, fill=None, limit=None, dtype=np.float64):
+        if not isinstance(series, dict):
+            series = list(series)
+            names = [
+                position if item.name is None else item.name
+                for position, item in enumerate(series)
+            ]
+            assert len(set(names)) == len(names), \
+                "the series must have different names (or be given in a dict)"
+            series = dict(zip(names, series))
+        self._validate(series, fill, limit)
+        self.fill = fill
+        series = {name: self._sorted(item) for name, item in series.items()}
+        columns = pd.Index(list(series.keys()))
+        lengths = np.array([item.shape[0] for item in series.values()], dtype=np.int64)
+
+        dates, rows = _merge_dates(
+            np.concatenate([item.index.asi8 for item in series.values()])
+        )
+        values = np.full((dates.shape[0], columns.shape[0]), np.nan, dtype=dtype)
+        values[rows, np.repeat(np.arange(columns.shape[0]), lengths)] = np.concatenate(
+            [item.to_numpy(dtype=dtype) for item in series.values()]
+        )
+
+        valid = ~np.isnan(values)
+        has_values = valid.any(axis=0)
+        first = np.argmax(valid, axis=0)
+        last = values.shape[0] - 1 - np.argmax(valid[::-1], axis=0)
+        # asi8 are UTC nanoseconds for tz aware dates
+        tz = next(iter(series.values())).index.tz
+        index = pd.DatetimeIndex(dates.view("M8[ns]"))
+        if tz is not None:
+            index = index.tz_localize("UTC").tz_convert(tz)
+        self._first_valid = pd.Series(
+            index[first].where(has_values), index=columns, name="first_valid"
+        )
+        self._last_valid = pd.Series(
+            index[last].where(has_values), index=columns, name="last_valid"
+        )
+
+        self._obj = pd.DataFrame(values, index=index, columns=columns, copy=False)
+        if fill is not None:
+            self._obj = self._obj.fillna(method="pad", limit=limit)
+        if fill == "inside":
+            self._obj = self._obj.where(np.arange(index.shape[0])[:, None] <= last)
+
+    @staticmethod
+    def _validate(series, fill, limit):
+        assert len(series) > 0, "at least one series is needed"
+        for item in series.values():
+            assert isinstance(item, pd.Series), "the prices must be Series"
+            assert isinstance(item.index, pd.DatetimeIndex)
+        assert len({str(item.index.tz) for item in series.values()}) <= 1, \
+            "the dates of all the series must have the same timezone"
+        assert fill in FILLS, "fill must be None, pad or inside"
+        assert limit is None or (limit > 0 and isinstance(
+            limit, int
+        )), "limit must be possitive integer"
+
+    @staticmethod
+    def _sorted(series):
+        """The series sorted by date, keeping the last price of a date"""
+        if not series.index.is_monotonic_increasing:
+            series = series.sort_index(kind="stable")
+        if not series.index.is_unique:
+            series = series[~series.index.duplicated(keep="last")]
+        return series
+
+    @property
+    def data(self):
+        """The prices DataFrame"""
+        return self._obj
+
+    @property
+    def first_valid(self):
+        """The date of the first price of every asset (NaT without prices)"""
+        return self._first_valid
+
+    @property
+    def last_valid(self):
+        """The date of the last price of every asset (NaT without prices)"""
+        return self._last_valid
@@ -0,0 +1,155 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from pyinvestingsnippets.io.panel_readers import (
+    NpyPanelReader,
+    ParquetPanelReader,
+    _import_parquet,
+)
+
+
+class _CsvWriter:
+    def __init__(self, path, panel):
+        self.path = path
+        self._header = True
+
+    def write(self, result, columns):
+        result.to_csv(self.path, mode="w" if self._header else "a", header=self._header)
+        self._header = False
+
+    def close(self):
+        pass
+
+
+class _ParquetWriter:
+    def __init__(self, path, panel):
+        self.path = path
+        self._writer = None
+
+    def write(self, result, columns):
+        import pyarrow as pa
+        pq = _import_parquet()
+        # parquet column names are strings
+        result = pd.DataFrame(result).rename(columns=str)
+        if self._writer is None:
+            table = pa.Table.from_pandas(result)
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        else:
+            table = pa.Table.from_pandas(result, schema=self._writer.schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+class _NpyWriter:
+    def __init__(self, path, panel):
+        self.path = path
+        self._panel_columns = panel.columns
+        self._values = None
+
+    def write(self, result, columns):
+        if isinstance(result, pd.Series) and result.index.equals(columns):
+            # one value per asset: a row of the array
+            result = result.to_frame().T
+        result = pd.DataFrame(result)
+        if self._values is None:
+            self._values = np.lib.format.open_memmap(
+                self.path,
+                mode="w+",
+                dtype=np.result_type(*result.dtypes),
+                shape=(result.shape[0], self._panel_columns.shape[0]),
+            )
+        assert result.shape[0] == self._values.shape[0], \
+            "every block must give the same number of rows"
+        positions = self._panel_columns.get_indexer(columns)
+        self._values[:, positions] = result.reindex(columns=columns).to_numpy()
+
+    def close(self):
+        if self._values is not None:
+            self._values.flush()
+
+
+_WRITERS = {".csv": _CsvWriter, ".parquet": _ParquetWriter, ".npy": _NpyWriter}
+
+
+class ChunkedPanel:
+    """A price panel (dates x assets) on disk, processed column block by
+    column block so that only one block is in memory at a time.
+
+    Any function of a prices DataFrame can be mapped over the blocks, like
+    ``lambda prices: prices.returns.summary()`` or
+    ``lambda prices: pyinv.RollingVolatility(prices.returns.data, 21).data``,
+    and the results are either concatenated or streamed to an output file:
+
+    * ``.csv`` / ``.parquet``: the rows of every block result are appended
+      to the table (one row per asset for summaries)
+    * ``.npy``: the block results (dates x assets) are written in place
+      in a memory mapped array of the whole panel shape
+    """
+
+    def __init__(self, reader, columns_per_block: int = 256):
+        self._validate(columns_per_block)
+        self.reader = reader
+        self.columns_per_block = columns_per_block
+
+    @classmethod
+    def from_parquet(cls, path, columns_per_block: int = 256, index_column=None):
+        """The panel of a Parquet file (requires pyarrow)"""
+        return cls(ParquetPanelReader(path, index_column), columns_per_block)
+
+    @classmethod
+    def from_npy(cls, values, index, columns=None, columns_per_block: int = 256):
+        """The panel of a 2D .npy file, see :class:`NpyPanelReader`"""
+        return cls(NpyPanelReader(values, index, columns), columns_per_block)
+
+    @staticmethod
+    def _validate(columns_per_block):
+        assert columns_per_block > 0 and isinstance(
+            columns_per_block, int
+        ), "columns_per_block must be possitive integer"
+
+    @property
+    def columns(self):
+        return self.reader.columns
+
+    def blocks(self):
+        """Yields the prices DataFrame of every block of columns"""
+        for start in range(0, self.columns.shape[0], self.columns_per_block):
+            yield self.reader.read(self.columns[start:start + self.columns_per_block])
+
+    def map(self, func, output=None):
+        """Applies func to the prices of every block.
+
+        Parameters
+        ----------
+        func : function of a prices DataFrame returning a DataFrame
+        output : optional path of a .csv, .parquet or .npy file to stream
+                 the results to
+
+        Returns
+        -------
+        pd.DataFrame : without output, the results concatenated by columns
+        (the blocks split the assets), or by rows when every result is
+        indexed by the assets of its block (a Series of one value per
+        asset, or a summary table); else the output path
+        """
+        if output is None:
+            results = [(func(block), block.columns) for block in self.blocks()]
+            per_asset = all(result.index.equals(columns) for result, columns in results)
+            return pd.concat(
+                [result for result, _ in results], axis=0 if per_asset else 1
+            )
+
+        extension = os.path.splitext(output)[1].lower()
+        assert extension in _WRITERS, "output must be a .csv, .parquet or .npy file"
+        writer = _WRITERS[extension](output, self)
+        try:
+            for block in self.blocks():
+                writer.write(func(block), block.columns)
+        finally:
+            writer.close()
+        return output
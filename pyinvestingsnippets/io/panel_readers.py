@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+
+def _import_parquet():
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as error:  # pragma: no cover
+        raise ImportError(
+            "Reading or writing Parquet files requires pyarrow: pip install pyarrow"
+        ) from error
+    return pq
+
+
+class ParquetPanelReader:
+    """Reads blocks of columns of a price panel stored in a Parquet file,
+    one row per date and one column per asset. Only the requested columns
+    are read from disk.
+
+    The dates are the index saved by pandas (``DataFrame.to_parquet``),
+    or the index_column of the file.
+    """
+
+    def __init__(self, path, index_column=None):
+        pq = _import_parquet()
+        self.path = path
+        self._file = pq.ParquetFile(path)
+        metadata = self._file.schema_arrow.pandas_metadata or {}
+        if index_column is not None:
+            self._index_columns = [index_column]
+        else:
+            self._index_columns = [
+                name for name in metadata.get("index_columns", [])
+                if isinstance(name, str)
+            ]
+        assert self._index_columns, "the dates of the panel need an index_column"
+        self.columns = pd.Index(
+            [name for name in self._file.schema_arrow.names
+             if name not in self._index_columns]
+        )
+
+    def read(self, columns):
+        table = self._file.read(
+            columns=list(columns) + self._index_columns, use_pandas_metadata=False
+        )
+        frame = table.to_pandas(ignore_metadata=True).set_index(self._index_columns[0])
+        frame.index = pd.DatetimeIndex(frame.index, name=None)
+        return frame[list(columns)]
+
+
+class NpyPanelReader:
+    """Reads blocks of columns of a price panel stored as a 2D ``.npy``
+    array (dates x assets). The file is memory mapped, so only the
+    requested columns are loaded.
+
+    Parameters
+    ----------
+    values : path of the .npy file (or an array)
+    index : the dates, a DatetimeIndex or the path of a .npy of datetime64
+    columns : the asset names, a sequence or the path of a .npy.
+              Defaults to the column numbers.
+    """
+
+    def __init__(self, values, index, columns=None):
+        self._values = np.load(values, mmap_mode="r") if isinstance(values, str) \
+            else values
+        assert self._values.ndim == 2, "the panel must be a 2D array"
+        if isinstance(index, str):
+            index = np.load(index)
+        self.index = pd.DatetimeIndex(index)
+        if isinstance(columns, str):
+            columns = np.load(columns, allow_pickle=False)
+        self.columns = pd.Index(
+            range(self._values.shape[1]) if columns is None else columns
+        )
+        assert self._values.shape == (self.index.shape[0], self.columns.shape[0]), \
+            "the panel does not match its index and columns"
+
+    def read(self, columns):
+        positions = self.columns.get_indexer(columns)
+        return pd.DataFrame(
+            np.array(self._values[:, positions]), index=self.index, columns=columns
+        )
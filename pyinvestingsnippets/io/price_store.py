@@ -0,0 +1,213 @@
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+
+def _read_header(fp):
+    version = np.lib.format.read_magic(fp)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fp)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fp)
+    return version, shape, fortran_order, dtype
+
+
+def _header_bytes(version, shape, dtype):
+    header = io.BytesIO()
+    write = np.lib.format.write_array_header_1_0 if version == (1, 0) \
+        else np.lib.format.write_array_header_2_0
+    write(header, {
+        "descr": np.lib.format.dtype_to_descr(dtype),
+        "fortran_order": False,
+        "shape": shape,
+    })
+    return header.getvalue()
+
+
+def _append_rows(path, rows, start):
+    """Writes rows to a C ordered .npy file in place, from row ``start`` on.
+
+    The data is written after the first ``start`` rows, any row after them
+    (left by an interrupted append) is dropped, and only the shape in the
+    header is updated (numpy pads the header so the first axis can grow).
+    Should the header not fit, the file is rewritten.
+    """
+    with open(path, "r+b") as fp:
+        version, shape, fortran_order, dtype = _read_header(fp)
+        data_start = fp.tell()
+        assert not fortran_order and shape[1:] == rows.shape[1:], \
+            f"cannot append rows of shape {rows.shape} to {path}"
+        assert shape[0] >= start, f"{path} has less than {start} rows"
+        new_shape = (start + rows.shape[0],) + shape[1:]
+        header = _header_bytes(version, new_shape, dtype)
+        if len(header) == data_start:
+            row_bytes = int(np.prod(shape[1:])) * dtype.itemsize
+            fp.seek(data_start + start * row_bytes)
+            fp.write(np.ascontiguousarray(rows, dtype=dtype).tobytes())
+            fp.truncate()
+            fp.seek(0)
+            fp.write(header)
+            return
+    existing = np.load(path)[:start]
+    np.save(path, np.concatenate((existing, rows.astype(existing.dtype))))
+
+
+class PriceStore:
+    """A price panel (dates x assets) on disk that opens instantly.
+
+    The store is a directory holding the dates as an int64 ``dates.npy``
+    (nanoseconds since the epoch), one ``.npy`` file per block of columns
+    and a ``store.json`` with the asset names. The blocks are memory
+    mapped, so a block is handed to pandas (and to the ``prices`` /
+    ``returns`` accessors) without being read or copied, and new dates
+    are appended in place.
+
+    It can be processed block by block with
+    :class:`ChunkedPanel(store) <pyinvestingsnippets.ChunkedPanel>`.
+    """
+
+    METADATA = "store.json"
+    DATES = "dates.npy"
+
+    def __init__(self, path):
+        """Opens an existing store
+
+        Parameters
+        ----------
+        path : the directory of the store
+        """
+        self.path = path
+        self._open()
+
+    def _open(self):
+        path = self.path
+        with open(os.path.join(path, PriceStore.METADATA), encoding="utf8") as f:
+            metadata = json.load(f)
+        self.columns = pd.Index(metadata["columns"])
+        self.columns_per_block = metadata["columns_per_block"]
+        dates = np.load(os.path.join(path, PriceStore.DATES), mmap_mode="r")
+        self.index = pd.DatetimeIndex(np.asarray(dates).view("M8[ns]"))
+        self._blocks = [
+            np.load(self._block_path(block), mmap_mode="r")[: self.index.shape[0]]
+            for block in range(self.n_blocks)
+        ]
+
+    @classmethod
+    def create(cls, path, prices, columns_per_block: int = 256, dtype=np.float64):
+        """Writes a prices DataFrame to a new store and opens it
+
+        Parameters
+        ----------
+        path : the directory of the store, created if missing
+        prices : DataFrame of prices with a DatetimeIndex
+        columns_per_block : number of assets of every block file
+        dtype : the dtype of the stored prices
+        """
+        cls._validate(prices, columns_per_block)
+        os.makedirs(path, exist_ok=True)
+        columns = list(prices.columns)
+        with open(os.path.join(path, cls.METADATA), "w", encoding="utf8") as f:
+            json.dump({"columns": columns, "columns_per_block": columns_per_block}, f)
+        values = prices.to_numpy(dtype=dtype)
+        for block, start in enumerate(range(0, max(len(columns), 1), columns_per_block)):
+            np.save(
+                os.path.join(path, f"block_{block:05d}.npy"),
+                np.ascontiguousarray(values[:, start:start + columns_per_block]),
+            )
+        np.save(os.path.join(path, cls.DATES), prices.index.asi8)
+        return cls(path)
+
+    @staticmethod
+    def _validate(prices, columns_per_block):
+        assert isinstance(prices, pd.DataFrame)
+        assert isinstance(prices.index, pd.DatetimeIndex)
+        assert prices.index.is_monotonic_increasing, "the dates must be sorted"
+        assert columns_per_block > 0 and isinstance(
+            columns_per_block, int
+        ), "columns_per_block must be possitive integer"
+
+    def _block_path(self, block):
+        return os.path.join(self.path, f"block_{block:05d}.npy")
+
+    @property
+    def n_blocks(self):
+        return max(-(-self.columns.shape[0] // self.columns_per_block), 1)
+
+    @property
+    def shape(self):
+        return self.index.shape[0], self.columns.shape[0]
+
+    def _frame(self, block, columns=slice(None)):
+        start = block * self.columns_per_block
+        names = self.columns[start:start + self.columns_per_block][columns]
+        return pd.DataFrame(
+            self._blocks[block][:, columns], index=self.index, columns=names, copy=False
+        )
+
+    def block(self, number):
+        """The prices DataFrame of a block, backed by the memory map (no copy)"""
+        return self._frame(number)
+
+    def blocks(self):
+        """Yields the prices DataFrame of every block (no copy)"""
+        for block in range(self.n_blocks):
+            yield self._frame(block)
+
+    def read(self, columns=None):
+        """The prices of some assets (all by default).
+
+        Assets of a single block are returned without copying,
+        else the blocks are concatenated.
+        """
+        positions = np.arange(self.columns.shape[0]) if columns is None \
+            else self.columns.get_indexer(columns)
+        assert (positions >= 0).all(), "unknown columns"
+        blocks = np.unique(positions // self.columns_per_block)
+        if blocks.shape[0] == 1:
+            offsets = positions - blocks[0] * self.columns_per_block
+            if offsets.shape[0] > 0 and (np.diff(offsets) == 1).all():
+                return self._frame(blocks[0], slice(offsets[0], offsets[-1] + 1))
+        return pd.concat([self._frame(block) for block in blocks], axis=1)[
+            self.columns[positions]
+        ]
+
+    @property
+    def data(self):
+        """All the prices"""
+        return self.read()
+
+    def append(self, prices):
+        """Appends the prices of new dates, after the last stored one.
+
+        Assets missing from prices are stored as NaN, and assets unknown
+        to the store are not allowed.
+        """
+        assert isinstance(prices.index, pd.DatetimeIndex)
+        assert prices.index.is_monotonic_increasing, "the dates must be sorted"
+        assert self.index.shape[0] == 0 or prices.index[0] > self.index[-1], \
+            "only dates after the last stored date can be appended"
+        assert prices.columns.isin(self.columns).all(), "unknown columns"
+        values = prices.reindex(columns=self.columns).to_numpy()
+        # the stored dates are the rows of the store: the new rows go right
+        # after them, over the rows of an append interrupted before its dates
+        n_rows = self.index.shape[0]
+        # release the memory maps before growing the files
+        self._blocks = []
+        try:
+            for block in range(self.n_blocks):
+                start = block * self.columns_per_block
+                _append_rows(
+                    self._block_path(block),
+                    values[:, start:start + self.columns_per_block],
+                    n_rows,
+                )
+            # the dates go last: they commit the new rows
+            _append_rows(
+                os.path.join(self.path, PriceStore.DATES), prices.index.asi8, n_rows
+            )
+        finally:
+            # a failed append leaves the store as it was before it
+            self._open()
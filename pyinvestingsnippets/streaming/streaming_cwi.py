@@ -0,0 +1,96 @@
+import math
+
+import numpy as np
+
+from pyinvestingsnippets.exceptions \
+    .cwi_not_properly_called_exception import CwiNotProperlyCalledException
+from pyinvestingsnippets.streaming.streaming_drawdown import StreamingDrawdown
+
+
+class StreamingCumulativeWealthIndex:
+    """Incremental Cumulative Wealth Index on 1 unit of a returns stream.
+
+    Keeps the running wealth and feeds it to a
+    :class:`StreamingDrawdown <pyinvestingsnippets.StreamingDrawdown>`,
+    the same way ``.cwi.drawdown`` chains the extensions.
+    """
+
+    ARITHMETIC = "arithmetic"
+    LOG = "log"
+
+    def __init__(self, returns_type=ARITHMETIC, timestamp=None):
+        """
+        Parameters
+        ----------
+        returns_type : "arithmetic" or "log", the type of the incoming returns
+        timestamp : optional timestamp of the starting point (wealth of 1)
+        """
+        if returns_type not in (self.ARITHMETIC, self.LOG):
+            raise CwiNotProperlyCalledException(
+                f"Unknown returns_type '{returns_type}'. Expected"
+                f" '{self.ARITHMETIC}' or '{self.LOG}'")
+        self.returns_type = returns_type
+        self._wealth = 1.0
+        self._drawdown = StreamingDrawdown()
+        self._drawdown.update(self._wealth, timestamp)
+
+    def update(self, ret, timestamp=None):
+        """
+        Adds one new return to the stream
+
+        Parameters
+        ----------
+        ret : the new return (NaN values are ignored)
+        timestamp : optional timestamp of the return
+
+        Returns
+        -------
+        float : the wealth index after the return
+        """
+        if math.isnan(ret):
+            return self._wealth
+        if self.returns_type == self.ARITHMETIC:
+            self._wealth *= 1 + ret
+        else:
+            self._wealth *= math.exp(ret)
+        self._drawdown.update(self._wealth, timestamp)
+        return self._wealth
+
+    def update_many(self, rets, timestamps=None):
+        """
+        Adds a batch of returns to the stream
+
+        Parameters
+        ----------
+        rets : array like of returns (NaN values are ignored)
+        timestamps : optional array like of the returns' timestamps
+
+        Returns
+        -------
+        np.ndarray : the wealth index after every return
+        """
+        rets = np.asarray(rets, dtype=float)
+        missing = np.isnan(rets)
+        filled = np.where(missing, 0.0, rets)
+        if self.returns_type == self.ARITHMETIC:
+            wealth = self._wealth * np.cumprod(1 + filled)
+        else:
+            wealth = self._wealth * np.exp(np.cumsum(filled))
+        if wealth.shape[0] > 0:
+            self._wealth = wealth[-1]
+            self._drawdown.update_many(np.where(missing, np.nan, wealth), timestamps)
+        return wealth
+
+    @property
+    def wealth(self):
+        """Returns the current wealth of 1 unit invested"""
+        return self._wealth
+
+    @property
+    def total_return(self):
+        """Returns the total return"""
+        return self._wealth - 1
+
+    @property
+    def drawdown(self):
+        return self._drawdown
@@ -0,0 +1,142 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+
+class StreamingDrawdown:
+    """Incremental drawdown of a Wealth Index (or price) stream.
+
+    Every update costs O(1) (O(batch) for ``update_many``) and the state
+    is a handful of numbers: the running peak, the current and maximum
+    drawdown and how long the current drawdown has been open.
+    """
+
+    def __init__(self):
+        self._peak = math.nan
+        self._peak_timestamp = None
+        self._last_timestamp = None
+        self._drawdown = math.nan
+        self._max_drawdown = 0.0
+        self._periods = 0
+        self._count = 0
+
+    @staticmethod
+    def _validate(value):
+        assert value > 0, "Wealth values must be positive"
+
+    def update(self, value, timestamp=None):
+        """
+        Adds one new value to the stream
+
+        Parameters
+        ----------
+        value : the new Wealth Index value (NaN values are ignored)
+        timestamp : optional timestamp of the value
+
+        Returns
+        -------
+        float : the current drawdown
+        """
+        if math.isnan(value):
+            return self._drawdown
+        self._validate(value)
+        self._count += 1
+        self._last_timestamp = timestamp
+        if self._count == 1 or value >= self._peak:
+            self._peak = value
+            self._peak_timestamp = timestamp
+            self._periods = 0
+            self._drawdown = 0.0
+        else:
+            self._periods += 1
+            self._drawdown = value / self._peak - 1
+            self._max_drawdown = min(self._max_drawdown, self._drawdown)
+        return self._drawdown
+
+    def update_many(self, values, timestamps=None):
+        """
+        Adds a batch of values to the stream
+
+        Parameters
+        ----------
+        values : array like of Wealth Index values (NaN values are ignored)
+        timestamps : optional array like of the values' timestamps
+
+        Returns
+        -------
+        np.ndarray : the drawdown after every value (NaN for the ignored ones)
+        """
+        values = np.asarray(values, dtype=float)
+        valid = ~np.isnan(values)
+        kept = values[valid]
+        if kept.shape[0] == 0:
+            return np.full(values.shape, np.nan)
+        self._validate(kept.min())
+        if timestamps is not None:
+            timestamps = np.asarray(timestamps)[valid]
+
+        previous_peak = kept[0] if self._count == 0 else self._peak
+        peaks = np.maximum.accumulate(np.maximum(kept, previous_peak))
+        drawdowns = kept / peaks - 1
+        new_peaks = np.flatnonzero(kept >= np.r_[previous_peak, peaks[:-1]])
+
+        if new_peaks.shape[0] > 0:
+            last_peak = new_peaks[-1]
+            self._peak_timestamp = (
+                None if timestamps is None else pd.Timestamp(timestamps[last_peak])
+            )
+            self._periods = kept.shape[0] - 1 - last_peak
+        else:
+            self._periods += kept.shape[0]
+        self._peak = peaks[-1]
+        self._drawdown = drawdowns[-1]
+        self._max_drawdown = min(self._max_drawdown, drawdowns.min())
+        self._count += kept.shape[0]
+        self._last_timestamp = (
+            None if timestamps is None else pd.Timestamp(timestamps[-1])
+        )
+
+        result = np.full(values.shape, np.nan)
+        result[valid] = drawdowns
+        return result
+
+    @property
+    def count(self):
+        """Returns the number of values seen"""
+        return self._count
+
+    @property
+    def peak(self):
+        """Returns the running peak"""
+        return self._peak
+
+    @property
+    def drawdown(self):
+        """Returns the current drawdown"""
+        return self._drawdown
+
+    @property
+    def max_drawdown(self):
+        """Returns the maximum drawdown so far"""
+        return self._max_drawdown
+
+    @property
+    def duration(self):
+        """Returns the number of periods the current drawdown is open for
+        (0 when at a peak)"""
+        return self._periods
+
+    @property
+    def peak_timestamp(self):
+        """Returns the timestamp of the running peak, the start of the
+        current drawdown (None if no timestamps were given)"""
+        return self._peak_timestamp
+
+    @property
+    def open_duration(self):
+        """Returns the time elapsed since the running peak
+        (None if no timestamps were given)"""
+        if self._peak_timestamp is None or self._last_timestamp is None:
+            return None
+        return self._last_timestamp - self._peak_timestamp
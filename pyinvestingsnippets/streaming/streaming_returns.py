@@ -0,0 +1,154 @@
+import math
+
+import numpy as np
+
+from pyinvestingsnippets.streaming.streaming_cwi import StreamingCumulativeWealthIndex
+
+
+class StreamingReturns:
+    """Incremental Arithmetic Returns of a price stream.
+
+    Takes one new price (or a small batch) at a time and keeps the
+    running mean and variance of the returns (Welford), as well as the
+    :class:`StreamingCumulativeWealthIndex
+    <pyinvestingsnippets.StreamingCumulativeWealthIndex>` and its drawdown,
+    with O(1) cost per price and constant memory.
+    """
+
+    def __init__(self):
+        self._last_price = math.nan
+        self._last_return = math.nan
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._cwi = None
+
+    @staticmethod
+    def _validate(price):
+        assert price > 0, "Prices must be positive"
+
+    def update(self, price, timestamp=None):
+        """
+        Adds one new price to the stream
+
+        Parameters
+        ----------
+        price : the new price (a NaN repeats the previous price, which gives
+                a 0 return like the padded prices of the batch accessor)
+        timestamp : optional timestamp of the price
+
+        Returns
+        -------
+        float : the return since the previous price (NaN for the first one)
+        """
+        if math.isnan(price):
+            if self._cwi is None:
+                return math.nan
+            price = self._last_price
+        self._validate(price)
+        if self._cwi is None:
+            self._last_price = price
+            self._cwi = StreamingCumulativeWealthIndex(timestamp=timestamp)
+            return math.nan
+
+        ret = price / self._last_price - 1
+        self._last_price = price
+        self._last_return = ret
+        self._count += 1
+        delta = ret - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (ret - self._mean)
+        self._cwi.update(ret, timestamp)
+        return ret
+
+    def update_many(self, prices, timestamps=None):
+        """
+        Adds a batch of prices to the stream
+
+        Parameters
+        ----------
+        prices : array like of prices (NaN values repeat the previous price)
+        timestamps : optional array like of the prices' timestamps
+
+        Returns
+        -------
+        np.ndarray : the returns of the batch prices
+        """
+        prices = np.asarray(prices, dtype=float)
+        # pad the missing prices with the previous one, like the batch accessor
+        padded = np.r_[self._last_price, prices]
+        last_valid = np.maximum.accumulate(
+            np.where(np.isnan(padded), 0, np.arange(padded.shape[0]))
+        )
+        prices = padded[last_valid][1:]
+        valid = ~np.isnan(prices)
+        kept = prices[valid]
+        rets = np.full(prices.shape, np.nan)
+        if kept.shape[0] == 0:
+            return rets
+        self._validate(kept.min())
+        if timestamps is not None:
+            timestamps = np.asarray(timestamps)[valid]
+        if self._cwi is None:
+            first = None if timestamps is None else timestamps[0]
+            self._cwi = StreamingCumulativeWealthIndex(timestamp=first)
+            self._last_price = kept[0]
+            kept = kept[1:]
+            timestamps = None if timestamps is None else timestamps[1:]
+            valid[np.flatnonzero(valid)[0]] = False
+        if kept.shape[0] == 0:
+            return rets
+
+        batch = kept / np.r_[self._last_price, kept[:-1]] - 1
+        self._last_price = kept[-1]
+        self._last_return = batch[-1]
+
+        # Chan et al. parallel combination of the running and the batch moments
+        count = batch.shape[0]
+        mean = batch.mean()
+        m2 = ((batch - mean) ** 2).sum()
+        total = self._count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta ** 2 * self._count * count / total
+        self._count = total
+
+        self._cwi.update_many(batch, timestamps)
+        rets[valid] = batch
+        return rets
+
+    @property
+    def count(self):
+        """Returns the number of returns seen"""
+        return self._count
+
+    @property
+    def last_price(self):
+        return self._last_price
+
+    @property
+    def last_return(self):
+        return self._last_return
+
+    @property
+    def mean(self):
+        """Returns the arithmetic mean of the returns"""
+        return self._mean if self._count > 0 else math.nan
+
+    @property
+    def variance(self):
+        """Returns the sample variance of the returns"""
+        return self._m2 / (self._count - 1) if self._count > 1 else math.nan
+
+    @property
+    def std(self):
+        """Returns the sample standard deviation of the returns"""
+        return math.sqrt(self.variance) if self._count > 1 else math.nan
+
+    def volatility_annualized(self, ppy=252):
+        """Returns the annualized volatility based on the periods per year"""
+        return self.std * (ppy ** 0.5)
+
+    @property
+    def cwi(self):
+        return self._cwi
@@ -0,0 +1,58 @@
+"""Vectorized building blocks shared by the rolling utilities"""
+import numpy as np
+import pandas as pd
+
+from pyinvestingsnippets.config import resolve_dtype
+
+
+def rolling_sum(values, length):
+    """Sums over the trailing ``length`` rows of a 2D array.
+
+    Computed from a single cumulative sum, so the cost is linear in the
+    number of rows whatever the window. The first ``length - 1`` rows are NaN.
+    The sum accumulates in float64, and float32 input gives float32 sums.
+    """
+    cumulative = np.cumsum(values, axis=0, dtype=np.float64)
+    dtype = values.dtype if values.dtype == np.float32 else np.float64
+    sums = np.full(values.shape, np.nan, dtype=dtype)
+    if values.shape[0] >= length:
+        sums[length - 1] = cumulative[length - 1]
+        sums[length:] = cumulative[length:] - cumulative[:-length]
+    return sums
+
+
+def rolling_mean_std(values, length):
+    """Rolling mean and sample standard deviation of every column of a 2D array.
+
+    Both come from rolling sums and sums of squares in one pass. The columns
+    are centered first so the sums of squares do not lose precision on long
+    histories. Windows holding a NaN and the first ``length - 1`` rows are NaN.
+    """
+    is_nan = np.isnan(values)
+    filled = np.where(is_nan, 0.0, values)
+    center = filled.sum(axis=0, dtype=np.float64) / np.maximum((~is_nan).sum(axis=0), 1)
+    center = center.astype(values.dtype)
+    centered = np.where(is_nan, 0.0, values - center)
+    sums = rolling_sum(centered, length)
+    squares = rolling_sum(centered * centered, length)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = sums / length
+        variance = (squares - sums * mean) / (length - 1)
+    std = np.sqrt(np.maximum(variance, 0.0))
+    if length < 2:
+        std[:] = np.nan
+    nan_windows = rolling_sum(is_nan.astype(np.int64), length) != 0
+    mean[nan_windows] = np.nan
+    std[nan_windows] = np.nan
+    return mean + center, std
+
+
+def excess_returns(obj, rf_per_period, dtype):
+    """The returns in excess of the risk free rate, as a 2D array"""
+    if isinstance(rf_per_period, pd.Series):
+        rf_per_period = rf_per_period.reindex(obj.index)
+        excess = obj.sub(rf_per_period, axis=0)
+    else:
+        excess = obj - rf_per_period
+    values = excess.to_numpy(dtype=resolve_dtype(obj, dtype))
+    return values.reshape(values.shape[0], -1)
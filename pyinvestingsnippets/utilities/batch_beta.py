@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+
+
+class BatchBeta:
+    """
+    Given the Returns of many Stocks and of one or more Benchmark indices,
+    calculates the beta (and alpha / R squared) of every Stock over every
+    Benchmark at once.
+
+    The regressions are computed from matrix products of the demeaned
+    returns, so N stocks x M benchmarks cost a handful of (N x T) @ (T x M)
+    products instead of N * M separate fits. Missing values are handled
+    pairwise: every (stock, benchmark) pair uses the dates where both have
+    a return.
+    """
+
+    def __init__(self, independent_variables, dependent_variables):
+        """
+        Parameters
+        ----------
+        independent_variables : Market Returns (Series or DataFrame of M benchmarks)
+        dependent_variables : Stock Returns (Series or DataFrame of N stocks)
+        """
+        self._validate(independent_variables, dependent_variables)
+        benchmarks, stocks = self._as_frame(independent_variables).align(
+            self._as_frame(dependent_variables), join="inner", axis=0
+        )
+        self.independent_variables = benchmarks
+        self.dependent_variables = stocks
+
+        x = benchmarks.to_numpy(dtype=float)
+        y = stocks.to_numpy(dtype=float)
+        # dates without any return at all (like the first one) carry no information
+        empty = np.isnan(x).all(axis=1) & np.isnan(y).all(axis=1)
+        x, y = x[~empty], y[~empty]
+        x_mask = ~np.isnan(x)
+        y_mask = ~np.isnan(y)
+        x_mean = np.where(x_mask, x, 0).sum(axis=0) / np.maximum(x_mask.sum(axis=0), 1)
+        y_mean = np.where(y_mask, y, 0).sum(axis=0) / np.maximum(y_mask.sum(axis=0), 1)
+        x_c = np.where(x_mask, x - x_mean, 0.0)
+        y_c = np.where(y_mask, y - y_mean, 0.0)
+
+        s_xy = y_c.T @ x_c
+        if x_mask.all() and y_mask.all():
+            # no missing values: the centered sums vanish
+            obs = np.full(s_xy.shape, x.shape[0], dtype=float)
+            sum_x = np.zeros(s_xy.shape)
+            sum_y = np.zeros(s_xy.shape)
+            s_xx = np.broadcast_to((x_c * x_c).sum(axis=0), s_xy.shape)
+            s_yy = np.broadcast_to((y_c * y_c).sum(axis=0)[:, None], s_xy.shape)
+        else:
+            x_valid = x_mask.astype(float)
+            y_valid = y_mask.astype(float)
+            obs = y_valid.T @ x_valid
+            sum_x = y_valid.T @ x_c
+            sum_y = y_c.T @ x_valid
+            with np.errstate(invalid="ignore", divide="ignore"):
+                s_xy = s_xy - sum_x * sum_y / obs
+                s_xx = y_valid.T @ (x_c * x_c) - sum_x * sum_x / obs
+                s_yy = (y_c * y_c).T @ x_valid - sum_y * sum_y / obs
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            beta = s_xy / s_xx
+            alpha = (sum_y / obs + y_mean[:, None]) - beta * (sum_x / obs + x_mean)
+            r_squared = s_xy * s_xy / (s_xx * s_yy)
+        beta[obs < 2] = np.nan
+
+        self._beta = self._wrap(beta)
+        self._alpha = self._wrap(np.where(np.isnan(beta), np.nan, alpha))
+        self._r_squared = self._wrap(np.where(np.isnan(beta), np.nan, r_squared))
+        self._observations = self._wrap(obs.astype(np.int64))
+
+    @staticmethod
+    def _validate(independent_variables, dependent_variables):
+        assert isinstance(independent_variables.index, pd.DatetimeIndex)
+        assert isinstance(dependent_variables.index, pd.DatetimeIndex)
+
+    @staticmethod
+    def _as_frame(obj):
+        return obj.to_frame() if isinstance(obj, pd.Series) else obj
+
+    def _wrap(self, values):
+        return pd.DataFrame(
+            values,
+            index=self.dependent_variables.columns,
+            columns=self.independent_variables.columns,
+        )
+
+    @property
+    def beta(self):
+        """
+        Returns
+        -------
+        pd.DataFrame : Stocks x Benchmarks betas
+        """
+        return self._beta
+
+    @property
+    def alpha(self):
+        """
+        Returns
+        -------
+        pd.DataFrame : Stocks x Benchmarks intercepts (alpha)
+        """
+        return self._alpha
+
+    @property
+    def r_squared(self):
+        """
+        Returns
+        -------
+        pd.DataFrame : Stocks x Benchmarks coefficients of determination
+        """
+        return self._r_squared
+
+    @property
+    def observations(self):
+        """
+        Returns
+        -------
+        pd.DataFrame : Stocks x Benchmarks number of common observations
+        """
+        return self._observations
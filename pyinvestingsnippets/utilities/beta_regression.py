@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import LinearRegression
 
 
 class BetaRegression:
@@ -34,6 +33,8 @@ class BetaRegression:
         -------
         beta: float
         """
+        from sklearn.linear_model import LinearRegression
+
         x = np.array(self.independent_variable).reshape((-1, 1))
         y = np.array(self.dependent_variable)
         model = LinearRegression().fit(x, y)
@@ -0,0 +1,390 @@
+import pandas as pd
+import numpy as np
+
+from pyinvestingsnippets.config import resolve_dtype
+from pyinvestingsnippets.utilities._rolling import rolling_sum
+
+
+SHRINKAGES = (None, "ledoit-wolf")
+
+
+def ledoit_wolf(covariance, n_obs, fourth_moment):
+    """Ledoit-Wolf shrinkage of a (maximum likelihood) covariance matrix
+    towards the identity scaled by the average variance, the estimator of
+    ``sklearn.covariance.LedoitWolf``.
+
+    Parameters
+    ----------
+    covariance : the covariance matrix of n_obs returns, divided by n_obs
+    n_obs : the number of returns
+    fourth_moment : the sum over the returns of the fourth power of the
+                    norm of the centered returns, sum_k ||x_k - mean||^4
+
+    Returns
+    -------
+    tuple : the shrunk covariance matrix and the shrinkage intensity
+    """
+    n_assets = covariance.shape[0]
+    trace = np.trace(covariance)
+    mu = trace / n_assets
+    squares = np.sum(covariance ** 2)
+    beta = (fourth_moment / n_obs - squares) / (n_assets * n_obs)
+    delta = (squares - 2 * mu * trace + n_assets * mu ** 2) / n_assets
+    beta = min(beta, delta)
+    shrinkage = 0.0 if beta == 0 else beta / delta
+    shrunk = (1 - shrinkage) * covariance
+    shrunk[np.diag_indices(n_assets)] += shrinkage * mu
+    return shrunk, shrinkage
+
+
+def correlation_matrix(covariance):
+    """The correlation matrix of a covariance matrix"""
+    deviations = np.sqrt(np.diag(covariance))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return covariance / np.outer(deviations, deviations)
+
+
+def _centered(values):
+    """The returns minus the mean of every asset, missing values as 0.
+    Covariances do not change with the center, but the cross products
+    keep their precision."""
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    center = filled.sum(axis=0) / np.maximum(valid.sum(axis=0), 1)
+    return np.where(valid, values - center, 0.0), valid
+
+
+def _pairwise_covariance(values):
+    """Sample covariance and correlation matrices of the columns of a 2D
+    array, every pair on the rows where both are present (like pandas
+    ``cov`` and ``corr``), from a few matrix products over all the assets"""
+    centered, valid = _centered(values)
+    cross = centered.T @ centered
+    if valid.all():
+        n_obs = values.shape[0]
+        sums = centered.sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            covariance = (cross - np.outer(sums, sums) / n_obs) / (n_obs - 1)
+        return covariance, correlation_matrix(covariance)
+
+    mask = valid.astype(np.float64)
+    counts = mask.T @ mask
+    # sums[i, j]: the sum of the returns of i where j is present
+    sums = centered.T @ mask
+    squares = (centered * centered).T @ mask
+    with np.errstate(divide="ignore", invalid="ignore"):
+        covariance = (cross - sums * sums.T / counts) / (counts - 1)
+        variances = (squares - sums * sums / counts) / (counts - 1)
+        correlation = covariance / np.sqrt(variances * variances.T)
+    covariance[counts < 2] = np.nan
+    correlation[counts < 2] = np.nan
+    return covariance, correlation
+
+
+def _frame(matrix, columns, dtype):
+    return pd.DataFrame(matrix.astype(dtype, copy=False), index=columns, columns=columns)
+
+
+def _stacked(matrices, index, columns, dtype):
+    """Stacks the (row, matrix) pairs of a generator into one DataFrame
+    indexed by date and asset, like pandas rolling / ewm ``cov()``"""
+    n_assets = columns.shape[0]
+    stacked = np.full((index.shape[0], n_assets, n_assets), np.nan, dtype=dtype)
+    for row, matrix in matrices:
+        stacked[row] = matrix
+    return pd.DataFrame(
+        stacked.reshape(-1, n_assets),
+        index=pd.MultiIndex.from_arrays(
+            [index.repeat(n_assets), np.tile(columns, index.shape[0])]
+        ),
+        columns=columns,
+    )
+
+
+class Covariance:
+    """Given an Arithmentic Returns DataFrame of many assets, will build the
+    sample covariance and correlation matrices of all of them at once with
+    matrix products (no loop over the pairs of assets).
+
+    Missing returns are handled pairwise, like pandas ``cov`` and ``corr``.
+
+    shrinkage: None, or "ledoit-wolf" to shrink the covariance towards
+    the scaled identity (as ``sklearn.covariance.LedoitWolf``), which
+    keeps the matrix well conditioned when there are many assets for
+    the number of returns. The dates with missing returns are dropped.
+
+    dtype: float32 or float64 to override the working precision
+    (see :mod:`pyinvestingsnippets.config`)
+    """
+
+    def __init__(self, pandas_obj, shrinkage=None, dtype=None):
+        self._validate(pandas_obj, shrinkage)
+        dtype = resolve_dtype(pandas_obj, dtype)
+        columns = pandas_obj.columns
+        values = pandas_obj.to_numpy(dtype=np.float64)
+        self.shrinkage = None
+        if shrinkage is None:
+            covariance, correlation = _pairwise_covariance(values)
+        else:
+            centered = values[~np.isnan(values).any(axis=1)]
+            assert centered.shape[0] >= 2, \
+                "ledoit-wolf needs at least 2 dates without missing returns"
+            centered = centered - centered.mean(axis=0)
+            n_obs = centered.shape[0]
+            norms = (centered * centered).sum(axis=1)
+            covariance, self.shrinkage = ledoit_wolf(
+                centered.T @ centered / n_obs, n_obs, norms @ norms
+            )
+            correlation = correlation_matrix(covariance)
+        self._obj = _frame(covariance, columns, dtype)
+        self._correlation = _frame(correlation, columns, dtype)
+
+    @staticmethod
+    def _validate(obj, shrinkage):
+        assert isinstance(obj, pd.DataFrame)
+        assert isinstance(obj.index, pd.DatetimeIndex)
+        assert shrinkage in SHRINKAGES, "shrinkage must be None or ledoit-wolf"
+
+    @property
+    def data(self):
+        """The covariance matrix"""
+        return self._obj
+
+    @property
+    def correlation(self):
+        """The correlation matrix"""
+        return self._correlation
+
+
+class RollingCovariance:
+    """Given an Arithmentic Returns DataFrame of many assets, will build the
+    covariance (or correlation) matrices over every trailing window of
+    rolling_window returns.
+
+    The matrices are built one date at a time by :func:`matrices`, so only
+    one matrix is held in memory: the cross products of the window are
+    updated with the returns entering and leaving it (a rank 2 update)
+    instead of being recomputed, and recomputed exactly once every
+    rolling_window dates to stop rounding errors from accumulating.
+    :attr:`data` stacks all of them like pandas ``rolling().cov()``, and
+    :attr:`latest` computes only the last window.
+
+    An asset with missing returns in a window has NaN covariances.
+
+    shrinkage: None, or "ledoit-wolf" to shrink every matrix (see
+    :class:`Covariance`). Windows where an asset misses returns are NaN.
+
+    dtype: float32 or float64 to override the working precision
+    (see :mod:`pyinvestingsnippets.config`)
+    """
+
+    def __init__(self, pandas_obj, rolling_window: int, shrinkage=None, dtype=None):
+        self._validate(pandas_obj, rolling_window, shrinkage)
+        self.rolling_window = rolling_window
+        self.shrinkage = shrinkage
+        self.dtype = resolve_dtype(pandas_obj, dtype)
+        self._returns = pandas_obj
+
+    @staticmethod
+    def _validate(obj, rolling_window: int, shrinkage):
+        assert isinstance(obj, pd.DataFrame)
+        assert isinstance(obj.index, pd.DatetimeIndex)
+        assert rolling_window > 1 and isinstance(
+            rolling_window, int
+        ), "rolling_window must be integer greater than 1"
+        assert shrinkage in SHRINKAGES, "shrinkage must be None or ledoit-wolf"
+
+    def _matrix(self, sums, cross, norms, complete):
+        """The covariance of a window from its sums of returns, cross products
+        and, for the shrinkage, the sums of norms (``norms``)"""
+        window = self.rolling_window
+        mean = sums / window
+        if self.shrinkage is None:
+            covariance = (cross - window * np.outer(mean, mean)) / (window - 1)
+            covariance[~complete, :] = np.nan
+            covariance[:, ~complete] = np.nan
+            return covariance
+        if not complete.all():
+            return np.full(cross.shape, np.nan)
+        fourth_powers, weighted_sums = norms
+        squared_mean = mean @ mean
+        fourth_moment = (
+            fourth_powers + 4 * mean @ cross @ mean - 4 * mean @ weighted_sums
+            + 2 * squared_mean * np.trace(cross) - 3 * window * squared_mean ** 2
+        )
+        covariance, _ = ledoit_wolf(
+            cross / window - np.outer(mean, mean), window, fourth_moment
+        )
+        return covariance
+
+    def matrices(self, correlation: bool = False):
+        """Yields the date and the covariance (or correlation) matrix of every
+        window, from the first full window on"""
+        columns = self._returns.columns
+        for row, covariance in self._matrices(correlation):
+            yield self._returns.index[row], _frame(covariance, columns, self.dtype)
+
+    def _matrices(self, correlation):
+        """Yields the row and the matrix (an array) of every full window"""
+        window = self.rolling_window
+        centered, valid = _centered(self._returns.to_numpy(dtype=np.float64))
+        missing = rolling_sum((~valid).astype(np.int64), window)
+        signs = np.array([[1.0], [-1.0]])
+        norms = None
+        for end in range(window - 1, centered.shape[0]):
+            start = end - window + 1
+            if start % window == 0:
+                block = centered[start:end + 1]
+                sums = block.sum(axis=0)
+                cross = block.T @ block
+                if self.shrinkage is not None:
+                    squared_norms = (block * block).sum(axis=1)
+                    norms = [squared_norms @ squared_norms, squared_norms @ block]
+            else:
+                entering, leaving = centered[end], centered[start - 1]
+                moving = np.stack((entering, leaving))
+                sums += entering - leaving
+                cross += moving.T @ (moving * signs)
+                if self.shrinkage is not None:
+                    squared_norms = (moving * moving).sum(axis=1)
+                    norms[0] += squared_norms[0] ** 2 - squared_norms[1] ** 2
+                    norms[1] += (squared_norms * signs[:, 0]) @ moving
+            covariance = self._matrix(sums, cross, norms, missing[end] == 0)
+            if correlation:
+                covariance = correlation_matrix(covariance)
+            yield end, covariance
+
+    @property
+    def latest(self):
+        """The covariance matrix of the last window"""
+        window = self.rolling_window
+        last = self._returns.iloc[-window:]
+        if last.shape[0] < window:
+            columns = self._returns.columns
+            return _frame(np.full((columns.shape[0],) * 2, np.nan), columns, self.dtype)
+        rolling = RollingCovariance(last, window, self.shrinkage, self.dtype)
+        return next(rolling.matrices())[1]
+
+    @property
+    def data(self):
+        """The covariance matrices of all the dates, indexed by date and asset
+        (NaN before the first full window). Holds n_dates x n_assets^2 values."""
+        return _stacked(
+            self._matrices(False), self._returns.index, self._returns.columns, self.dtype
+        )
+
+
+class EWMCovariance:
+    """Given an Arithmentic Returns DataFrame of many assets, will build the
+    exponentially weighted covariance (or correlation) matrices of every
+    date, with the weights of ``ewm(alpha=decay_factor)``, so matrices
+    are the same as pandas ``ewm(alpha=decay_factor).cov(bias=bias)``.
+
+    The matrices are built one date at a time by :func:`matrices`, every
+    date updating the weighted cross products of the previous one, so only
+    one matrix is held in memory. :attr:`latest` computes the last matrix
+    directly with a few weighted matrix products, and :attr:`data` stacks
+    all of them.
+
+    Missing returns are handled pairwise like pandas. The correlations are
+    the covariances over the product of the volatilities of the assets.
+
+    dtype: float32 or float64 to override the working precision
+    (see :mod:`pyinvestingsnippets.config`)
+    """
+
+    def __init__(self, pandas_obj, decay_factor=0.06, bias: bool = False, dtype=None):
+        self._validate(pandas_obj, decay_factor)
+        self.decay_factor = decay_factor
+        self.bias = bias
+        self.dtype = resolve_dtype(pandas_obj, dtype)
+        self._returns = pandas_obj
+
+    @staticmethod
+    def _validate(obj, decay_factor):
+        assert isinstance(obj, pd.DataFrame)
+        assert isinstance(obj.index, pd.DatetimeIndex)
+        assert (
+            decay_factor > 0 and decay_factor <= 1
+        ), "Smoothing Factor must be 0 < f <= 1"
+
+    def _matrix(self, cross, sums, weights, squared_weights):
+        """The covariance from the weighted cross products and sums of the
+        returns, and the sums of the weights and of the squared weights
+        (matrices for pairwise missing returns, else scalars)"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = sums / weights
+            covariance = cross / weights - means * means.T
+            if not self.bias:
+                covariance = covariance * weights ** 2 / (weights ** 2 - squared_weights)
+        covariance = np.broadcast_to(covariance, cross.shape).copy()
+        covariance[~np.isfinite(covariance)] = np.nan
+        return covariance
+
+    def matrices(self, correlation: bool = False):
+        """Yields the date and the covariance (or correlation) matrix of every date"""
+        columns = self._returns.columns
+        for row, covariance in self._matrices(correlation):
+            yield self._returns.index[row], _frame(covariance, columns, self.dtype)
+
+    def _matrices(self, correlation):
+        """Yields the row and the matrix (an array) of every date"""
+        n_assets = self._returns.columns.shape[0]
+        centered, valid = _centered(self._returns.to_numpy(dtype=np.float64))
+        pairwise = not valid.all()
+        decay = 1 - self.decay_factor
+        cross = np.zeros((n_assets, n_assets))
+        sums = np.zeros((n_assets, n_assets) if pairwise else (n_assets, 1))
+        weights = np.zeros((n_assets, n_assets)) if pairwise else 0.0
+        squared_weights = np.zeros((n_assets, n_assets)) if pairwise else 0.0
+        for row in range(centered.shape[0]):
+            returns = centered[row]
+            cross *= decay
+            cross += np.outer(returns, returns)
+            sums *= decay
+            if pairwise:
+                present = valid[row].astype(np.float64)
+                pairs = np.outer(present, present)
+                sums += np.outer(returns, present)
+                weights *= decay
+                weights += pairs
+                squared_weights *= decay ** 2
+                squared_weights += pairs
+            else:
+                sums += returns[:, None]
+                weights = decay * weights + 1
+                squared_weights = decay ** 2 * squared_weights + 1
+            covariance = self._matrix(cross, sums, weights, squared_weights)
+            if correlation:
+                covariance = correlation_matrix(covariance)
+            yield row, covariance
+
+    @property
+    def latest(self):
+        """The covariance matrix of the last date"""
+        columns = self._returns.columns
+        centered, valid = _centered(self._returns.to_numpy(dtype=np.float64))
+        decay = 1 - self.decay_factor
+        row_weights = decay ** np.arange(centered.shape[0] - 1, -1, -1, dtype=np.float64)
+        weighted = centered * row_weights[:, None]
+        cross = weighted.T @ centered
+        if valid.all():
+            sums = weighted.sum(axis=0)[:, None]
+            weights = row_weights.sum()
+            squared_weights = row_weights @ row_weights
+        else:
+            present = valid.astype(np.float64)
+            sums = weighted.T @ present
+            weights = (present * row_weights[:, None]).T @ present
+            squared_weights = (present * (row_weights ** 2)[:, None]).T @ present
+        return _frame(
+            self._matrix(cross, sums, weights, squared_weights), columns, self.dtype
+        )
+
+    @property
+    def data(self):
+        """The covariance matrices of all the dates, indexed by date and asset.
+        Holds n_dates x n_assets^2 values."""
+        return _stacked(
+            self._matrices(False), self._returns.index, self._returns.columns, self.dtype
+        )
@@ -1,24 +1,61 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mtick
+import numpy as np
+
+from pyinvestingsnippets.config import resolve_dtype, wrap
+
+
+def exponentially_weighted_semi_deviation(values, decay_factor, threshold, dtype):
+    """Exponentially weighted semi-deviation of every column of a 2D array.
+
+    The squared shortfalls below ``threshold`` and the weights of the
+    valid observations go through one first order recursion
+    (``scipy.signal.lfilter``) together, and their ratio is the weighted
+    second lower partial moment, with the same (adjusted) weights as
+    ``ewm(alpha=decay_factor).mean()``. Missing values carry no weight.
+    """
+    from scipy.signal import lfilter
+
+    values = values.astype(dtype, copy=False)
+    valid = ~np.isnan(values)
+    shortfall = np.minimum(np.where(valid, values - threshold, 0), 0)
+    stacked = np.concatenate((shortfall * shortfall, valid.astype(dtype)), axis=1)
+    decay = dtype.type(1 - decay_factor)
+    filtered = lfilter(
+        np.ones(1, dtype=dtype), np.array([1, -decay], dtype=dtype), stacked, axis=0
+    )
+    squares, weights = np.split(filtered, 2, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.sqrt(squares / weights)
 
 
 class ExponantiallyWeightedDownsideRisk:
     """A measure of variability derived from volatility of returns is
     the downside risk, the volatility computed only on negative returns
     (or returns below a given threshold)
+
+    This is the exponentially weighted semi-deviation: the root of the
+    weighted mean of the squared shortfalls below threshold (the minimum
+    acceptable return per period), annualized with window. Returns above
+    threshold count as no shortfall. Every column of a DataFrame is
+    computed in the same recursion.
+
+    dtype: float32 or float64 to override the working precision
+    (see :mod:`pyinvestingsnippets.config`)
     """
 
-    def __init__(self, pandas_obj, decay_factor=0.05, window=252) -> None:
+    def __init__(
+        self, pandas_obj, decay_factor=0.05, window=252, threshold=0.0, dtype=None
+    ) -> None:
         self._validate(pandas_obj, decay_factor, window)
         self.decay_factor = decay_factor
         self.window = window
-        self.downside_risk = (
-            pandas_obj[pandas_obj < 0]
-            .ewm(alpha=decay_factor)
-            .std()
-            .apply(lambda x: x * window ** 0.5)
-        )
+        self.threshold = threshold
+        dtype = resolve_dtype(pandas_obj, dtype)
+        values = pandas_obj.to_numpy(dtype=dtype)
+        risk = exponentially_weighted_semi_deviation(
+            values.reshape(values.shape[0], -1), decay_factor, threshold, dtype
+        ) * dtype.type(window ** 0.5)
+        self.downside_risk = wrap(pandas_obj, risk)
 
     @staticmethod
     def _validate(obj, decay_factor, window):
@@ -28,7 +65,13 @@ class ExponantiallyWeightedDownsideRisk:
         ), "Smoothing Factor must be 0 < f <= 1"
         assert window > 0 and isinstance(window, int), "window must be > 0"
 
+    @property
+    def data(self):
+        return self.downside_risk
+
     def plot(self, ax=None, **kwargs):  # pragma: no cover
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as mtick
         if ax is None:
             ax = plt.gca()
 
@@ -1,6 +1,3 @@
-import matplotlib.pyplot as plt
-
-
 class RollingBetaCovariance:
     """
     Given a Returns Series calculates the beta.
@@ -41,6 +38,7 @@ class RollingBetaCovariance:
         return self.rolling_beta
 
     def plot(self, ax=None, **kwargs):  # pragma: no cover
+        import matplotlib.pyplot as plt
         if ax is None:
             ax = plt.gca()
 
@@ -1,7 +1,8 @@
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from sklearn.linear_model import LinearRegression
+
+from pyinvestingsnippets.config import wrap
+from pyinvestingsnippets.utilities._rolling import rolling_sum
 
 
 class RollingBetaRegression:
@@ -14,6 +15,13 @@ class RollingBetaRegression:
     a is the y-intercept or constant, and b is the slope of the line.
 
     We use the lenear regression formula in this implementation.
+    The ordinary least squares fit of every window is computed at once
+    from rolling sums, so the cost is linear in the number of observations.
+    The dependent variable can also be a DataFrame of several stocks.
+
+    The dates without a market return, or without any stock return, are
+    dropped. Any other missing stock return is masked in the rolling sums:
+    the windows holding it are NaN for that stock only.
     """
 
     def __init__(self, independent_variable, dependent_variable, window):
@@ -21,31 +29,71 @@ class RollingBetaRegression:
         Calculates the rolling beta of a Stock over the
         Benchmark index using linear regression
 
+        Every regression is fitted on the ``window + 1`` most recent observations.
+
         Parameters
         ----------
         independent_variable : Market Returns
-        dependent_variable : Stock Returns
+        dependent_variable : Stock Returns (Series or DataFrame)
         window : rolling window
         """
-
+        self._validate(independent_variable, dependent_variable, window)
         self.independent_variable = independent_variable.dropna()
-        self.dependent_variable = dependent_variable.dropna()
+        self.dependent_variable = dependent_variable.dropna(how="all")
         self.window = window
 
-        obs = len(self.independent_variable)
-        betas = np.full(obs, np.nan)
-        alphas = np.full(obs, np.nan)
-
-        for i in range((obs - window)):
-            model = LinearRegression().fit(
-                self.independent_variable.to_numpy()[i: i + window + 1].reshape(-1, 1),
-                self.dependent_variable.to_numpy()[i: i + window + 1],
+        x, y = self.independent_variable.align(
+            self.dependent_variable, join="inner", axis=0
+        )
+        length = window + 1
+        x_values = x.to_numpy(dtype=float).reshape(-1, 1)
+        y_values = y.to_numpy(dtype=float).reshape(x_values.shape[0], -1)
+        y_valid = ~np.isnan(y_values)
+        betas = np.full(y_values.shape, np.nan)
+        alphas = np.full(y_values.shape, np.nan)
+        r_squared = np.full(y_values.shape, np.nan)
+        std_errors = np.full(y_values.shape, np.nan)
+
+        if x_values.shape[0] >= length:
+            # centering keeps the sums of squares small and well conditioned
+            x_mean = x_values.mean(axis=0)
+            y_mean = np.where(y_valid, y_values, 0).sum(axis=0) / np.maximum(
+                y_valid.sum(axis=0), 1
             )
-
-            betas[i + window] = model.coef_[0]
-            alphas[i + window] = model.intercept_
-
-        self.rolling_beta = pd.Series(data=betas, index=self.independent_variable.index)
+            # the market is only counted where the stock has a return
+            x_c = np.where(y_valid, x_values - x_mean, 0.0)
+            y_c = np.where(y_valid, y_values - y_mean, 0.0)
+            sum_x = rolling_sum(x_c, length)
+            sum_y = rolling_sum(y_c, length)
+            sum_xx = rolling_sum(x_c * x_c, length)
+            sum_yy = rolling_sum(y_c * y_c, length)
+            sum_xy = rolling_sum(x_c * y_c, length)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                s_xx = sum_xx - sum_x * sum_x / length
+                s_yy = sum_yy - sum_y * sum_y / length
+                s_xy = sum_xy - sum_x * sum_y / length
+                betas = s_xy / s_xx
+                alphas = (sum_y / length + y_mean) - betas * (sum_x / length + x_mean)
+                r_squared = s_xy * s_xy / (s_xx * s_yy)
+                residuals = np.clip(s_yy - betas * s_xy, 0, None)
+                std_errors = np.sqrt(residuals / (length - 2) / s_xx)
+            gaps = rolling_sum((~y_valid).astype(np.int64), length) != 0
+            for values in (betas, alphas, r_squared, std_errors):
+                values[gaps] = np.nan
+
+        self.rolling_beta = wrap(y, betas)
+        self.rolling_alpha = wrap(y, alphas)
+        self.rolling_r_squared = wrap(y, r_squared)
+        self.rolling_std_error = wrap(y, std_errors)
+
+    @staticmethod
+    def _validate(independent_variable, dependent_variable, window):
+        assert isinstance(independent_variable.index, pd.DatetimeIndex)
+        assert isinstance(dependent_variable.index, pd.DatetimeIndex)
+        assert window > 0 and isinstance(
+            window, int
+        ), "window must be possitive integer"
 
     @property
     def data(self):
@@ -56,7 +104,35 @@ class RollingBetaRegression:
         """
         return self.rolling_beta
 
+    @property
+    def alpha(self):
+        """
+        Returns
+        -------
+        pd.Series : The rolling intercept (alpha) series
+        """
+        return self.rolling_alpha
+
+    @property
+    def r_squared(self):
+        """
+        Returns
+        -------
+        pd.Series : The rolling coefficient of determination
+        """
+        return self.rolling_r_squared
+
+    @property
+    def std_error(self):
+        """
+        Returns
+        -------
+        pd.Series : The rolling standard error of the beta
+        """
+        return self.rolling_std_error
+
     def plot(self, ax=None, **kwargs):  # pragma: no cover
+        import matplotlib.pyplot as plt
         if ax is None:
             ax = plt.gca()
 
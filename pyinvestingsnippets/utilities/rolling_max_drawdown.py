@@ -0,0 +1,119 @@
+import pandas as pd
+import numpy as np
+
+from pyinvestingsnippets.config import resolve_dtype, wrap
+from pyinvestingsnippets.utilities._rolling import rolling_sum
+
+
+def _rolling_max_drawdown(wealth, window):
+    """Maximum drawdown inside every trailing window of a 2D wealth array.
+
+    The rows are cut in blocks of ``window`` rows, so every window is the
+    suffix of a block followed by the prefix of the next one. The drawdowns
+    inside every prefix and every suffix, and the running peaks and troughs,
+    come from cumulative max/min scans along the blocks (the van Herk /
+    Gil-Werman scheme), and the worst drawdown of a window is the worst of
+    its suffix, its prefix and the fall from the suffix peak to the prefix
+    trough. The cost is linear whatever the window. Windows holding a NaN
+    and the first ``window - 1`` rows are NaN.
+    """
+    n_obs, n_cols = wealth.shape
+    drawdowns = np.full(wealth.shape, np.nan, dtype=wealth.dtype)
+    if n_obs < window:
+        return drawdowns
+
+    is_nan = np.isnan(wealth)
+    n_blocks = -(-n_obs // window)
+    padded = np.ones((n_blocks * window, n_cols), dtype=wealth.dtype)
+    padded[:n_obs] = np.where(is_nan, 1.0, wealth)
+    blocks = padded.reshape(n_blocks, window, n_cols)
+    backwards = blocks[:, ::-1]
+
+    prefix_min = np.minimum.accumulate(blocks, axis=1)
+    prefix_drawdown = np.minimum.accumulate(
+        blocks / np.maximum.accumulate(blocks, axis=1) - 1, axis=1
+    )
+    suffix_max = np.maximum.accumulate(backwards, axis=1)[:, ::-1]
+    suffix_drawdown = np.minimum.accumulate(
+        np.minimum.accumulate(backwards, axis=1) / backwards - 1, axis=1
+    )[:, ::-1]
+
+    prefix_min, prefix_drawdown, suffix_max, suffix_drawdown = (
+        scan.reshape(-1, n_cols)
+        for scan in (prefix_min, prefix_drawdown, suffix_max, suffix_drawdown)
+    )
+    end = np.arange(window - 1, n_obs)
+    start = end - window + 1
+    spanning = np.minimum(
+        np.minimum(suffix_drawdown[start], prefix_drawdown[end]),
+        prefix_min[end] / suffix_max[start] - 1,
+    )
+    # windows aligned on a block are a whole prefix
+    aligned = (start % window == 0)[:, None]
+    drawdowns[window - 1:] = np.where(aligned, prefix_drawdown[end], spanning)
+    drawdowns[rolling_sum(is_nan.astype(np.int64), window) > 0] = np.nan
+    return drawdowns
+
+
+class RollingMaxDrawdown:
+    """Given a Wealth Index (or Prices) Series or DataFrame, will build the
+    maximum drawdown within every trailing window of rolling_window periods,
+    so 252 gives the trailing 1 year max drawdown of daily data.
+
+    The drawdowns are negative, like ``Drawdown.max_drawdown``, and every
+    column is processed at once in linear time.
+
+    dtype: float32 or float64 to override the working precision
+    (see :mod:`pyinvestingsnippets.config`)
+    """
+
+    def __init__(self, pandas_obj, rolling_window: int = 252, dtype=None):
+        self._validate(pandas_obj, rolling_window)
+        self.rolling_window = rolling_window
+        wealth = pandas_obj.fillna(method="pad").to_numpy(
+            dtype=resolve_dtype(pandas_obj, dtype)
+        )
+        drawdowns = _rolling_max_drawdown(
+            wealth.reshape(wealth.shape[0], -1), rolling_window
+        )
+        self._obj = wrap(pandas_obj, drawdowns)
+
+    @staticmethod
+    def _validate(obj, rolling_window: int):
+        assert isinstance(obj.index, pd.DatetimeIndex)
+        assert rolling_window > 0 and isinstance(
+            rolling_window, int
+        ), "rolling_window must be possitive integer"
+
+    @property
+    def data(self):
+        return self._obj
+
+    def plot(self, ax=None, **kwargs):  # pragma: no cover
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as mtick
+        if ax is None:
+            ax = plt.gca()
+
+        to_plot = self._obj * 100
+        to_plot.plot(lw=2, x_compat=True, ax=ax, **kwargs)
+        ax.yaxis.grid(linestyle=":")
+        ax.xaxis.grid(linestyle=":")
+        ax.set_ylabel("")
+        ax.set_xlabel("")
+        ax.xaxis.grid(False)
+        if 'label' in kwargs:
+            ax.legend(loc="best")
+
+        ax.yaxis.set_major_formatter(mtick.PercentFormatter())
+        ax.xaxis.set_tick_params(reset=True)
+        ax.tick_params(axis='x', labelrotation=45)
+
+        ax.set_title(f"Rolling Max Drawdown - {self.rolling_window}", fontweight="bold")
+        return ax
+
+    def plotly(self, **kwargs):  # pragma: no cover
+        import plotly.express as px
+        fig = px.line(self._obj, **kwargs)
+        fig.layout.yaxis.tickformat = '.1%'
+        return fig
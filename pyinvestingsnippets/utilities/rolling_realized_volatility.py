@@ -1,7 +1,5 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mtick
 
 
 class RollingRealizedVolatility:
@@ -45,6 +43,8 @@ class RollingRealizedVolatility:
         return self._obj
 
     def plot(self, ax=None, **kwargs):  # pragma: no cover
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as mtick
         if ax is None:
             ax = plt.gca()
 
@@ -1,19 +1,48 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mtick
-import plotly.express as px
+
+from pyinvestingsnippets.config import resolve_dtype, wrap
+from pyinvestingsnippets.utilities._rolling import rolling_sum
+
+
+def _rolling_growth(growth, window):
+    """Rolling product of the growth factors (1 + r) of every column.
+
+    The product is rebuilt from rolling sums of log(|1 + r|), so the cost is
+    linear whatever the window. Zero factors (-100% returns) and negative
+    factors are counted separately to keep the exact value and sign, and any
+    NaN in the window gives NaN like ``rolling().apply(np.prod)`` does.
+    """
+    is_nan = np.isnan(growth)
+    is_zero = growth == 0
+    is_negative = growth < 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_growth = np.log(np.abs(np.where(is_nan | is_zero, 1.0, growth)))
+
+    nan_count = rolling_sum(is_nan.astype(np.int64), window)
+    zero_count = rolling_sum(is_zero.astype(np.int64), window)
+    negative_count = rolling_sum(is_negative.astype(np.int64), window)
+    sign = np.where(negative_count % 2 == 1, -1.0, 1.0).astype(growth.dtype)
+
+    product = sign * np.exp(rolling_sum(log_growth, window))
+    product[zero_count > 0] = 0.0
+    product[nan_count != 0] = np.nan
+    return product
 
 
 class RollingReturns:
-    """Given a Returns Series, will build the rolling returns using window"""
+    """Given a Returns Series or DataFrame,
+    will build the rolling returns using window
+
+    dtype: float32 or float64 to override the working precision
+    (see :mod:`pyinvestingsnippets.config`)"""
 
-    def __init__(self, pandas_obj, rolling_window: int = 252):
+    def __init__(self, pandas_obj, rolling_window: int = 252, dtype=None):
         self._validate(pandas_obj, rolling_window)
         self.window = rolling_window
-        self._obj = (1 + pandas_obj).rolling(window=rolling_window).apply(
-            np.prod, raw=True
-        ) - 1
+        growth = (1 + pandas_obj).to_numpy(dtype=resolve_dtype(pandas_obj, dtype))
+        rolling_growth = _rolling_growth(growth.reshape(growth.shape[0], -1), rolling_window)
+        self._obj = wrap(pandas_obj, rolling_growth - 1)
 
     @staticmethod
     def _validate(obj, rolling_window: int):
@@ -27,6 +56,8 @@ class RollingReturns:
         return self._obj
 
     def plot(self, ax=None, **kwargs):  # pragma: no cover
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as mtick
         if ax is None:
             ax = plt.gca()
 
@@ -57,4 +88,5 @@ class RollingReturns:
         return ax
 
     def plotly(self, **kwargs):  # pragma: no cover
+        import plotly.express as px
         return px.line(self._obj, **kwargs)
@@ -0,0 +1,82 @@
+import pandas as pd
+import numpy as np
+
+from pyinvestingsnippets.config import wrap
+from pyinvestingsnippets.utilities._rolling import excess_returns, rolling_mean_std
+
+
+class RollingSharpe:
+    """Given an Arithmentic Returns Series or DataFrame, will build the
+    rolling annualized Sharpe ratio: the mean excess return over its
+    standard deviation in every window, times the square root of window.
+
+    rolling_window: The periods to roll, like in RollingVolatility.
+
+    window: The periods per year used for the annualization
+    (252 for daily returns, 52 for weekly, 12 for monthly).
+
+    rf_per_period: The risk free rate of one period (not annual), either
+    a number or a Series over the same dates as the returns.
+
+    dtype: float32 or float64 to override the working precision
+    (see :mod:`pyinvestingsnippets.config`)
+
+    Every column is computed at once from rolling sums, so the cost does
+    not depend on rolling_window.
+    """
+
+    def __init__(
+        self,
+        pandas_obj,
+        rolling_window: int,
+        window: int = 252,
+        rf_per_period=0.0,
+        dtype=None,
+    ):
+        self._validate(pandas_obj, rolling_window, window)
+        self.rolling_window = rolling_window
+        mean, std = rolling_mean_std(
+            excess_returns(pandas_obj, rf_per_period, dtype), rolling_window
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = mean / std * window ** 0.5
+        self._obj = wrap(pandas_obj, sharpe)
+
+    @staticmethod
+    def _validate(obj, rolling_window: int, window: int):
+        assert isinstance(obj.index, pd.DatetimeIndex)
+        assert rolling_window > 1 and isinstance(
+            rolling_window, int
+        ), "rolling_window must be integer greater than 1"
+        assert window > 0 and isinstance(
+            window, int
+        ), "window must be possitive integer"
+
+    @property
+    def data(self):
+        return self._obj
+
+    def plot(self, ax=None, **kwargs):  # pragma: no cover
+        import matplotlib.pyplot as plt
+        if ax is None:
+            ax = plt.gca()
+
+        self._obj.plot(lw=2, x_compat=True, ax=ax, **kwargs)
+        ax.yaxis.grid(linestyle=":")
+        ax.xaxis.grid(linestyle=":")
+        ax.set_ylabel("")
+        ax.set_xlabel("")
+        ax.xaxis.grid(False)
+        if 'label' in kwargs:
+            ax.legend(loc="best")
+
+        ax.axhline(y=0, color="black", lw=1)
+        ax.xaxis.set_tick_params(reset=True)
+        ax.tick_params(axis='x', labelrotation=45)
+
+        ax.set_title(f"Rolling Sharpe - {self.rolling_window}", fontweight="bold")
+        return ax
+
+    def plotly(self, **kwargs):  # pragma: no cover
+        import plotly.express as px
+        return px.line(self._obj, **kwargs)
@@ -0,0 +1,88 @@
+import pandas as pd
+import numpy as np
+
+from pyinvestingsnippets.config import resolve_dtype, wrap
+from pyinvestingsnippets.extensions.srri import SRRI
+from pyinvestingsnippets.utilities._rolling import rolling_mean_std
+
+
+class RollingSRRI:
+    """Given daily (or any higher frequency) Prices or a Wealth Index,
+    Series or DataFrame, will build the monthly history of the SRRI
+    volatility over the trailing 5 years, for every fund at once.
+
+    frequency: the returns the volatility is measured on, weekly ("W",
+    260 returns) or monthly ("M", 60 returns), as in :class:`SRRI`.
+
+    The history has one value per month end: the SRRI of the 5 years
+    ending at that month. All the windows come from rolling sums, so the
+    cost is linear in the length of the history. Windows with missing
+    returns are NaN. Months without prices repeat the previous month.
+
+    dtype: float32 or float64 to override the working precision
+    (see :mod:`pyinvestingsnippets.config`)
+    """
+
+    def __init__(self, pandas_obj, frequency: str = "W", dtype=None):
+        self._validate(pandas_obj, frequency)
+        self.frequency = frequency
+        # the periods without prices (a gap in the data) are dropped, so the
+        # return after them spans the gap instead of becoming NaN
+        returns = (
+            pandas_obj.fillna(method="pad").resample(frequency).last()
+            .dropna(how="all").pct_change()
+        )
+        values = returns.to_numpy(dtype=resolve_dtype(pandas_obj, dtype))
+        _, std = rolling_mean_std(
+            values.reshape(values.shape[0], -1), SRRI.PERIODS[frequency]
+        )
+        volatility = std * np.sqrt(SRRI.PERIODS_PER_YEAR[frequency])
+        volatility = wrap(returns, volatility)
+        # a month without prices keeps the SRRI of the previous month
+        monthly = volatility.resample("M")
+        last = monthly.last()
+        self._obj = last.mask(monthly.size() == 0, last.fillna(method="pad"), axis=0)
+
+    @staticmethod
+    def _validate(obj, frequency):
+        assert isinstance(obj.index, pd.DatetimeIndex)
+        assert frequency in SRRI.PERIODS, "frequency must be W or M"
+
+    @property
+    def data(self):
+        """The monthly SRRI volatility"""
+        return self._obj
+
+    @property
+    def risk_class(self):
+        """The monthly SRRI risk class, 0 while there is no SRRI"""
+        return SRRI.classify(self._obj)
+
+    def plot(self, ax=None, **kwargs):  # pragma: no cover
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as mtick
+        if ax is None:
+            ax = plt.gca()
+
+        to_plot = self._obj * 100
+        to_plot.plot(lw=2, x_compat=True, ax=ax, **kwargs)
+        ax.yaxis.grid(linestyle=":")
+        ax.xaxis.grid(linestyle=":")
+        ax.set_ylabel("")
+        ax.set_xlabel("")
+        ax.xaxis.grid(False)
+        if 'label' in kwargs:
+            ax.legend(loc="best")
+
+        ax.yaxis.set_major_formatter(mtick.PercentFormatter())
+        ax.xaxis.set_tick_params(reset=True)
+        ax.tick_params(axis='x', labelrotation=45)
+
+        ax.set_title(f"Rolling SRRI - {self.frequency}", fontweight="bold")
+        return ax
+
+    def plotly(self, **kwargs):  # pragma: no cover
+        import plotly.express as px
+        fig = px.line(self._obj, **kwargs)
+        fig.layout.yaxis.tickformat = '.1%'
+        return fig
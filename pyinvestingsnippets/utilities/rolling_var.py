@@ -0,0 +1,245 @@
+import pandas as pd
+import numpy as np
+
+from pyinvestingsnippets.config import resolve_dtype, wrap
+from pyinvestingsnippets.utilities._rolling import rolling_sum
+
+
+# cells of the input processed at once, bounds the memory of the structure
+_CHUNK_CELLS = 1 << 20
+
+
+def _wavelet_levels(ranks, weights, n_bits):
+    """Walks the levels of a wavelet matrix built over ``ranks``.
+
+    Every level yields the bit it splits on, the prefix count of the
+    elements going to the zeros half and the prefix sum of their weights.
+    The sequence is then stably partitioned (zeros first) for the next level,
+    so one level costs a couple of linear passes.
+    """
+    n_items = ranks.shape[0]
+    zero_counts = np.zeros(n_items + 1, dtype=np.int64)
+    zero_sums = np.zeros(n_items + 1)
+    for level in range(n_bits - 1, -1, -1):
+        ones = ((ranks >> level) & 1).astype(bool)
+        zeros = ~ones
+        np.cumsum(zeros, out=zero_counts[1:])
+        if weights is not None:
+            np.cumsum(np.where(zeros, weights, 0), dtype=np.float64, out=zero_sums[1:])
+        yield level, zero_counts, zero_sums
+        order = np.concatenate((np.flatnonzero(zeros), np.flatnonzero(ones)))
+        ranks = ranks[order]
+        if weights is not None:
+            weights = weights[order]
+
+
+def _kth_smallest(ranks, n_bits, left, right, k):
+    """Rank of the k-th (0 based) smallest rank in every [left, right) range"""
+    left, right, k = left.copy(), right.copy(), k.copy()
+    found = np.zeros(k.shape[0], dtype=np.int64)
+    for level, zero_counts, _ in _wavelet_levels(ranks, None, n_bits):
+        n_zeros = zero_counts[-1]
+        zeros_left = zero_counts[left]
+        zeros_right = zero_counts[right]
+        in_zeros = zeros_right - zeros_left
+        go_zeros = k < in_zeros
+        left = np.where(go_zeros, zeros_left, n_zeros + left - zeros_left)
+        right = np.where(go_zeros, zeros_right, n_zeros + right - zeros_right)
+        k = np.where(go_zeros, k, k - in_zeros)
+        found |= (~go_zeros).astype(np.int64) << level
+    return found
+
+
+def _count_and_sum_below(ranks, weights, n_bits, left, right, bound):
+    """Number and weight sum of the ranks lower than ``bound`` in every range"""
+    left, right = left.copy(), right.copy()
+    count = np.zeros(left.shape[0], dtype=np.int64)
+    total = np.zeros(left.shape[0])
+    for level, zero_counts, zero_sums in _wavelet_levels(ranks, weights, n_bits):
+        n_zeros = zero_counts[-1]
+        zeros_left = zero_counts[left]
+        zeros_right = zero_counts[right]
+        go_ones = ((bound >> level) & 1).astype(bool)
+        count += np.where(go_ones, zeros_right - zeros_left, 0)
+        total += np.where(go_ones, zero_sums[right] - zero_sums[left], 0.0)
+        left = np.where(go_ones, n_zeros + left - zeros_left, zeros_left)
+        right = np.where(go_ones, n_zeros + right - zeros_right, zeros_right)
+    return count, total
+
+
+def _rolling_tail_risk_chunk(values, window, percentile, observations, min_periods):
+    n_obs, n_cols = values.shape
+    var = np.full(n_obs * n_cols, np.nan, dtype=values.dtype)
+    cvar = np.full(n_obs * n_cols, np.nan, dtype=values.dtype)
+
+    # column major, so every window is a contiguous range of positions
+    flat = values.T.ravel()
+    column = np.repeat(np.arange(n_cols), n_obs)
+    # unique ranks ordered by column then value, NaN last in every column
+    order = np.lexsort((flat, column))
+    ranks = np.empty(flat.shape[0], dtype=np.int64)
+    ranks[order] = np.arange(flat.shape[0])
+    by_rank = flat[order]
+    n_bits = int(flat.shape[0]).bit_length()
+
+    # last rank holding the same value as every rank, to keep the ties together
+    run_start = np.ones(flat.shape[0], dtype=bool)
+    run_start[1:] = (by_rank[1:] != by_rank[:-1]) | (column[1:] != column[:-1])
+    run_end = np.flatnonzero(np.r_[run_start[1:], True])
+    tie_end = run_end[np.cumsum(run_start) - 1]
+
+    count = observations.T.ravel()
+    query = np.flatnonzero(count >= min_periods)
+    count = count[query]
+    right = query + 1
+    left = query - np.minimum(query % n_obs, window - 1)
+
+    position = percentile / 100 * (count - 1)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, count - 1)
+    found = _kth_smallest(
+        ranks, n_bits, np.r_[left, left], np.r_[right, right], np.r_[lower, upper]
+    )
+    lower_rank, upper_rank = found[: query.shape[0]], found[query.shape[0]:]
+    low, high = by_rank[lower_rank], by_rank[upper_rank]
+    quantile = low + (high - low) * (position - lower)
+
+    bound = np.where(quantile >= high, tie_end[upper_rank], tie_end[lower_rank]) + 1
+    weights = np.where(np.isnan(flat), 0.0, flat)
+    below, total = _count_and_sum_below(ranks, weights, n_bits, left, right, bound)
+
+    var[query] = -quantile
+    cvar[query] = -total / below
+    return var.reshape(n_cols, n_obs).T, cvar.reshape(n_cols, n_obs).T
+
+
+def rolling_tail_risk(values, window, percentile, min_periods):
+    """Rolling historic VaR and CVaR of every column of a 2D returns array.
+
+    All the windows of a column are answered at once from a wavelet matrix
+    over the ranks of the returns: the order statistics and the sum of the
+    returns in the tail of any window take one walk over the log2(n) levels,
+    so the cost is O(n log n) whatever the window, without sorting every
+    window. The quantiles are interpolated linearly like ``np.percentile``,
+    missing values are skipped and windows with less than ``min_periods``
+    returns are NaN.
+
+    Returns
+    -------
+    tuple of two 2D arrays (observations x columns): VaR and CVaR,
+    both as positive losses
+    """
+    n_obs, n_cols = values.shape
+    var = np.full(values.shape, np.nan, dtype=values.dtype)
+    cvar = np.full(values.shape, np.nan, dtype=values.dtype)
+    valid = (~np.isnan(values)).astype(np.int64)
+    # the leading windows are partial, as with rolling(min_periods=...)
+    observations = rolling_sum(np.r_[np.zeros((window - 1, n_cols), np.int64), valid],
+                               window)[window - 1:].astype(np.int64)
+
+    step = max(1, _CHUNK_CELLS // max(n_obs, 1))
+    for start in range(0, n_cols, step):
+        columns = slice(start, start + step)
+        var[:, columns], cvar[:, columns] = _rolling_tail_risk_chunk(
+            values[:, columns], window, percentile, observations[:, columns], min_periods
+        )
+    return var, cvar
+
+
+class RollingVaR:
+    """Given an Arithmentic Returns Series or DataFrame, will build the
+    rolling historic Value at Risk (VaR) and Conditional VaR (CVaR),
+    both as positive losses like ``Returns.var`` and ``Returns.cvar``.
+
+    rolling_window: The periods to roll. For a 1 year VaR on daily
+    returns it will be 252.
+
+    percentile: The percentile of the returns, between 0 and 100.
+    A 99% VaR is the percentile 1.
+
+    min_periods: Minimum number of (non missing) returns in a window
+    to have a value. Defaults to rolling_window.
+
+    dtype: float32 or float64 to override the working precision
+    (see :mod:`pyinvestingsnippets.config`)
+
+    All the windows are computed together without sorting each of them,
+    so long histories and wide DataFrames stay cheap.
+    """
+
+    def __init__(
+        self,
+        pandas_obj,
+        rolling_window: int = 252,
+        percentile=1,
+        min_periods=None,
+        dtype=None,
+    ):
+        min_periods = rolling_window if min_periods is None else min_periods
+        self._validate(pandas_obj, rolling_window, percentile, min_periods)
+        self.rolling_window = rolling_window
+        self.percentile = percentile
+        values = pandas_obj.to_numpy(dtype=resolve_dtype(pandas_obj, dtype))
+        var, cvar = rolling_tail_risk(
+            values.reshape(values.shape[0], -1), rolling_window, percentile, min_periods
+        )
+        self._obj = wrap(pandas_obj, var)
+        self._cvar = wrap(pandas_obj, cvar)
+
+    @staticmethod
+    def _validate(obj, rolling_window: int, percentile, min_periods):
+        assert isinstance(obj.index, pd.DatetimeIndex)
+        assert rolling_window > 0 and isinstance(
+            rolling_window, int
+        ), "rolling_window must be possitive integer"
+        assert 0 <= percentile <= 100, "percentile must be between 0 and 100"
+        assert min_periods > 0 and isinstance(
+            min_periods, int
+        ), "min_periods must be possitive integer"
+
+    @property
+    def data(self):
+        """The rolling VaR"""
+        return self._obj
+
+    @property
+    def var(self):
+        """The rolling VaR"""
+        return self._obj
+
+    @property
+    def cvar(self):
+        """The rolling CVaR: the average loss beyond the VaR"""
+        return self._cvar
+
+    def plot(self, ax=None, **kwargs):  # pragma: no cover
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as mtick
+        if ax is None:
+            ax = plt.gca()
+
+        to_plot = self._obj * 100
+        to_plot.plot(lw=2, x_compat=True, ax=ax, **kwargs)
+        ax.yaxis.grid(linestyle=":")
+        ax.xaxis.grid(linestyle=":")
+        ax.set_ylabel("")
+        ax.set_xlabel("")
+        ax.xaxis.grid(False)
+        if 'label' in kwargs:
+            ax.legend(loc="best")
+
+        ax.yaxis.set_major_formatter(mtick.PercentFormatter())
+        ax.xaxis.set_tick_params(reset=True)
+        ax.tick_params(axis='x', labelrotation=45)
+
+        ax.set_title(
+            f"Rolling VaR {100 - self.percentile:g}% - {self.rolling_window}",
+            fontweight="bold",
+        )
+        return ax
+
+    def plotly(self, **kwargs):  # pragma: no cover
+        import plotly.express as px
+        fig = px.line(self._obj, **kwargs)
+        fig.layout.yaxis.tickformat = '.1%'
+        return fig
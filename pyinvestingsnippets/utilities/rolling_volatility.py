@@ -1,7 +1,7 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mtick
-import plotly.express as px
+
+from pyinvestingsnippets.config import resolve_dtype, wrap
+from pyinvestingsnippets.utilities._rolling import rolling_mean_std
 
 
 class RollingVolatility:
@@ -19,17 +19,22 @@ class RollingVolatility:
     annualized volatility then window = 252, if we have weekly returns
     and want annualized vol then window = 52.
     if monthly returns then window = 12 for annualization
+
+    dtype: float32 or float64 to override the working precision
+    (see :mod:`pyinvestingsnippets.config`)
     """
 
-    def __init__(self, pandas_obj, rolling_window: int, window: int = 252):
+    def __init__(
+        self, pandas_obj, rolling_window: int, window: int = 252, dtype=None
+    ):
         self._validate(pandas_obj, rolling_window, window)
         self.rolling_window = rolling_window
-        self._obj = (
-            pandas_obj.fillna(method="pad")
-            .rolling(window=rolling_window)
-            .std()
-            .apply(lambda x: x * window ** 0.5)
+        values = pandas_obj.fillna(method="pad").to_numpy(
+            dtype=resolve_dtype(pandas_obj, dtype)
         )
+        _, std = rolling_mean_std(values.reshape(values.shape[0], -1), rolling_window)
+        volatility = std * window ** 0.5
+        self._obj = wrap(pandas_obj, volatility)
 
     @staticmethod
     def _validate(obj, rolling_window: int, window: int):
@@ -46,6 +51,8 @@ class RollingVolatility:
         return self._obj
 
     def plot(self, ax=None, **kwargs):  # pragma: no cover
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as mtick
         if ax is None:
             ax = plt.gca()
 
@@ -67,4 +74,5 @@ class RollingVolatility:
         return ax
 
     def plotly(self, **kwargs):  # pragma: no cover
+        import plotly.express as px
         return px.line(self._obj, **kwargs)
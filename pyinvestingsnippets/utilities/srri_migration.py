@@ -0,0 +1,105 @@
+import pandas as pd
+import numpy as np
+
+from pyinvestingsnippets.extensions.srri import SRRI
+
+
+CHANGE_COLUMNS = ["date", "fund", "since", "previous_class", "risk_class", "value"]
+
+
+def _published_classes(classes, confirmation):
+    """Walks the months of a 2D (months x funds) risk classes array and
+    applies the ESMA revision rule to every fund at once.
+
+    The first known class of a fund is published as is. Afterwards the
+    published class only changes once the class has differed from it on
+    every one of ``confirmation`` consecutive months, and it becomes the
+    class of the last of them. Months without a class break the streak.
+
+    Returns
+    -------
+    tuple : the published classes (months x funds) and the
+    (month, fund, first month, previous class) of every confirmed change
+    """
+    n_months, n_funds = classes.shape
+    published = np.zeros(classes.shape, dtype=np.int64)
+    current = np.zeros(n_funds, dtype=np.int64)
+    streak = np.zeros(n_funds, dtype=np.int64)
+    changes = []
+    for month in range(n_months):
+        month_classes = classes[month]
+        known = month_classes > 0
+        current = np.where((current == 0) & known, month_classes, current)
+        differs = known & (month_classes != current)
+        streak = np.where(differs, streak + 1, 0)
+        confirmed = np.flatnonzero(streak >= confirmation)
+        if confirmed.shape[0] > 0:
+            changes.append((
+                np.full(confirmed.shape[0], month),
+                confirmed,
+                np.full(confirmed.shape[0], month - confirmation + 1),
+                current[confirmed],
+            ))
+            current[confirmed] = month_classes[confirmed]
+            streak[confirmed] = 0
+        published[month] = current
+    if changes:
+        changes = tuple(np.concatenate(column) for column in zip(*changes))
+    else:
+        changes = tuple(np.zeros(0, dtype=np.int64) for _ in range(4))
+    return published, changes
+
+
+class SRRIMigration:
+    """Given a monthly SRRI volatility history (like
+    :class:`RollingSRRI(...).data <pyinvestingsnippets.RollingSRRI>`),
+    Series or DataFrame of many funds, will follow the published risk class
+    of every fund with the ESMA rule: a class change is only confirmed when
+    the SRRI has been in other classes on each of the last 4 months.
+
+    confirmation: the number of consecutive months a change needs.
+
+    All the funds are processed together, one vectorized step per month.
+    """
+
+    def __init__(self, pandas_obj, confirmation: int = 4):
+        self._validate(pandas_obj, confirmation)
+        self.confirmation = confirmation
+        frame = pd.DataFrame(pandas_obj)
+        values = frame.to_numpy(dtype=np.float64)
+        published, (month, fund, since, previous) = _published_classes(
+            SRRI.classify(values), confirmation
+        )
+        if isinstance(pandas_obj, pd.DataFrame):
+            self._obj = pd.DataFrame(published, index=frame.index, columns=frame.columns)
+        else:
+            self._obj = pd.Series(
+                published[:, 0], index=pandas_obj.index, name=pandas_obj.name
+            )
+        self._changes = pd.DataFrame({
+            "date": frame.index[month],
+            "fund": frame.columns[fund],
+            "since": frame.index[since],
+            "previous_class": previous,
+            "risk_class": published[month, fund],
+            "value": values[month, fund],
+        }, columns=CHANGE_COLUMNS)
+
+    @staticmethod
+    def _validate(obj, confirmation: int):
+        assert isinstance(obj.index, pd.DatetimeIndex)
+        assert confirmation > 0 and isinstance(
+            confirmation, int
+        ), "confirmation must be possitive integer"
+
+    @property
+    def data(self):
+        """The published risk class of every month, 0 before the first SRRI"""
+        return self._obj
+
+    @property
+    def changes(self):
+        """The confirmed class changes, one row per change: the month it is
+        confirmed (date), the fund, the first month out of the previous class
+        (since), the previous and the new class and the SRRI volatility"""
+        return self._changes
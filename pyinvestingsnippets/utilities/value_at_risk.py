@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+
+
+def historical_var_cvar(values, percentiles):
+    """Historical VaR and CVaR of every column of a 2D returns array.
+
+    The quantiles come from ``np.partition`` (linear time selection)
+    with all the requested percentiles in a single call, and are
+    interpolated linearly like ``np.percentile``. Missing values are
+    skipped: columns are grouped by their number of valid returns so
+    every group needs one partition only.
+
+    Parameters
+    ----------
+    values : 2D array of returns (observations x columns)
+    percentiles : sequence of percentiles, between 0 and 100 inclusive
+
+    Returns
+    -------
+    tuple of two (columns x percentiles) arrays: VaR and CVaR,
+    both as positive losses
+    """
+    percentiles = np.asarray(percentiles, dtype=float).reshape(-1)
+    assert ((percentiles >= 0) & (percentiles <= 100)).all(), \
+        "percentiles must be between 0 and 100"
+    n_cols = values.shape[1]
+    var = np.full((n_cols, percentiles.shape[0]), np.nan)
+    cvar = np.full((n_cols, percentiles.shape[0]), np.nan)
+
+    counts = (~np.isnan(values)).sum(axis=0)
+    for count in np.unique(counts):
+        if count == 0:
+            continue
+        columns = np.flatnonzero(counts == count)
+        group = values[:, columns]
+        position = percentiles / 100 * (count - 1)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, count - 1)
+        # NaN are partitioned after every valid value
+        partitioned = np.partition(group, np.unique(np.r_[lower, upper]), axis=0)
+        low = partitioned[lower]
+        quantiles = low + (partitioned[upper] - low) * (position - lower)[:, None]
+        var[columns] = -quantiles.T
+        for level, quantile in enumerate(quantiles):
+            beyond = partitioned <= quantile
+            cvar[columns, level] = (
+                -np.where(beyond, partitioned, 0.0).sum(axis=0) / beyond.sum(axis=0)
+            )
+    return var, cvar
+
+
+class ValueAtRisk:
+    """Given a Returns Series or DataFrame, calculates the historic
+    Value at Risk (VaR) and Conditional VaR (CVaR) of every column
+    for one or more percentiles at once.
+
+    Each column is its own distribution, and the cost is linear in the
+    number of returns. Missing values (like the first return) are skipped.
+    """
+
+    def __init__(self, pandas_obj, percentiles=(1, 5)):
+        """
+        Parameters
+        ----------
+        pandas_obj : Returns Series or DataFrame
+        percentiles : percentile or sequence of percentiles to compute,
+                      which must be between 0 and 100 inclusive.
+        """
+        self._validate(pandas_obj)
+        self.percentiles = list(np.atleast_1d(percentiles))
+        values = pandas_obj.to_numpy(dtype=float)
+        var, cvar = historical_var_cvar(
+            values.reshape(values.shape[0], -1), self.percentiles
+        )
+        if isinstance(pandas_obj, pd.DataFrame):
+            index = pandas_obj.columns
+        else:
+            index = pd.Index([pandas_obj.name])
+        self._var = pd.DataFrame(var, index=index, columns=self.percentiles)
+        self._cvar = pd.DataFrame(cvar, index=index, columns=self.percentiles)
+
+    @staticmethod
+    def _validate(obj):
+        assert isinstance(obj.index, pd.DatetimeIndex)
+
+    @property
+    def data(self):
+        """
+        Returns
+        -------
+        pd.DataFrame : assets x percentiles VaR table
+        """
+        return self._var
+
+    @property
+    def var(self):
+        """
+        Returns
+        -------
+        pd.DataFrame : assets x percentiles VaR table
+        """
+        return self._var
+
+    @property
+    def cvar(self):
+        """
+        Returns
+        -------
+        pd.DataFrame : assets x percentiles CVaR table
+        """
+        return self._cvar
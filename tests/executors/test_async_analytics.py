@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import time
+
+import pandas as pd
+
+import pyinvestingsnippets as pyinv
+from pyinvestingsnippets.executors.async_analytics import data_key
+
+from ..test_utils import TestUtlis as tu
+
+
+def test_metrics():
+    prices = tu.get_prices(columns=['a', 'b', 'c'])
+    analytics = pyinv.AsyncAnalytics()
+
+    async def compute():
+        return await asyncio.gather(
+            analytics.returns(prices),
+            analytics.cwi(prices),
+            analytics.drawdown(prices),
+            analytics.summary(prices, ppy=12),
+        )
+
+    returns, cwi, drawdown, summary = asyncio.run(compute())
+    analytics.shutdown()
+    pd.testing.assert_frame_equal(returns, prices.returns.data)
+    pd.testing.assert_frame_equal(cwi, prices.returns.cwi.data)
+    pd.testing.assert_frame_equal(drawdown, prices.returns.cwi.drawdown.data)
+    pd.testing.assert_frame_equal(summary, prices.returns.summary(ppy=12))
+    assert analytics.in_flight == 0
+
+
+def test_duplicate_requests_are_coalesced():
+    calls = []
+    release = threading.Event()
+
+    def slow_metric(value):
+        calls.append(value)
+        release.wait(5)
+        return value * 2
+
+    analytics = pyinv.AsyncAnalytics()
+
+    async def compute():
+        first = asyncio.ensure_future(analytics.submit(slow_metric, 21, key="metric"))
+        second = asyncio.ensure_future(analytics.submit(slow_metric, 21, key="metric"))
+        other = asyncio.ensure_future(analytics.submit(slow_metric, 1, key="other"))
+        await asyncio.sleep(0.05)
+        assert analytics.in_flight == 2
+        release.set()
+        return await asyncio.gather(first, second, other)
+
+    assert asyncio.run(compute()) == [42, 42, 2]
+    assert sorted(calls) == [1, 21]
+    analytics.shutdown()
+
+
+def test_same_data_parsed_twice_has_the_same_key():
+    prices = tu.get_prices(columns=['a', 'b', 'c'])
+    parsed = pd.DataFrame(prices.to_dict(orient='list'), index=prices.index.copy())
+    assert data_key(parsed) == data_key(prices)
+    assert data_key(prices[['a', 'b']]) != data_key(prices)
+
+
+def test_metrics_hash_the_data_in_the_executor(monkeypatch):
+    from pyinvestingsnippets.executors import async_analytics
+    threads = []
+
+    def recording_data_key(prices):
+        threads.append(threading.current_thread())
+        return data_key(prices)
+
+    monkeypatch.setattr(async_analytics, "data_key", recording_data_key)
+    prices = tu.get_prices(columns=['a', 'b', 'c'])
+    analytics = pyinv.AsyncAnalytics()
+
+    async def compute():
+        return await asyncio.gather(analytics.cwi(prices), analytics.cwi(prices, key="prices"))
+
+    cwi, keyed = asyncio.run(compute())
+    analytics.shutdown()
+    pd.testing.assert_frame_equal(keyed, cwi)
+    assert len(threads) == 1 and threads[0] is not threading.main_thread()
+
+
+def test_requests_run_concurrently():
+    analytics = pyinv.AsyncAnalytics()
+
+    async def compute():
+        start = time.perf_counter()
+        await asyncio.gather(*[analytics.submit(time.sleep, 0.2) for _ in range(4)])
+        return time.perf_counter() - start
+
+    assert asyncio.run(compute()) < 0.6
+    analytics.shutdown()
@@ -0,0 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pandas as pd
+import numpy as np
+import pytest
+
+import pyinvestingsnippets as pyinv
+
+from ..test_utils import TestUtlis as tu
+
+ASSETS = [f"asset{i}" for i in range(9)]
+
+
+def _episodes_count(drawdown):
+    return drawdown.drawdown_durations.episodes.groupby(level="column").size()
+
+
+def test_parallel_rolling_returns_keeps_index_and_columns():
+    returns = tu.get_returns(260, ASSETS, freq='W')
+    expected = pyinv.RollingReturns(returns, rolling_window=20).data
+    result = pyinv.parallel_map(pyinv.RollingReturns, returns, rolling_window=20,
+                                n_workers=2, columns_per_block=2)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_parallel_rolling_beta_regression():
+    returns = tu.get_returns(260, ASSETS, freq='W')
+    market = returns.mean(axis=1)
+    regression = partial(pyinv.RollingBetaRegression, market)
+    result = pyinv.parallel_map(regression, returns, window=30, n_workers=2,
+                                attribute="rolling_beta")
+    expected = pyinv.RollingBetaRegression(market, returns, 30).rolling_beta
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_parallel_series_only_utility():
+    returns = tu.get_returns(260, ASSETS, freq='W')
+    result = pyinv.parallel_map(pyinv.SRRI, returns, per_column=True, attribute="value",
+                                n_workers=2, columns_per_block=4)
+    assert isinstance(result, pd.Series)
+    assert list(result.index) == list(returns.columns)
+    for column in returns:
+        assert result[column] == pytest.approx(pyinv.SRRI(returns[column]).value)
+
+
+def test_parallel_per_asset_results_with_an_executor():
+    wealth_index = tu.get_prices(260, ASSETS, freq='W')
+    drawdown = wealth_index.drawdown.data
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        result = pyinv.parallel_map(_episodes_count, drawdown, executor=executor,
+                                    columns_per_block=2)
+    expected = _episodes_count(drawdown)
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_parallel_in_process():
+    returns = tu.get_returns(260, ASSETS, freq='W')
+    result = pyinv.parallel_map(np.cumsum, returns, n_workers=1, columns_per_block=5)
+    pd.testing.assert_frame_equal(result, returns.cumsum())
+
+
+def test_parallel_wrong_parameters():
+    with pytest.raises(AssertionError) as excinfo:
+        pyinv.parallel_map(np.cumsum, tu.get_returns(260, ASSETS, freq='W'), columns_per_block=0)
+    assert "columns_per_block must be possitive integer" in str(excinfo.value)
+    with pytest.raises(AssertionError) as excinfo:
+        pyinv.parallel_map(np.cumsum, tu.get_returns(260, ASSETS, freq='W'), n_workers=0)
+    assert "n_workers must be possitive integer" in str(excinfo.value)
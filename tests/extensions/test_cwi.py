@@ -3,6 +3,7 @@ import numpy as np
 from datetime import datetime
 from ..test_utils import TestUtlis as tu
 import pytest
+from pyinvestingsnippets import CumulativeWealthIndex
 from pyinvestingsnippets.exceptions.cwi_not_properly_called_exception import CwiNotProperlyCalledException
 
 
@@ -36,3 +37,71 @@ def test_get_total_return():
     index_range = pd.date_range(start=datetime(2000, 1, 1), periods=5, freq='AS-JAN')
     prices = pd.Series(data=[10, 14, 18.2, 21.84, 32.76], index=index_range)
     np.testing.assert_almost_equal(prices.returns.cwi.total_return, 2.276)
+
+
+def test_explicit_construction():
+    index_range = pd.date_range(start=datetime(2000, 1, 1), periods=5, freq='AS-JAN')
+    prices = pd.Series(data=[10, 14, 18.2, 21.84, 32.76], index=index_range)
+    rets = prices.returns.data
+    log_rets = prices.log_returns.data
+
+    cwi = CumulativeWealthIndex.from_returns(rets)
+    pd.testing.assert_series_equal(cwi.data, prices.returns.cwi.data)
+    cwi = CumulativeWealthIndex(rets, returns_type="arithmetic")
+    np.testing.assert_almost_equal(cwi.total_return, 2.276)
+
+    cwi = CumulativeWealthIndex.from_log_returns(log_rets)
+    pd.testing.assert_series_equal(cwi.data, prices.log_returns.cwi.data)
+    np.testing.assert_almost_equal(cwi.total_return, 2.276)
+
+
+def test_explicit_construction_from_wrapper():
+    class Wrapper:
+        def __init__(self, rets):
+            self.cwi = CumulativeWealthIndex.from_returns(rets)
+
+    prices = tu.gbm(10, 1, steps_per_year=252)
+    wrapped = Wrapper(prices.returns.data)
+    pd.testing.assert_series_equal(wrapped.cwi.data, prices.returns.cwi.data)
+
+
+def test_unknown_returns_type():
+    prices = tu.gbm(1, 1, steps_per_year=252)
+    with pytest.raises(CwiNotProperlyCalledException):
+        CumulativeWealthIndex(prices.returns.data, returns_type="simple")
+
+
+@pytest.mark.parametrize("step", [1, 7, 40])
+def test_period_returns_match_resample(step):
+    returns = tu.get_returns(2000, ['a', 'b', 'c'], sd=0.01, low=-0.05, upp=0.05, freq='B',
+                             start=datetime(2001, 3, 7))
+    returns.iloc[5:40, 1] = np.nan
+    returns = returns[returns.index.month != 5].iloc[::step]
+
+    for obj in [returns, returns['a']]:
+        cwi = CumulativeWealthIndex.from_returns(obj)
+        padded = cwi.data.fillna(method="pad")
+        assert_equal = pd.testing.assert_frame_equal if isinstance(obj, pd.DataFrame) \
+            else pd.testing.assert_series_equal
+        assert_equal(cwi.monthly_returns, padded.resample('M').last().pct_change())
+        assert_equal(cwi.weekly_returns, padded.resample('W').last().pct_change())
+        assert_equal(cwi.annual_returns, padded.resample('Y').last().pct_change())
+        assert cwi.period_ends is cwi.period_ends
+
+
+def test_monthly_returns_table():
+    returns = tu.get_returns(600, ['a', 'b'], sd=0.01, low=-0.05, upp=0.05, freq='B',
+                             start=datetime(2001, 3, 7))
+    cwi = CumulativeWealthIndex.from_returns(returns)
+
+    table = cwi.monthly_returns_table
+    assert list(table.columns) == ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug',
+                                   'Sep', 'Oct', 'Nov', 'Dec', 'Year']
+    assert table.index.tolist() == [(name, year) for name in ['a', 'b'] for year in [2001, 2002, 2003]]
+    assert table.loc[('b', 2002), 'Jul'] == cwi.monthly_returns.loc['2002-07-31', 'b']
+    assert table.loc[('a', 2002), 'Year'] == cwi.annual_returns.loc['2002-12-31', 'a']
+    assert table.loc[('a', 2001), ['Jan', 'Feb', 'Mar']].isna().all()
+
+    series_table = CumulativeWealthIndex.from_returns(returns['b']).monthly_returns_table
+    assert series_table.index.tolist() == [2001, 2002, 2003]
+    pd.testing.assert_frame_equal(series_table, table.loc['b'])
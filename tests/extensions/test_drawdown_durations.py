@@ -20,4 +20,51 @@ def test_durations_empty_drawdown():
     durations = cwi.drawdown.durations
     assert len(durations.data) == 0
     assert durations.mean == timedelta(days=0)
-    assert durations.max == timedelta(0)
\ No newline at end of file
+    assert durations.max == timedelta(0)
+
+def test_durations_episodes():
+    index_range = pd.date_range(start=datetime(2000, 1, 1), periods=9, freq='AS-JAN')
+    cwi = pd.Series(data=[0.4, 0.3, 0.2, 0.5, 0.4, 0.4, 0.3, 0.3, 0.4], index=index_range)
+    episodes = cwi.drawdown.durations.episodes
+    assert list(episodes.columns) == ['start', 'trough', 'recovery', 'depth', 'duration',
+                                      'periods', 'recovered']
+    assert len(episodes) == 2
+    first, second = episodes.iloc[0], episodes.iloc[1]
+    assert first['start'] == pd.Timestamp('2000-01-01')
+    assert first['trough'] == pd.Timestamp('2002-01-01')
+    assert first['recovery'] == pd.Timestamp('2003-01-01')
+    np.testing.assert_almost_equal(first['depth'], -0.5)
+    assert first['duration'] == timedelta(days=1096)
+    assert first['periods'] == 3
+    assert first['recovered']
+    # still under water at the end
+    assert second['trough'] == pd.Timestamp('2006-01-01')
+    np.testing.assert_almost_equal(second['depth'], -0.4)
+    assert second['recovery'] == pd.Timestamp('2008-01-01')
+    assert not second['recovered']
+    assert episodes['periods'].dtype == np.int64
+
+
+def test_durations_dataframe():
+    index_range = pd.date_range(start=datetime(2000, 1, 1), periods=9, freq='AS-JAN')
+    cwi = pd.DataFrame({
+        'a': [0.4, 0.3, 0.2, 0.5, 0.4, 0.4, 0.3, 0.3, 0.5],
+        'b': [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9],
+        'c': [0.5, 0.4, 0.5, 0.3, 0.6, 0.5, 0.4, 0.6, 0.7],
+    }, index=index_range)
+    durations = cwi.drawdown.durations
+    assert isinstance(durations.data, pd.DataFrame)
+    assert list(durations.data.columns) == ['a', 'b', 'c']
+    for column in cwi.columns:
+        expected = cwi[column].drawdown.durations
+        pd.testing.assert_series_equal(durations.data[column].dropna(), expected.data,
+                                       check_names=False, check_freq=False)
+        assert durations.mean[column] == expected.mean
+        assert durations.max[column] == expected.max
+        if len(expected.episodes) > 0:
+            pd.testing.assert_frame_equal(durations.episodes.loc[column].reset_index(drop=True),
+                                          expected.episodes)
+    assert durations.mean['b'] == timedelta(0)
+    assert 'b' not in durations.episodes.index.get_level_values('column')
+    assert durations.episodes.index.names == ['column', 'episode']
+    assert list(durations.episodes.loc['c'].index) == [0, 1, 2]
@@ -44,3 +44,55 @@ def test_sharpe():
     index_range = pd.date_range(start=datetime(2000, 1, 1), periods=5, freq='D')
     prices = pd.Series(data=[100, 90, 113, 120, 130], index=index_range)
     assert round(prices.returns.sharpe(0.2, periods=5), 2) == 0.39
+
+def test_metrics_share_cached_reductions():
+    prices = tu.gbm(10, 1, steps_per_year=252)
+    rets = prices.returns
+    data = rets.data
+    np.testing.assert_almost_equal(rets.total, (1 + data).prod() - 1)
+    np.testing.assert_almost_equal(rets.average, (1 + data).prod() ** (1 / data.shape[0]) - 1)
+    np.testing.assert_almost_equal(rets.annualized(252), (1 + data).prod() ** (252 / data.shape[0]) - 1)
+    np.testing.assert_almost_equal(rets.volatility_annualized(252), data.std() * 252 ** 0.5)
+    np.testing.assert_almost_equal(rets.var(5), -np.percentile(data[1:], 5))
+    np.testing.assert_almost_equal(rets.cvar(5), -data[data <= -rets.var(5)].mean())
+    np.testing.assert_almost_equal(rets.var([1, 5]), -np.percentile(data[1:], [1, 5]))
+    rets.sharpe(0.02)
+    assert set(rets._cache) == {"growth", "std", ("tail_risk", (5,)), ("tail_risk", (1, 5))}
+    # the extension is cached by pandas, so are its reductions
+    assert prices.returns._cache is rets._cache
+    assert rets.cwi is rets.cwi
+
+def test_summary():
+    prices = pd.concat([tu.gbm(10, 1, steps_per_year=252) for _ in range(3)], axis=1,
+                       keys=['a', 'b', 'c'])
+    prices.iloc[:30, 2] = np.nan
+    summary = prices.returns.summary(ppy=252, rf=0.02)
+    assert list(summary.index) == ['a', 'b', 'c']
+    assert list(summary.columns) == ['total_return', 'average', 'cagr', 'volatility', 'sharpe',
+                                     'var', 'cvar', 'max_drawdown', 'best', 'worst']
+    for column in ['a', 'b']:
+        rets = prices[column].returns
+        expected = [rets.total, rets.average, rets.annualized(252), rets.volatility_annualized(252),
+                    rets.sharpe(0.02), rets.var(), rets.cvar(), rets.cwi.drawdown.max_drawdown,
+                    rets.data.max(), rets.data.min()]
+        np.testing.assert_allclose(summary.loc[column].to_numpy(), expected, rtol=1e-10)
+    # missing values are skipped
+    rets = prices['c'].dropna().returns
+    np.testing.assert_almost_equal(summary.loc['c', 'var'], rets.var())
+    np.testing.assert_almost_equal(summary.loc['c', 'max_drawdown'], rets.cwi.drawdown.max_drawdown)
+    np.testing.assert_almost_equal(summary.loc['c', 'volatility'], rets.volatility_annualized(252))
+    np.testing.assert_almost_equal(summary.loc['c', 'average'], rets.average)
+    np.testing.assert_almost_equal(summary.loc['c', 'cagr'], rets.annualized(252))
+    np.testing.assert_almost_equal(summary.loc['c', 'sharpe'], rets.sharpe(0.02))
+
+
+def test_summary_series():
+    index_range = pd.date_range(start=datetime(2000, 1, 1), periods=5, freq='D')
+    prices = pd.Series(data=[100, 90, 113, 120, 130], index=index_range, name='asset')
+    summary = prices.returns.summary(ppy=5, rf=0.2)
+    assert list(summary.index) == ['asset']
+    np.testing.assert_almost_equal(summary.loc['asset', 'total_return'], 0.3)
+    np.testing.assert_almost_equal(summary.loc['asset', 'var'], 0.0757079)
+    np.testing.assert_almost_equal(summary.loc['asset', 'cvar'], 0.0999999)
+    assert round(summary.loc['asset', 'sharpe'], 2) == 0.39
+    np.testing.assert_almost_equal(summary.loc['asset', 'max_drawdown'], -0.1)
@@ -40,3 +40,50 @@ def test_srri_on_monthly():
     assert srri is not None
     assert srri.value < 1
     assert srri.risk_class == 3
+
+
+def test_srri_on_dataframe():
+    number_of_values = 52*5
+    index_range = pd.date_range(start=datetime(2000, 1, 1), periods=number_of_values, freq='W')
+    returns = pd.DataFrame(index=index_range)
+    for name, bound in [('high', 0.30), ('medium', 0.10), ('low', 0.01)]:
+        values = tu.get_truncated_normal(mean=0.001, sd=2, low=-bound, upp=bound)
+        returns[name] = values.rvs(number_of_values)
+    returns.iloc[3, 2] = np.nan
+    returns['missing'] = returns['low']
+    returns.iloc[10, 3] = np.nan
+
+    srri = returns.srri
+    assert isinstance(srri.value, pd.Series)
+    for name in ['high', 'medium']:
+        assert srri.value[name] == SRRI(returns[name]).value
+        assert srri.risk_class[name] == SRRI(returns[name]).risk_class
+    assert np.isnan(srri.value['low']) and np.isnan(srri.value['missing'])
+    assert srri.risk_class['low'] == 0
+
+
+def test_srri_from_prices():
+    prices = tu.get_prices(6 * 260, ['a', 'b'], mean=0.0003, sd=0.01, low=-0.05, upp=0.05,
+                           freq='B')
+
+    weekly = SRRI.from_prices(prices, frequency='W')
+    expected = prices['a'].resample('W').last().pct_change().iloc[-260:].srri
+    np.testing.assert_allclose(weekly.value['a'], expected.value)
+    assert weekly.risk_class['a'] == expected.risk_class
+
+    monthly = SRRI.from_prices(prices['b'], frequency='M')
+    expected = prices['b'].resample('M').last().pct_change().iloc[-60:].srri
+    np.testing.assert_allclose(monthly.value, expected.value)
+
+
+def test_classify():
+    values = np.array([np.nan, 0, 0.004999, 0.005, 0.03, 0.07, 0.12, 0.2, 0.3, 100])
+    classes = SRRI.classify(values)
+    np.testing.assert_array_equal(classes, [0, 1, 1, 2, 3, 4, 5, 6, 7, 0])
+    for value, risk_class in zip(values[1:-1], classes[1:-1]):
+        assert [i for i, bucket in SRRI.RISK_CLASSES.items()
+                if bucket["low"] <= value < bucket["high"]] == [risk_class]
+    assert SRRI.classify(0.07) == 4
+    frame = pd.DataFrame({'a': values, 'b': values[::-1]})
+    pd.testing.assert_frame_equal(SRRI.classify(frame),
+                                  pd.DataFrame({'a': classes, 'b': classes[::-1]}))
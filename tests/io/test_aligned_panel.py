@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyinvestingsnippets import AlignedPanel
+from ..test_utils import TestUtlis as tu
+
+
+def _series(number_of_series=20, periods=300):
+    rng = np.random.default_rng(0)
+    series = {}
+    for number in range(number_of_series):
+        start = rng.integers(0, periods // 2)
+        end = rng.integers(start + 10, periods)
+        prices = tu.get_prices(periods, freq='B', seed=number).iloc[start:end]
+        # every asset has its own holidays
+        series[f"asset_{number}"] = prices[rng.random(prices.shape[0]) > 0.1]
+    return series
+
+
+@pytest.mark.parametrize("tz", [None, "US/Eastern"])
+def test_matches_concat(tz):
+    series = {name: item.tz_localize(tz) for name, item in _series().items()}
+    expected = pd.concat(series, axis=1)
+    panel = AlignedPanel(series)
+    pd.testing.assert_frame_equal(panel.data, expected, check_freq=False)
+    pd.testing.assert_series_equal(panel.first_valid, expected.apply(pd.Series.first_valid_index),
+                                   check_names=False)
+    pd.testing.assert_series_equal(panel.last_valid, expected.apply(pd.Series.last_valid_index),
+                                   check_names=False)
+    assert panel.data.prices.data is panel.data
+
+
+def test_fill_policies():
+    series = _series()
+    expected = pd.concat(series, axis=1)
+    padded = expected.fillna(method="pad")
+
+    pd.testing.assert_frame_equal(AlignedPanel(series, fill="pad").data, padded,
+                                  check_freq=False)
+    pd.testing.assert_frame_equal(AlignedPanel(series, fill="pad", limit=1).data,
+                                  expected.fillna(method="pad", limit=1), check_freq=False)
+    inside = padded.apply(lambda column: column.where(
+        column.index <= expected[column.name].last_valid_index()))
+    pd.testing.assert_frame_equal(AlignedPanel(series, fill="inside").data, inside,
+                                  check_freq=False)
+
+
+def test_unsorted_duplicated_and_named_series():
+    first = pd.Series([3.0, 1.0, 2.0, 4.0], name="a", index=pd.DatetimeIndex(
+        ["2000-01-05", "2000-01-03", "2000-01-04", "2000-01-05"]))
+    second = pd.Series([np.nan, 7.0], name="b",
+                       index=pd.DatetimeIndex(["2000-01-02", "2000-01-04"]))
+    empty = pd.Series([], dtype=float, name="c", index=pd.DatetimeIndex([]))
+    panel = AlignedPanel([first, second, empty], dtype=np.float32)
+
+    assert panel.data.dtypes.eq(np.float32).all()
+    assert panel.data.index.tolist() == list(pd.date_range("2000-01-02", "2000-01-05"))
+    np.testing.assert_array_equal(panel.data["a"], [np.nan, 1.0, 2.0, 4.0])
+    assert panel.first_valid["b"] == pd.Timestamp("2000-01-04")
+    assert pd.isnull(panel.first_valid["c"]) and pd.isnull(panel.last_valid["c"])
+
+
+def test_mixed_timezones():
+    series = _series(number_of_series=2)
+    first, second = series.values()
+    with pytest.raises(AssertionError) as excinfo:
+        AlignedPanel([first.tz_localize("US/Eastern"), second.tz_localize("UTC")])
+    assert "the dates of all the series must have the same timezone" in str(excinfo.value)
+    with pytest.raises(AssertionError):
+        AlignedPanel([first.tz_localize("US/Eastern"), second])
+
+
+def test_validation():
+    with pytest.raises(AssertionError) as excinfo:
+        AlignedPanel(_series(), fill="bfill")
+    assert "fill must be None, pad or inside" in str(excinfo.value)
+    with pytest.raises(AssertionError) as excinfo:
+        AlignedPanel(_series(), fill="pad", limit=0)
+    assert "limit must be possitive integer" in str(excinfo.value)
+    with pytest.raises(AssertionError) as excinfo:
+        AlignedPanel([item.rename("close") for item in _series(number_of_series=2).values()])
+    assert "the series must have different names" in str(excinfo.value)
+    with pytest.raises(AssertionError) as excinfo:
+        AlignedPanel({})
+    assert "at least one series is needed" in str(excinfo.value)
+
+
+def test_unnamed_series_are_named_by_position():
+    first, second = _series(number_of_series=2).values()
+    panel = AlignedPanel([first.rename(None), second.rename(None)])
+    assert list(panel.data.columns) == [0, 1]
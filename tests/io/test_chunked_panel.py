@@ -0,0 +1,90 @@
+import pandas as pd
+import numpy as np
+import pytest
+
+import pyinvestingsnippets as pyinv
+
+from ..test_utils import TestUtlis as tu
+
+ASSETS = [f"asset{i}" for i in range(7)]
+
+
+def _summary(prices):
+    return prices.returns.summary()
+
+
+def _npy_panel(tmp_path, prices, columns_per_block):
+    np.save(tmp_path / "prices.npy", prices.to_numpy())
+    np.save(tmp_path / "dates.npy", prices.index.to_numpy())
+    return pyinv.ChunkedPanel.from_npy(str(tmp_path / "prices.npy"), str(tmp_path / "dates.npy"),
+                                       columns=list(prices.columns),
+                                       columns_per_block=columns_per_block)
+
+
+def test_npy_panel_blocks(tmp_path):
+    prices = tu.get_prices(columns=ASSETS)
+    panel = _npy_panel(tmp_path, prices, columns_per_block=3)
+    blocks = list(panel.blocks())
+    assert [block.shape[1] for block in blocks] == [3, 3, 1]
+    pd.testing.assert_frame_equal(pd.concat(blocks, axis=1), prices, check_freq=False)
+
+
+def test_map_concatenates_per_asset_results(tmp_path):
+    prices = tu.get_prices(columns=ASSETS)
+    panel = _npy_panel(tmp_path, prices, columns_per_block=2)
+    pd.testing.assert_frame_equal(panel.map(_summary), _summary(prices))
+
+
+def test_map_concatenates_time_series_by_columns(tmp_path):
+    prices = tu.get_prices(30, ASSETS[:5])
+    panel = _npy_panel(tmp_path, prices, columns_per_block=1)
+    pd.testing.assert_frame_equal(panel.map(lambda block: block.returns.data),
+                                  prices.returns.data, check_freq=False)
+    pd.testing.assert_series_equal(panel.map(lambda block: block.returns.total),
+                                   prices.returns.total)
+
+
+def test_map_streams_to_csv(tmp_path):
+    prices = tu.get_prices(columns=ASSETS)
+    panel = _npy_panel(tmp_path, prices, columns_per_block=4)
+    output = panel.map(_summary, output=str(tmp_path / "summary.csv"))
+    written = pd.read_csv(output, index_col=0)
+    pd.testing.assert_frame_equal(written, _summary(prices), check_exact=False)
+
+
+def test_map_streams_time_series_to_npy(tmp_path):
+    prices = tu.get_prices(columns=ASSETS)
+    panel = _npy_panel(tmp_path, prices, columns_per_block=3)
+
+    def rolling_volatility(block):
+        return pyinv.RollingVolatility(block.returns.data, rolling_window=20).data
+
+    output = panel.map(rolling_volatility, output=str(tmp_path / "volatility.npy"))
+    expected = rolling_volatility(prices).to_numpy()
+    np.testing.assert_allclose(np.load(output), expected)
+
+
+def test_map_streams_series_to_npy(tmp_path):
+    prices = tu.get_prices(columns=ASSETS)
+    panel = _npy_panel(tmp_path, prices, columns_per_block=3)
+    output = panel.map(lambda block: block.returns.var(), output=str(tmp_path / "var.npy"))
+    np.testing.assert_allclose(np.load(output), [prices.returns.var().to_numpy()])
+
+
+def test_parquet_panel(tmp_path):
+    pytest.importorskip("pyarrow")
+    prices = tu.get_prices(columns=ASSETS)
+    prices.to_parquet(tmp_path / "prices.parquet")
+    panel = pyinv.ChunkedPanel.from_parquet(str(tmp_path / "prices.parquet"),
+                                            columns_per_block=3)
+    assert list(panel.columns) == list(prices.columns)
+    output = panel.map(_summary, output=str(tmp_path / "summary.parquet"))
+    pd.testing.assert_frame_equal(pd.read_parquet(output), _summary(prices))
+    output = panel.map(lambda block: block.returns.var(), output=str(tmp_path / "var.parquet"))
+    np.testing.assert_allclose(pd.read_parquet(output).iloc[:, 0], prices.returns.var())
+
+
+def test_wrong_block_size(tmp_path):
+    with pytest.raises(AssertionError) as excinfo:
+        _npy_panel(tmp_path, tu.get_prices(columns=ASSETS), columns_per_block=0)
+    assert "columns_per_block must be possitive integer" in str(excinfo.value)
@@ -0,0 +1,91 @@
+import pandas as pd
+import numpy as np
+from datetime import datetime
+import pytest
+
+import pyinvestingsnippets as pyinv
+from pyinvestingsnippets.io import price_store
+
+from ..test_utils import TestUtlis as tu
+
+ASSETS = [f"asset{i}" for i in range(5)]
+
+
+def test_create_and_open(tmp_path):
+    prices = tu.get_prices(200, ASSETS)
+    store = pyinv.PriceStore.create(str(tmp_path / "store"), prices, columns_per_block=2)
+    assert store.n_blocks == 3
+    assert store.shape == prices.shape
+    reopened = pyinv.PriceStore(str(tmp_path / "store"))
+    pd.testing.assert_frame_equal(reopened.data, prices, check_freq=False)
+    pd.testing.assert_frame_equal(reopened.read(["asset4", "asset1"]),
+                                  prices[["asset4", "asset1"]], check_freq=False)
+
+
+def test_blocks_are_not_copied(tmp_path):
+    prices = tu.get_prices(200, ASSETS)
+    store = pyinv.PriceStore.create(str(tmp_path / "store"), prices, columns_per_block=2)
+    block = store.block(1)
+    assert list(block.columns) == ["asset2", "asset3"]
+    assert np.shares_memory(block.to_numpy(), store._blocks[1])
+    assert np.shares_memory(store.read(["asset2", "asset3"]).to_numpy(), store._blocks[1])
+    assert block.prices.data is block
+    pd.testing.assert_frame_equal(block.returns.data, prices[["asset2", "asset3"]].returns.data,
+                                  check_freq=False)
+
+
+def test_append(tmp_path):
+    prices = tu.get_prices(200, ASSETS)
+    store = pyinv.PriceStore.create(str(tmp_path / "store"), prices.iloc[:150], columns_per_block=2)
+    store.append(prices.iloc[150:])
+    pd.testing.assert_frame_equal(store.data, prices, check_freq=False)
+
+    later = tu.get_prices(10, ASSETS, start=datetime(2001, 1, 1), seed=1)[["asset0", "asset3"]]
+    store.append(later)
+    reopened = pyinv.PriceStore(str(tmp_path / "store"))
+    assert reopened.shape == (210, 5)
+    pd.testing.assert_frame_equal(reopened.data.iloc[-10:][["asset0", "asset3"]], later,
+                                  check_freq=False)
+    assert reopened.data.iloc[-10:]["asset1"].isna().all()
+
+    with pytest.raises(AssertionError) as excinfo:
+        store.append(prices.iloc[:5])
+    assert "only dates after the last stored date can be appended" in str(excinfo.value)
+
+
+def test_append_after_interrupted_append(tmp_path, monkeypatch):
+    prices = tu.get_prices(200, ASSETS)
+    store = pyinv.PriceStore.create(str(tmp_path / "store"), prices.iloc[:150], columns_per_block=2)
+
+    append_rows = price_store._append_rows
+    calls = []
+
+    def crash_after_first_block(path, rows, start):
+        if calls:
+            raise IOError("disk full")
+        calls.append(path)
+        append_rows(path, rows, start)
+
+    monkeypatch.setattr(price_store, "_append_rows", crash_after_first_block)
+    with pytest.raises(IOError):
+        store.append(prices.iloc[150:160])
+    monkeypatch.undo()
+
+    # the first block holds orphaned rows, the dates were not committed
+    reopened = pyinv.PriceStore(str(tmp_path / "store"))
+    assert reopened.shape == (150, 5)
+    pd.testing.assert_frame_equal(reopened.data, prices.iloc[:150], check_freq=False)
+    # and the store that failed is still usable
+    pd.testing.assert_frame_equal(store.data, prices.iloc[:150], check_freq=False)
+
+    store.append(prices.iloc[150:])
+    pd.testing.assert_frame_equal(pyinv.PriceStore(str(tmp_path / "store")).data, prices,
+                                  check_freq=False)
+
+
+def test_chunked_panel_over_store(tmp_path):
+    prices = tu.get_prices(200, ASSETS)
+    store = pyinv.PriceStore.create(str(tmp_path / "store"), prices, columns_per_block=2)
+    summary = pyinv.ChunkedPanel(store, columns_per_block=3).map(
+        lambda block: block.returns.summary())
+    pd.testing.assert_frame_equal(summary, prices.returns.summary())
@@ -0,0 +1,87 @@
+import pandas as pd
+import numpy as np
+from datetime import datetime
+import pytest
+
+import pyinvestingsnippets as pyinv
+from pyinvestingsnippets.exceptions.cwi_not_properly_called_exception import CwiNotProperlyCalledException
+
+from ..test_utils import TestUtlis as tu
+
+
+def _assert_matches_batch(stream, prices):
+    rets = prices.returns
+    cwi = rets.cwi
+    dd = cwi.drawdown
+    assert stream.count == prices.shape[0] - 1
+    np.testing.assert_almost_equal(stream.mean, rets.data.mean())
+    np.testing.assert_almost_equal(stream.std, rets.data.std())
+    np.testing.assert_almost_equal(stream.volatility_annualized(252), rets.volatility_annualized(252))
+    np.testing.assert_almost_equal(stream.cwi.total_return, cwi.total_return)
+    np.testing.assert_almost_equal(stream.cwi.drawdown.drawdown, dd.data.iloc[-1])
+    np.testing.assert_almost_equal(stream.cwi.drawdown.max_drawdown, dd.max_drawdown)
+    np.testing.assert_almost_equal(stream.cwi.drawdown.peak, cwi.data.max())
+    # the latest date at the peak, as padded prices repeat it
+    peak_date = cwi.data.index[cwi.data == cwi.data.max()][-1]
+    assert stream.cwi.drawdown.peak_timestamp == peak_date
+    assert stream.cwi.drawdown.duration == prices.shape[0] - 1 - prices.index.get_loc(peak_date)
+    assert stream.cwi.drawdown.open_duration == prices.index[-1] - peak_date
+
+
+def test_streaming_tick_by_tick():
+    prices = tu.gbm(2, 1, steps_per_year=252)
+    stream = pyinv.StreamingReturns()
+    assert np.isnan(stream.update(prices.iloc[0], prices.index[0]))
+    for timestamp, price in prices.iloc[1:].items():
+        ret = stream.update(price, timestamp)
+    np.testing.assert_almost_equal(ret, prices.returns.data.iloc[-1])
+    _assert_matches_batch(stream, prices)
+
+
+def test_streaming_batches():
+    prices = tu.gbm(2, 1, steps_per_year=252)
+    stream = pyinv.StreamingReturns()
+    for start in range(0, prices.shape[0], 37):
+        chunk = prices.iloc[start:start + 37]
+        rets = stream.update_many(chunk.to_numpy(), chunk.index.to_numpy())
+        np.testing.assert_allclose(rets, prices.returns.data.iloc[start:start + 37].to_numpy(),
+                                   equal_nan=True)
+    _assert_matches_batch(stream, prices)
+
+
+def test_streaming_mixed_updates_and_nan():
+    prices = tu.gbm(1, 1, steps_per_year=252)
+    with_gaps = prices.copy()
+    with_gaps.iloc[[0, 5, 6, 40, -1]] = np.nan
+    stream = pyinv.StreamingReturns()
+    rets = stream.update_many(with_gaps.iloc[:100].to_numpy(), with_gaps.index[:100].to_numpy())
+    batch = with_gaps.returns.data
+    np.testing.assert_allclose(rets, batch.iloc[:100].to_numpy(), equal_nan=True)
+    assert (rets[[5, 6, 40]] == 0).all()
+    for timestamp, price in with_gaps.iloc[100:].items():
+        ret = stream.update(price, timestamp)
+    assert ret == 0
+    # the missing prices are padded, as the batch accessor does
+    _assert_matches_batch(stream, with_gaps.iloc[1:])
+
+
+def test_streaming_drawdown():
+    index_range = pd.date_range(start=datetime(2000, 1, 1), periods=9, freq='AS-JAN')
+    cwi = pd.Series(data=[0.4, 0.3, 0.2, 0.5, 0.4, 0.4, 0.3, 0.3, 0.45], index=index_range)
+    stream = pyinv.StreamingDrawdown()
+    for timestamp, value in cwi.items():
+        stream.update(value, timestamp)
+    assert stream.max_drawdown == -0.5
+    np.testing.assert_almost_equal(stream.drawdown, -0.1)
+    assert stream.duration == 5
+    assert stream.peak_timestamp == pd.Timestamp('2003-01-01')
+    assert stream.open_duration == index_range[-1] - index_range[3]
+
+
+def test_streaming_log_cwi():
+    prices = tu.gbm(1, 1, steps_per_year=252)
+    stream = pyinv.StreamingCumulativeWealthIndex(returns_type="log")
+    stream.update_many(prices.log_returns.data.to_numpy())
+    np.testing.assert_almost_equal(stream.total_return, prices.log_returns.cwi.total_return)
+    with pytest.raises(CwiNotProperlyCalledException):
+        pyinv.StreamingCumulativeWealthIndex(returns_type="simple")
@@ -0,0 +1,17 @@
+from benchmarks.__main__ import main
+
+
+def test_benchmark_suite_runs(tmp_path, capsys):
+    output = tmp_path / "results.csv"
+    main(["--rows", "300", "--cols", "1", "3", "--repeat", "1", "--csv", str(output)])
+    lines = output.read_text().splitlines()
+    assert lines[0] == "benchmark,rows,cols,seconds,us_per_row,us_per_col"
+    benchmarks = {line.split(",")[0] for line in lines[1:]}
+    assert "Extensions.time_srri" in benchmarks
+    assert "Betas.time_batch_beta" in benchmarks
+    assert len(lines) == 1 + 2 * len(benchmarks)
+
+
+def test_benchmark_grid_skips_large_inputs(capsys):
+    main(["--rows", "1000000", "--cols", "10000", "--repeat", "1"])
+    assert len(capsys.readouterr().out.strip().splitlines()) == 1
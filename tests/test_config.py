@@ -0,0 +1,111 @@
+import pandas as pd
+import numpy as np
+import threading
+from datetime import datetime
+import pytest
+
+import pyinvestingsnippets as pyinv
+from pyinvestingsnippets.config import cumulative
+
+from .test_utils import TestUtlis as tu
+
+
+def _prices():
+    return tu.get_prices(2000, ['a', 'b'], mean=0.0005, sd=0.01, low=-0.1, upp=0.1)
+
+
+def test_default_precision_follows_the_input():
+    prices = _prices()
+    assert pyinv.get_precision() is None
+    assert (pyinv.Returns(prices).data.dtypes == 'float64').all()
+    assert (pyinv.Returns(prices.astype('float32')).data.dtypes == 'float32').all()
+
+
+def test_precision_context_manager():
+    prices = _prices()
+    with pyinv.precision('float32'):
+        assert pyinv.get_precision() == np.float32
+        returns = pyinv.Returns(prices)
+        log_returns = pyinv.LogReturns(prices)
+        cwi = returns.cwi
+        drawdown = pyinv.Drawdown(cwi.data)
+    assert pyinv.get_precision() is None
+    for obj in [returns.data, log_returns.data, cwi.data, drawdown.data, log_returns.cwi.data]:
+        assert (obj.dtypes == 'float32').all()
+
+    expected = pyinv.Returns(prices)
+    np.testing.assert_allclose(cwi.data, expected.cwi.data, rtol=1e-5)
+    np.testing.assert_allclose(returns.total, expected.total, rtol=1e-5)
+    np.testing.assert_allclose(log_returns.total, pyinv.LogReturns(prices).total, rtol=1e-4)
+    np.testing.assert_allclose(drawdown.max_drawdown, expected.cwi.drawdown.max_drawdown,
+                               rtol=1e-4)
+
+
+def test_precision_context_manager_is_thread_local():
+    entered, done = threading.Event(), threading.Event()
+    seen = []
+
+    def worker():
+        entered.wait()
+        seen.append(pyinv.get_precision())
+        with pyinv.precision('float64'):
+            seen.append(pyinv.get_precision())
+        done.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    with pyinv.precision('float32'):
+        entered.set()
+        done.wait()
+        assert pyinv.get_precision() == np.float32
+    thread.join()
+    assert seen == [None, np.float64]
+    assert pyinv.get_precision() is None
+
+
+def test_set_precision_validation():
+    with pytest.raises(AssertionError) as excinfo:
+        pyinv.set_precision('int32')
+    assert "precision must be float32 or float64" in str(excinfo.value)
+    assert pyinv.get_precision() is None
+
+
+def test_cumulative_accumulates_in_float64():
+    index_range = pd.date_range(start=datetime(2000, 1, 1), periods=100000, freq='H')
+    growth = pd.Series(np.full(100000, 1.0001, dtype='float32'), index=index_range)
+    growth.iloc[5] = np.nan
+    wealth = cumulative(growth, "prod")
+    assert wealth.dtype == 'float32'
+    assert np.isnan(wealth.iloc[5])
+    np.testing.assert_allclose(wealth.iloc[-1], np.float64(np.float32(1.0001)) ** 99999, rtol=1e-6)
+
+
+@pytest.mark.parametrize("utility, arguments", [
+    (pyinv.RollingReturns, {"rolling_window": 50}),
+    (pyinv.RollingVolatility, {"rolling_window": 50}),
+    (pyinv.RollingSharpe, {"rolling_window": 50}),
+    (pyinv.RollingSortino, {"rolling_window": 50}),
+    (pyinv.RollingVaR, {"rolling_window": 50, "percentile": 5}),
+    (pyinv.ExponantiallyWeightedDownsideRisk, {}),
+])
+def test_rolling_utilities_in_float32(utility, arguments):
+    returns = _prices().returns.data
+    single = utility(returns, dtype='float32', **arguments).data
+    double = utility(returns, **arguments).data
+    assert (single.dtypes == 'float32').all()
+    assert (double.dtypes == 'float64').all()
+    np.testing.assert_allclose(single, double, rtol=1e-3, atol=1e-6)
+
+
+def test_rolling_max_drawdown_in_float32():
+    prices = _prices()
+    single = pyinv.RollingMaxDrawdown(prices, 100, dtype='float32').data
+    assert (single.dtypes == 'float32').all()
+    np.testing.assert_allclose(single, pyinv.RollingMaxDrawdown(prices, 100).data, atol=1e-6)
+
+
+def test_rolling_volatility_matches_pandas():
+    returns = _prices().returns.data
+    rolling_volatility = pyinv.RollingVolatility(returns, rolling_window=30, window=252)
+    pd.testing.assert_frame_equal(rolling_volatility.data,
+                                  returns.rolling(30).std() * 252 ** 0.5)
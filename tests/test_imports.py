@@ -0,0 +1,13 @@
+import subprocess
+import sys
+
+
+def test_backends_are_not_imported_eagerly():
+    code = (
+        "import sys, pyinvestingsnippets\n"
+        "print(','.join(m for m in ('matplotlib', 'seaborn', 'plotly', 'sklearn')"
+        " if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], check=True,
+                         capture_output=True, text=True)
+    assert out.stdout.strip() == ""
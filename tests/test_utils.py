@@ -9,6 +9,26 @@ class TestUtlis:
     def get_truncated_normal(mean=0, sd=1, low=0, upp=10):
         return truncnorm(
             (low - mean) / sd, (upp - mean) / sd, loc=mean, scale=sd)
+
+    @staticmethod
+    def get_returns(number_of_values=300, columns=None, mean=0, sd=0.02, low=-0.2, upp=0.2,
+                    freq='D', start=datetime.datetime(2000, 1, 1), seed=0):
+        """
+        Generates seeded truncated normal returns, a Series or, given the columns, a DataFrame
+        """
+        index_range = pd.date_range(start=start, periods=number_of_values, freq=freq)
+        values = TestUtlis.get_truncated_normal(mean=mean, sd=sd, low=low, upp=upp)
+        if columns is None:
+            return pd.Series(data=values.rvs(number_of_values, random_state=seed), index=index_range)
+        return pd.DataFrame(data=values.rvs((number_of_values, len(columns)), random_state=seed),
+                            index=index_range, columns=list(columns))
+
+    @staticmethod
+    def get_prices(number_of_values=300, columns=None, **kwargs):
+        """
+        Generates seeded prices starting at 100 from the returns of get_returns
+        """
+        return 100 * (1 + TestUtlis.get_returns(number_of_values, columns, **kwargs)).cumprod()
     
     def gbm(n_years = 10, n_scenarios=1000, mu=0.07, sigma=0.15, steps_per_year=12, s_0=100.0, prices=True):
         """
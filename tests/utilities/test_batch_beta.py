@@ -0,0 +1,70 @@
+import pandas as pd
+import numpy as np
+from datetime import datetime
+from scipy.stats import linregress
+
+import pyinvestingsnippets as pyinv
+
+
+def _returns(number_of_values=250, seed=3):
+    rng = np.random.default_rng(seed)
+    index_range = pd.date_range(start=datetime(2000, 1, 1), periods=number_of_values, freq='D')
+    benchmarks = pd.DataFrame(rng.normal(0.0005, 0.01, (number_of_values, 2)),
+                              index=index_range, columns=['bench1', 'bench2'])
+    noise = rng.normal(0, 0.01, (number_of_values, 3))
+    stocks = pd.DataFrame(0.001 + benchmarks['bench1'].to_numpy()[:, None] * [0.5, 1.0, 1.5] + noise,
+                          index=index_range, columns=['a', 'b', 'c'])
+    return benchmarks, stocks
+
+
+def test_batch_beta_matches_single_regressions():
+    benchmarks, stocks = _returns()
+    batch = pyinv.BatchBeta(benchmarks, stocks)
+    assert batch.beta.shape == (3, 2)
+    assert list(batch.beta.index) == ['a', 'b', 'c']
+    assert list(batch.beta.columns) == ['bench1', 'bench2']
+    for stock in stocks:
+        for bench in benchmarks:
+            fit = linregress(benchmarks[bench], stocks[stock])
+            np.testing.assert_almost_equal(batch.beta.loc[stock, bench], fit.slope)
+            np.testing.assert_almost_equal(batch.alpha.loc[stock, bench], fit.intercept)
+            np.testing.assert_almost_equal(batch.r_squared.loc[stock, bench], fit.rvalue ** 2)
+            np.testing.assert_almost_equal(
+                batch.beta.loc[stock, bench],
+                pyinv.BetaRegression(benchmarks[bench], stocks[stock]).beta)
+    assert (batch.observations == 250).all().all()
+
+
+def test_batch_beta_pairwise_nan():
+    benchmarks, stocks = _returns()
+    benchmarks.iloc[:20, 1] = np.nan
+    stocks.iloc[10:40, 0] = np.nan
+    stocks.iloc[:, 2] = np.nan
+    batch = pyinv.BatchBeta(benchmarks, stocks)
+    for stock in ['a', 'b']:
+        for bench in benchmarks:
+            pair = pd.concat([benchmarks[bench], stocks[stock]], axis=1).dropna()
+            fit = linregress(pair.iloc[:, 0], pair.iloc[:, 1])
+            np.testing.assert_almost_equal(batch.beta.loc[stock, bench], fit.slope)
+            np.testing.assert_almost_equal(batch.alpha.loc[stock, bench], fit.intercept)
+            np.testing.assert_almost_equal(batch.r_squared.loc[stock, bench], fit.rvalue ** 2)
+            assert batch.observations.loc[stock, bench] == len(pair)
+    assert batch.beta.loc['c'].isna().all()
+
+
+def test_batch_beta_series():
+    benchmarks, stocks = _returns()
+    batch = pyinv.BatchBeta(benchmarks['bench1'], stocks['b'])
+    assert batch.beta.shape == (1, 1)
+    fit = linregress(benchmarks['bench1'], stocks['b'])
+    np.testing.assert_almost_equal(batch.beta.iloc[0, 0], fit.slope)
+
+
+def test_batch_beta_from_prices():
+    benchmarks, stocks = _returns()
+    benchmark_prices = (1 + benchmarks).cumprod()
+    stock_prices = (1 + stocks).cumprod()
+    batch = pyinv.BatchBeta(benchmark_prices.returns.data, stock_prices.returns.data)
+    assert (batch.observations == 249).all().all()
+    fit = linregress(benchmarks['bench1'][1:], stocks['a'][1:])
+    np.testing.assert_almost_equal(batch.beta.loc['a', 'bench1'], fit.slope)
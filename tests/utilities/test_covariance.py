@@ -0,0 +1,114 @@
+import pandas as pd
+import numpy as np
+import pytest
+from ..test_utils import TestUtlis as tu
+
+from pyinvestingsnippets import Covariance, RollingCovariance, EWMCovariance
+
+
+def _returns(number_of_values=200, number_of_assets=6, missing=False):
+    returns = tu.get_returns(number_of_values, [f"asset_{i}" for i in range(number_of_assets)],
+                             mean=0.0005, sd=0.01, low=-0.05, upp=0.05, freq='B')
+    # correlated assets
+    returns[:] = returns.to_numpy() @ (np.eye(number_of_assets) + 0.5)
+    if missing:
+        returns.iloc[:20, 1] = np.nan
+        returns.iloc[50:55, 2] = np.nan
+        returns.iloc[100, 0] = np.nan
+    return returns
+
+
+@pytest.mark.parametrize("missing", [False, True])
+def test_covariance(missing):
+    returns = _returns(missing=missing)
+    covariance = Covariance(returns)
+    pd.testing.assert_frame_equal(covariance.data, returns.cov())
+    pd.testing.assert_frame_equal(covariance.correlation, returns.corr())
+    assert covariance.shrinkage is None
+
+
+def test_ledoit_wolf():
+    from sklearn.covariance import LedoitWolf
+    returns = _returns(number_of_values=110, number_of_assets=150, missing=True)
+    covariance = Covariance(returns, shrinkage="ledoit-wolf")
+    expected = LedoitWolf().fit(returns.dropna().to_numpy())
+    np.testing.assert_allclose(covariance.data, expected.covariance_, rtol=1e-10)
+    np.testing.assert_allclose(covariance.shrinkage, expected.shrinkage_)
+    np.testing.assert_allclose(np.diag(covariance.correlation), 1.0)
+
+
+@pytest.mark.parametrize("missing", [False, True])
+def test_rolling_covariance(missing):
+    returns = _returns(missing=missing)
+    rolling = RollingCovariance(returns, 20)
+    np.testing.assert_allclose(rolling.data, returns.rolling(20).cov(), rtol=1e-8, atol=1e-14)
+    np.testing.assert_allclose(rolling.latest, returns.iloc[-20:].cov(), rtol=1e-8)
+
+    matrices = rolling.matrices(correlation=True)
+    date, first = next(matrices)
+    assert date == returns.index[19]
+    np.testing.assert_allclose(first, returns.iloc[:20].corr(), rtol=1e-8)
+    assert sum(1 for _ in matrices) == returns.shape[0] - 20
+
+
+def test_rolling_ledoit_wolf():
+    from sklearn.covariance import LedoitWolf
+    returns = _returns(number_of_values=120, number_of_assets=10, missing=True)
+    rolling = RollingCovariance(returns, 30, shrinkage="ledoit-wolf")
+    for date, matrix in rolling.matrices():
+        window = returns.loc[:date].iloc[-30:]
+        if window.isna().any().any():
+            assert matrix.isna().all().all()
+        else:
+            expected = LedoitWolf().fit(window.to_numpy()).covariance_
+            np.testing.assert_allclose(matrix, expected, rtol=1e-7)
+
+
+@pytest.mark.parametrize("missing", [False, True])
+@pytest.mark.parametrize("bias", [False, True])
+def test_ewm_covariance(missing, bias):
+    returns = _returns(missing=missing)
+    ewm = EWMCovariance(returns, decay_factor=0.1, bias=bias)
+    expected = returns.ewm(alpha=0.1).cov(bias=bias)
+    np.testing.assert_allclose(ewm.data, expected, rtol=1e-8, atol=1e-14)
+    np.testing.assert_allclose(ewm.latest, expected.loc[returns.index[-1]], rtol=1e-8)
+
+    date, correlation = list(ewm.matrices(correlation=True))[-1]
+    covariance = expected.loc[date].to_numpy()
+    deviations = np.sqrt(np.diag(covariance))
+    np.testing.assert_allclose(correlation, covariance / np.outer(deviations, deviations),
+                               rtol=1e-8)
+
+
+def test_duplicate_dates():
+    returns = _returns(number_of_values=60, number_of_assets=3)
+    duplicated = returns.set_axis(returns.index[np.arange(60) // 2], axis=0)
+    np.testing.assert_allclose(RollingCovariance(duplicated, 20).data,
+                               RollingCovariance(returns, 20).data, rtol=1e-12)
+    np.testing.assert_allclose(EWMCovariance(duplicated).data, EWMCovariance(returns).data,
+                               rtol=1e-12)
+
+
+def test_float32():
+    returns = _returns().astype(np.float32)
+    assert (Covariance(returns).data.dtypes == np.float32).all()
+    assert (RollingCovariance(returns, 20).latest.dtypes == np.float32).all()
+    assert (EWMCovariance(returns, dtype="float64").latest.dtypes == np.float64).all()
+
+
+def test_validation():
+    with pytest.raises(AssertionError) as excinfo:
+        Covariance(_returns(), shrinkage="oas")
+    assert "shrinkage must be None or ledoit-wolf" in str(excinfo.value)
+    with pytest.raises(AssertionError) as excinfo:
+        RollingCovariance(_returns(), 1)
+    assert "rolling_window must be integer greater than 1" in str(excinfo.value)
+    with pytest.raises(AssertionError) as excinfo:
+        EWMCovariance(_returns(), decay_factor=0)
+    assert "Smoothing Factor must be 0 < f <= 1" in str(excinfo.value)
+
+    missing_asset = _returns()
+    missing_asset.iloc[:, 2] = np.nan
+    with pytest.raises(AssertionError) as excinfo:
+        Covariance(missing_asset, shrinkage="ledoit-wolf")
+    assert "ledoit-wolf needs at least 2 dates without missing returns" in str(excinfo.value)
@@ -0,0 +1,41 @@
+import pandas as pd
+import numpy as np
+import pytest
+
+import pyinvestingsnippets as pyinv
+
+from ..test_utils import TestUtlis as tu
+
+
+def test_downside_risk_series():
+    returns = tu.get_returns()
+    downside_risk = pyinv.ExponantiallyWeightedDownsideRisk(returns, decay_factor=0.1, window=252)
+    assert isinstance(downside_risk.data, pd.Series)
+    assert downside_risk.data is downside_risk.downside_risk
+    expected = (np.minimum(returns, 0) ** 2).ewm(alpha=0.1).mean() ** 0.5 * 252 ** 0.5
+    pd.testing.assert_series_equal(downside_risk.data, expected)
+
+
+def test_downside_risk_dataframe_with_threshold_and_missing_values():
+    returns = tu.get_returns(columns=['a', 'b'])
+    returns.iloc[:5, 0] = np.nan
+    returns.iloc[100:110, 1] = np.nan
+    downside_risk = pyinv.ExponantiallyWeightedDownsideRisk(returns, threshold=0.005, window=12)
+    expected = (np.minimum(returns - 0.005, 0) ** 2).ewm(alpha=0.05).mean() ** 0.5 * 12 ** 0.5
+    pd.testing.assert_frame_equal(downside_risk.data, expected)
+    assert downside_risk.data['a'][:5].isna().all()
+
+
+def test_downside_risk_float32():
+    returns = tu.get_returns(columns=['a', 'b']).astype('float32')
+    downside_risk = pyinv.ExponantiallyWeightedDownsideRisk(returns)
+    assert (downside_risk.data.dtypes == 'float32').all()
+    expected = pyinv.ExponantiallyWeightedDownsideRisk(returns.astype('float64')).data
+    np.testing.assert_allclose(downside_risk.data, expected, rtol=1e-4)
+
+
+def test_downside_risk_wrong_parameters():
+    returns = tu.get_returns()
+    with pytest.raises(AssertionError) as excinfo:
+        pyinv.ExponantiallyWeightedDownsideRisk(returns, decay_factor=0)
+    assert "Smoothing Factor must be 0 < f <= 1" in str(excinfo.value)
@@ -0,0 +1,85 @@
+import pandas as pd
+import numpy as np
+from datetime import datetime
+import pytest
+from scipy.stats import linregress
+from sklearn.linear_model import LinearRegression
+
+import pyinvestingsnippets as pyinv
+
+
+def _returns(number_of_values=300, seed=7):
+    rng = np.random.default_rng(seed)
+    index_range = pd.date_range(start=datetime(2000, 1, 1), periods=number_of_values, freq='D')
+    market = pd.Series(rng.normal(0.0005, 0.01, number_of_values), index=index_range)
+    stock = 0.001 + 1.3 * market + pd.Series(rng.normal(0, 0.01, number_of_values), index=index_range)
+    return market, stock
+
+
+def _sklearn_rolling_beta(market, stock, window):
+    # the former per window implementation
+    obs = len(market)
+    betas = np.full(obs, np.nan)
+    alphas = np.full(obs, np.nan)
+    for i in range(obs - window):
+        model = LinearRegression().fit(
+            market.to_numpy()[i: i + window + 1].reshape(-1, 1),
+            stock.to_numpy()[i: i + window + 1],
+        )
+        betas[i + window] = model.coef_[0]
+        alphas[i + window] = model.intercept_
+    return betas, alphas
+
+
+def test_rolling_beta_matches_sklearn():
+    market, stock = _returns()
+    rolling_beta = pyinv.RollingBetaRegression(market, stock, 20)
+    betas, alphas = _sklearn_rolling_beta(market, stock, 20)
+    assert isinstance(rolling_beta.data, pd.Series)
+    assert rolling_beta.data[:20].isna().all()
+    np.testing.assert_allclose(rolling_beta.data.to_numpy(), betas, rtol=1e-8, equal_nan=True)
+    np.testing.assert_allclose(rolling_beta.alpha.to_numpy(), alphas, rtol=1e-6, atol=1e-12,
+                               equal_nan=True)
+
+
+def test_rolling_r_squared_and_std_error():
+    market, stock = _returns()
+    rolling_beta = pyinv.RollingBetaRegression(market, stock, 30)
+    fit = linregress(market[-31:], stock[-31:])
+    np.testing.assert_almost_equal(rolling_beta.r_squared.iloc[-1], fit.rvalue ** 2)
+    np.testing.assert_almost_equal(rolling_beta.std_error.iloc[-1], fit.stderr)
+    np.testing.assert_almost_equal(rolling_beta.alpha.iloc[-1], fit.intercept)
+
+
+def test_rolling_beta_dataframe():
+    market, stock = _returns()
+    stocks = pd.concat([stock, stock * 2], axis=1, keys=['a', 'b'])
+    rolling_beta = pyinv.RollingBetaRegression(market, stocks, 20)
+    assert isinstance(rolling_beta.data, pd.DataFrame)
+    assert list(rolling_beta.data.columns) == ['a', 'b']
+    single = pyinv.RollingBetaRegression(market, stock, 20)
+    np.testing.assert_allclose(rolling_beta.data['a'], single.data, equal_nan=True)
+    np.testing.assert_allclose(rolling_beta.data['b'], single.data * 2, equal_nan=True)
+
+
+def test_rolling_beta_dataframe_with_gap():
+    market, stock = _returns()
+    stocks = pd.concat([stock, stock * 2], axis=1, keys=['a', 'b'])
+    stocks.iloc[100:105, 1] = np.nan
+    rolling_beta = pyinv.RollingBetaRegression(market, stocks, 20)
+
+    assert rolling_beta.data.index.equals(market.index)
+    single = pyinv.RollingBetaRegression(market, stock, 20)
+    np.testing.assert_allclose(rolling_beta.data['a'], single.data, equal_nan=True)
+    gap = rolling_beta.data['b'].iloc[100:125]
+    assert gap.isna().all()
+    np.testing.assert_allclose(rolling_beta.data['b'].drop(gap.index), single.data.drop(gap.index) * 2,
+                               equal_nan=True)
+    assert rolling_beta.data['b'].iloc[125:].notna().all()
+
+
+def test_rolling_beta_non_int_window():
+    market, stock = _returns()
+    with pytest.raises(AssertionError) as excinfo:
+        pyinv.RollingBetaRegression(market, stock, 1.3)
+    assert "window must be possitive integer" in str(excinfo.value)
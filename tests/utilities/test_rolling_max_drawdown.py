@@ -0,0 +1,42 @@
+import pandas as pd
+import numpy as np
+import pytest
+
+import pyinvestingsnippets as pyinv
+
+from ..test_utils import TestUtlis as tu
+
+
+def _naive_max_drawdown(x):
+    return (x / np.maximum.accumulate(x) - 1).min()
+
+
+def test_rolling_max_drawdown_series():
+    wealth_index = tu.get_prices()
+    rolling_dd = pyinv.RollingMaxDrawdown(wealth_index, rolling_window=30)
+    assert isinstance(rolling_dd.data, pd.Series)
+    assert rolling_dd.data[:29].isna().all()
+    assert (rolling_dd.data.dropna() <= 0).all()
+    expected = wealth_index.rolling(30).apply(_naive_max_drawdown, raw=True)
+    pd.testing.assert_series_equal(rolling_dd.data, expected)
+
+
+@pytest.mark.parametrize("rolling_window", [1, 7, 100, 299, 300, 301])
+def test_rolling_max_drawdown_dataframe(rolling_window):
+    wealth_index = tu.get_prices(columns=['a', 'b'])
+    wealth_index.iloc[:10, 1] = np.nan
+    rolling_dd = pyinv.RollingMaxDrawdown(wealth_index, rolling_window=rolling_window)
+    expected = wealth_index.rolling(rolling_window).apply(_naive_max_drawdown, raw=True)
+    pd.testing.assert_frame_equal(rolling_dd.data, expected)
+
+
+def test_rolling_max_drawdown_whole_history():
+    wealth_index = tu.get_prices()
+    rolling_dd = pyinv.RollingMaxDrawdown(wealth_index, rolling_window=wealth_index.shape[0])
+    assert rolling_dd.data.iloc[-1] == pytest.approx(wealth_index.drawdown.max_drawdown)
+
+
+def test_rolling_max_drawdown_negative_window():
+    with pytest.raises(AssertionError) as excinfo:
+        pyinv.RollingMaxDrawdown(tu.get_prices(), rolling_window=-1)
+    assert "rolling_window must be possitive integer" in str(excinfo.value)
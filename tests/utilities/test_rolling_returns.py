@@ -41,3 +41,38 @@ def test_rolling_returns_non_int_windows():
     with pytest.raises(AssertionError) as excinfo:
         pyinv.RollingVolatility(returns, rolling_window=1.3)
     assert "rolling_window must be possitive integer" in str(excinfo.value)
+
+
+def _legacy_rolling_returns(returns, window):
+    return (1 + returns).rolling(window=window).apply(np.prod, raw=True) - 1
+
+
+def test_rolling_returns_match_rolling_product():
+    number_of_values = 30*3
+    index_range = pd.date_range(start=datetime(2000, 1, 1), periods=number_of_values, freq='D')
+    values = tu.get_truncated_normal(mean=0, sd=2, low=-0.90, upp=0.90)
+    returns = pd.Series(data=values.rvs(number_of_values), index=index_range)
+    returns.iloc[0] = np.nan
+    rolling_rets = pyinv.RollingReturns(returns, rolling_window=10)
+    pd.testing.assert_series_equal(rolling_rets.data, _legacy_rolling_returns(returns, 10))
+
+
+def test_rolling_returns_zero_and_total_loss():
+    index_range = pd.date_range(start=datetime(2000, 1, 1), periods=8, freq='D')
+    returns = pd.Series(data=[np.nan, 0.1, 0.0, -1.0, 0.2, -0.5, 0.0, 0.3], index=index_range)
+    rolling_rets = pyinv.RollingReturns(returns, rolling_window=3)
+    expected = _legacy_rolling_returns(returns, 3)
+    pd.testing.assert_series_equal(rolling_rets.data, expected)
+    assert (rolling_rets.data[3:6] == -1).all()
+
+
+def test_rolling_returns_dataframe():
+    number_of_values = 30*3
+    index_range = pd.date_range(start=datetime(2000, 1, 1), periods=number_of_values, freq='D')
+    values = tu.get_truncated_normal(mean=0, sd=2, low=-0.90, upp=0.90)
+    returns = pd.DataFrame(data=values.rvs((number_of_values, 3)), index=index_range,
+                           columns=['a', 'b', 'c'])
+    returns.iloc[:5, 1] = np.nan
+    rolling_rets = pyinv.RollingReturns(returns, rolling_window=10)
+    assert isinstance(rolling_rets.data, pd.DataFrame)
+    pd.testing.assert_frame_equal(rolling_rets.data, _legacy_rolling_returns(returns, 10))
@@ -0,0 +1,53 @@
+import pandas as pd
+import numpy as np
+import pytest
+
+import pyinvestingsnippets as pyinv
+
+from ..test_utils import TestUtlis as tu
+
+
+def _naive_sortino(x):
+    return x.mean() / np.sqrt((np.minimum(x, 0) ** 2).mean())
+
+
+def test_rolling_sharpe_series():
+    returns = tu.get_returns(400, mean=0.001)
+    rolling_sharpe = pyinv.RollingSharpe(returns, rolling_window=30, window=252)
+    assert isinstance(rolling_sharpe.data, pd.Series)
+    assert rolling_sharpe.data[:29].isna().all()
+    expected = returns.rolling(30).mean() / returns.rolling(30).std() * 252 ** 0.5
+    pd.testing.assert_series_equal(rolling_sharpe.data, expected)
+
+
+def test_rolling_sharpe_dataframe_with_risk_free_series():
+    returns = tu.get_returns(400, mean=0.001, columns=['a', 'b', 'c'])
+    returns.iloc[:15, 1] = np.nan
+    risk_free = pd.Series(np.linspace(0, 0.0002, returns.shape[0]), index=returns.index)
+    rolling_sharpe = pyinv.RollingSharpe(returns, rolling_window=50, window=12,
+                                         rf_per_period=risk_free)
+    excess = returns.sub(risk_free, axis=0)
+    expected = excess.rolling(50).mean() / excess.rolling(50).std() * 12 ** 0.5
+    pd.testing.assert_frame_equal(rolling_sharpe.data, expected)
+
+
+def test_rolling_sortino():
+    returns = tu.get_returns(400, mean=0.001, columns=['a', 'b'])
+    returns.iloc[100, 0] = np.nan
+    rolling_sortino = pyinv.RollingSortino(returns, rolling_window=40, rf_per_period=0.0001)
+    expected = (returns - 0.0001).rolling(40).apply(_naive_sortino, raw=True) * 252 ** 0.5
+    pd.testing.assert_frame_equal(rolling_sortino.data, expected)
+
+    series_sortino = pyinv.RollingSortino(returns['b'], rolling_window=40, rf_per_period=0.0001)
+    pd.testing.assert_series_equal(series_sortino.data, expected['b'])
+
+
+def test_rolling_ratios_wrong_windows():
+    returns = tu.get_returns(400, mean=0.001)
+    with pytest.raises(AssertionError) as excinfo:
+        pyinv.RollingSharpe(returns, rolling_window=1)
+    assert "rolling_window must be integer greater than 1" in str(excinfo.value)
+
+    with pytest.raises(AssertionError) as excinfo:
+        pyinv.RollingSortino(returns, rolling_window=10, window=1.5)
+    assert "window must be possitive integer" in str(excinfo.value)
@@ -0,0 +1,57 @@
+import pandas as pd
+import numpy as np
+import pytest
+from ..test_utils import TestUtlis as tu
+
+from pyinvestingsnippets import RollingSRRI, SRRI
+
+
+def _prices():
+    return tu.get_prices(8 * 260, ['a', 'b', 'c'], mean=0.0003, sd=0.01, low=-0.05, upp=0.05,
+                         freq='B')
+
+
+@pytest.mark.parametrize("frequency", ["W", "M"])
+def test_rolling_srri_matches_srri(frequency):
+    prices = _prices()
+    rolling = RollingSRRI(prices, frequency=frequency)
+    assert rolling.data.index.equals(prices.resample('M').last().index)
+    assert rolling.data.iloc[:4].isna().all().all()
+
+    periods = SRRI.PERIODS[frequency]
+    returns = prices.resample(frequency).last().pct_change()
+    for month_end in rolling.data.index[-30:]:
+        window = returns.loc[:month_end].iloc[-periods:]
+        expected = SRRI(window)
+        np.testing.assert_allclose(rolling.data.loc[month_end], expected.value, rtol=1e-8)
+        assert (rolling.risk_class.loc[month_end] == expected.risk_class).all()
+
+
+def test_rolling_srri_series():
+    prices = _prices()['a']
+    rolling = RollingSRRI(prices, frequency='M')
+    assert isinstance(rolling.data, pd.Series)
+    expected = SRRI.from_prices(prices, frequency='M')
+    np.testing.assert_allclose(rolling.data.iloc[-1], expected.value, rtol=1e-8)
+    assert rolling.risk_class.iloc[0] == 0
+
+
+@pytest.mark.parametrize("frequency", ["W", "M"])
+def test_rolling_srri_gap_month(frequency):
+    prices = _prices()
+    with_gap = prices[prices.index.to_period('M') != '2006-03']
+    rolling = RollingSRRI(with_gap, frequency=frequency)
+    assert rolling.data.index.equals(prices.resample('M').last().index)
+    assert rolling.data.loc['2005-06':].notna().all().all()
+
+    periods = SRRI.PERIODS[frequency]
+    returns = with_gap.resample(frequency).last().dropna(how='all').pct_change()
+    for month_end in rolling.data.loc['2005-06':'2008-06'].index:
+        expected = SRRI(returns.loc[:month_end].iloc[-periods:])
+        np.testing.assert_allclose(rolling.data.loc[month_end], expected.value, rtol=1e-8)
+
+
+def test_rolling_srri_validation():
+    with pytest.raises(AssertionError) as excinfo:
+        RollingSRRI(_prices(), frequency='D')
+    assert "frequency must be W or M" in str(excinfo.value)
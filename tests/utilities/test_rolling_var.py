@@ -0,0 +1,54 @@
+import pandas as pd
+import numpy as np
+import pytest
+
+import pyinvestingsnippets as pyinv
+
+from ..test_utils import TestUtlis as tu
+
+
+def _naive_var(x, percentile):
+    x = x[~np.isnan(x)]
+    return -np.percentile(x, percentile)
+
+
+def _naive_cvar(x, percentile):
+    x = x[~np.isnan(x)]
+    return -x[x <= np.percentile(x, percentile)].mean()
+
+
+def test_rolling_var_series():
+    returns = tu.get_returns()
+    rolling_var = pyinv.RollingVaR(returns, rolling_window=50, percentile=5)
+    assert isinstance(rolling_var.data, pd.Series)
+    assert rolling_var.data.name == returns.name
+    assert rolling_var.data[:49].isna().all()
+    expected = returns.rolling(50).apply(_naive_var, raw=True, args=(5,))
+    pd.testing.assert_series_equal(rolling_var.data, expected)
+    expected = returns.rolling(50).apply(_naive_cvar, raw=True, args=(5,))
+    pd.testing.assert_series_equal(rolling_var.cvar, expected)
+    assert (rolling_var.cvar.dropna() >= rolling_var.var.dropna()).all()
+
+
+def test_rolling_var_dataframe_with_missing_values_and_ties():
+    returns = tu.get_returns(columns=['a', 'b', 'c']).round(3)
+    returns.iloc[:20, 0] = np.nan
+    returns.iloc[::4, 1] = np.nan
+    rolling_var = pyinv.RollingVaR(returns, rolling_window=40, percentile=1, min_periods=10)
+    assert list(rolling_var.data.columns) == ['a', 'b', 'c']
+    rolling = returns.rolling(40, min_periods=10)
+    pd.testing.assert_frame_equal(rolling_var.data,
+                                  rolling.apply(_naive_var, raw=True, args=(1,)))
+    pd.testing.assert_frame_equal(rolling_var.cvar,
+                                  rolling.apply(_naive_cvar, raw=True, args=(1,)))
+
+
+def test_rolling_var_wrong_parameters():
+    returns = tu.get_returns()
+    with pytest.raises(AssertionError) as excinfo:
+        pyinv.RollingVaR(returns, rolling_window=0)
+    assert "rolling_window must be possitive integer" in str(excinfo.value)
+
+    with pytest.raises(AssertionError) as excinfo:
+        pyinv.RollingVaR(returns, rolling_window=10, percentile=101)
+    assert "percentile must be between 0 and 100" in str(excinfo.value)
@@ -0,0 +1,57 @@
+import pandas as pd
+import numpy as np
+import pytest
+
+from pyinvestingsnippets import SRRIMigration
+
+
+def _history():
+    index = pd.date_range(start='2010-01-31', periods=12, freq='M')
+    return pd.DataFrame({
+        # class 4, then 5 for 4 months: confirmed on the 4th
+        'confirmed': [np.nan, 0.07, 0.07, 0.12, 0.12, 0.12, 0.12, 0.12, 0.07, 0.07, 0.07, 0.07],
+        # back to class 4 after 3 months: never confirmed
+        'reverted': [0.07, 0.07, 0.12, 0.12, 0.12, 0.07, 0.12, 0.12, 0.12, 0.07, 0.07, 0.07],
+        # other classes each month, still a confirmed change
+        'wandering': [0.03, 0.07, 0.12, 0.07, 0.12, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03],
+        # a missing month breaks the streak
+        'missing': [0.07, 0.12, 0.12, np.nan, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12],
+    }, index=index)
+
+
+def test_migrations():
+    history = _history()
+    migration = SRRIMigration(history)
+
+    published = migration.data
+    assert published['confirmed'].tolist() == [0, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 4]
+    assert (published['reverted'] == 4).all()
+    assert published['wandering'].tolist() == [3] * 4 + [5] * 4 + [3] * 4
+    assert published['missing'].tolist() == [4] * 7 + [5] * 5
+
+    changes = migration.changes
+    assert changes.shape == (5, 6)
+    first = changes.iloc[0]
+    assert first['date'] == history.index[4] and first['fund'] == 'wandering'
+    assert first['since'] == history.index[1]
+    assert (first['previous_class'], first['risk_class'], first['value']) == (3, 5, 0.12)
+    rows = changes[['fund', 'previous_class', 'risk_class']].values.tolist()
+    assert rows == [['wandering', 3, 5], ['confirmed', 4, 5], ['missing', 4, 5],
+                    ['wandering', 5, 3], ['confirmed', 5, 4]]
+    assert (changes['date'].diff().dropna() >= pd.Timedelta(0)).all()
+
+
+def test_series_and_confirmation():
+    history = _history()
+    migration = SRRIMigration(history['reverted'], confirmation=3)
+    assert isinstance(migration.data, pd.Series)
+    assert migration.data.tolist() == [4] * 4 + [5] * 7 + [4]
+    assert migration.changes['fund'].tolist() == ['reverted', 'reverted']
+
+    assert SRRIMigration(history, confirmation=20).changes.empty
+
+
+def test_validation():
+    with pytest.raises(AssertionError) as excinfo:
+        SRRIMigration(_history(), confirmation=0)
+    assert "confirmation must be possitive integer" in str(excinfo.value)
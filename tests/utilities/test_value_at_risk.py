@@ -0,0 +1,60 @@
+import pandas as pd
+import numpy as np
+
+import pyinvestingsnippets as pyinv
+
+from ..test_utils import TestUtlis as tu
+
+
+def test_var_cvar_per_column_and_level():
+    returns = tu.get_returns(500, ['a', 'b', 'c'])
+    tail_risk = pyinv.ValueAtRisk(returns, percentiles=[1, 2.5, 5])
+    assert tail_risk.var.shape == (3, 3)
+    assert list(tail_risk.var.index) == ['a', 'b', 'c']
+    assert list(tail_risk.var.columns) == [1, 2.5, 5]
+    pd.testing.assert_frame_equal(tail_risk.data, tail_risk.var)
+    for column in returns:
+        for percentile in [1, 2.5, 5]:
+            expected_var = -np.percentile(returns[column], percentile)
+            expected_cvar = -returns[column][returns[column] <= -expected_var].mean()
+            np.testing.assert_almost_equal(tail_risk.var.loc[column, percentile], expected_var)
+            np.testing.assert_almost_equal(tail_risk.cvar.loc[column, percentile], expected_cvar)
+
+
+def test_var_cvar_skips_missing_values():
+    returns = tu.get_returns(500, ['a', 'b', 'c'])
+    returns.iloc[:50, 0] = np.nan
+    returns.iloc[::7, 1] = np.nan
+    returns.iloc[:, 2] = np.nan
+    tail_risk = pyinv.ValueAtRisk(returns, percentiles=5)
+    for column in ['a', 'b']:
+        clean = returns[column].dropna()
+        np.testing.assert_almost_equal(tail_risk.var.loc[column, 5], -np.percentile(clean, 5))
+        np.testing.assert_almost_equal(tail_risk.cvar.loc[column, 5],
+                                       -clean[clean <= np.percentile(clean, 5)].mean())
+    assert tail_risk.var.loc['c'].isna().all()
+
+
+def test_returns_var_on_dataframe_is_per_column():
+    prices = tu.get_prices(500, ['a', 'b', 'c'])
+    rets = prices.returns
+    var = rets.var()
+    assert isinstance(var, pd.Series)
+    for column in prices:
+        np.testing.assert_almost_equal(var[column], prices[column].returns.var())
+        np.testing.assert_almost_equal(rets.cvar()[column], prices[column].returns.cvar())
+    table = rets.var([1, 5])
+    assert table.shape == (3, 2)
+    np.testing.assert_almost_equal(table.loc['b', 1], prices['b'].returns.var(1))
+
+
+def test_returns_var_series_matches_dataframe_with_missing_values():
+    prices = tu.get_prices(500, ['a', 'b', 'c'])
+    prices.iloc[:50, 0] = np.nan
+    rets = prices.returns
+    assert not np.isnan(prices['a'].returns.var())
+    for column in prices:
+        np.testing.assert_almost_equal(prices[column].returns.var(), rets.var()[column])
+        np.testing.assert_almost_equal(prices[column].returns.cvar(), rets.cvar()[column])
+        np.testing.assert_almost_equal(prices[column].returns.var([1, 5]),
+                                       rets.var([1, 5]).loc[column])